@@ -14,3 +14,6 @@ class ModelWithFilesSerializer(
     class Meta:
         model = models.ModelWithFiles
         fields = "__all__"
+        list_serializer_class = (
+            saritasa_s3_tools.django.S3UploadURLListSerializer
+        )
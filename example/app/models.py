@@ -72,6 +72,8 @@ class ModelWithFiles(models.Model):
         ),
     )
 
+    objects = saritasa_s3_tools.django.S3Manager()
+
     def __str__(self) -> str:
         """Return string representation."""
         return f"{self.pk}"
@@ -20,9 +20,11 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
+    "rest_framework.authtoken",
     "drf_spectacular",
     "django_probes",
     "django_extensions",
+    "saritasa_s3_tools.django",
     "example.app",
 ]
 
@@ -102,6 +104,11 @@ STATICFILES_FINDERS = (
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_AUTHENTICATION_CLASSES": (
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+        "rest_framework.authentication.TokenAuthentication",
+    ),
 }
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
@@ -20,6 +20,13 @@ urlpatterns = [
         include("saritasa_s3_tools.django.urls"),
         name="saritasa-s3-tools",
     ),
+    path(
+        "s3-async/",
+        include(
+            ("saritasa_s3_tools.django.async_urls", "s3-async"),
+            namespace="s3-async",
+        ),
+    ),
     *static(
         settings.STATIC_URL,
         document_root=settings.STATIC_ROOT,
@@ -1,6 +1,14 @@
 import contextlib
 
-from . import constants, keys
+from . import (
+    compression,
+    constants,
+    disk_cache,
+    keys,
+    metadata_cache,
+    single_flight,
+    sync,
+)
 from .client import S3Client
 from .configs import S3FileTypeConfig
 
@@ -17,8 +25,13 @@ __all__ = (
     "AsyncS3Client",
     "S3Client",
     "S3FileTypeConfig",
+    "compression",
     "constants",
+    "disk_cache",
     "factory",
     "keys",
+    "metadata_cache",
+    "single_flight",
+    "sync",
     "testing",
 )
@@ -1 +1,6 @@
+import contextlib
+
 from .client import AsyncS3Client
+
+with contextlib.suppress(ImportError):
+    from .transport import AsyncS3Transport
@@ -1,19 +1,149 @@
 import collections.abc
-import functools
+import contextlib
+import dataclasses
+import datetime
+import io
+import itertools
+import threading
+import time
 import typing
 
 import anyio
+import anyio.streams.memory
 
+import boto3.s3.transfer
+import botocore
+import botocore.credentials
+import botocore.exceptions
+import mypy_boto3_s3
 import mypy_boto3_s3.type_defs
 
-from .. import client, configs
+from .. import (
+    client,
+    compression,
+    configs,
+    disk_cache,
+    keys,
+    metadata_cache,
+    sync,
+)
+from . import single_flight
+
+if typing.TYPE_CHECKING:
+    from . import transport
 
 ReturnT = typing.TypeVar("ReturnT")
 ParamT = typing.ParamSpec("ParamT")
 
 
+def can_sign_in_event_loop(boto3_client: mypy_boto3_s3.S3Client) -> bool:
+    """Check that requests can be signed without blocking I/O.
+
+    Refreshable credentials (like ones of assumed roles or instance
+    profiles) are refreshed by botocore with blocking requests on signing,
+    once they are about to expire.
+
+    """
+    credentials = boto3_client._get_credentials()  # type: ignore
+    return not (
+        isinstance(credentials, botocore.credentials.RefreshableCredentials)
+        and credentials.refresh_needed()
+    )
+
+
+def unwrap_exception_group(error: BaseException) -> BaseException:
+    """Get error from exception groups which contain only this error."""
+    while isinstance(error, BaseExceptionGroup) and len(error.exceptions) == 1:
+        error = error.exceptions[0]
+    return error
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncS3ClientThreadStats:
+    """Statistics of worker threads used by AsyncS3Client."""
+
+    # Max amount of calls which can be run in threads at once
+    total_tokens: float
+    # Amount of calls which are run in threads right now
+    borrowed_tokens: int
+    # Amount of calls which are waiting for free thread
+    tasks_waiting: int
+    # Amount of calls which were run in threads
+    calls: int
+    # Total and max time calls were waiting for free thread (in seconds)
+    total_wait_time: float
+    max_wait_time: float
+
+
+@dataclasses.dataclass(frozen=True)
+class S3BatchResult[ValueT]:
+    """Result of operation for one key of batch operation."""
+
+    key: str
+    # Result of operation, None if it failed
+    value: ValueT | None = None
+    # Error of operation, None if it succeeded
+    error: Exception | None = None
+
+
+type S3BatchResults[ValueT] = contextlib.AbstractAsyncContextManager[
+    anyio.streams.memory.MemoryObjectReceiveStream[S3BatchResult[ValueT]]
+]
+
+
 class AsyncS3Client(client.S3Client):
-    """Async Client for interacting with s3 based on boto3 client."""
+    """Async Client for interacting with s3 based on boto3 client.
+
+    By default calls of boto3 client are run in worker threads. If
+    `transport` is set, requests which don't need boto3's managed transfers
+    are sent natively from event loop. Use client as async context manager
+    to close transport's connections on exit.
+
+    """
+
+    def __init__(
+        self,
+        boto3_client: mypy_boto3_s3.S3Client,
+        default_bucket: str,
+        default_download_expiration: int = 3600,
+        disk_cache: disk_cache.S3DiskCache | None = None,
+        transport: "transport.AsyncS3Transport | None" = None,
+        thread_limiter: anyio.CapacityLimiter | int | None = None,
+        coalesce_reads: bool = False,
+        metadata_cache: metadata_cache.S3MetadataCache | None = None,
+    ) -> None:
+        super().__init__(
+            boto3_client=boto3_client,
+            default_bucket=default_bucket,
+            default_download_expiration=default_download_expiration,
+            disk_cache=disk_cache,
+            coalesce_reads=coalesce_reads,
+            metadata_cache=metadata_cache,
+        )
+        # Merge identical concurrent reads of tasks, so that they don't even
+        # have to wait for worker threads
+        self.async_single_flight: (
+            single_flight.AsyncSingleFlight[typing.Any] | None
+        ) = single_flight.AsyncSingleFlight() if coalesce_reads else None
+        self.transport = transport
+        # Limiter of worker threads, None - anyio's default limiter, which
+        # is shared with all other `to_thread` calls of app
+        if isinstance(thread_limiter, int):
+            thread_limiter = anyio.CapacityLimiter(thread_limiter)
+        self.thread_limiter = thread_limiter
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    async def __aenter__(self) -> typing.Self:
+        """Enter context."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close connections of transport on exit."""
+        if self.transport:
+            await self.transport.aclose()
 
     async def run_sync_as_async(
         self,
@@ -22,10 +152,44 @@ class AsyncS3Client(client.S3Client):
         **kwargs: ParamT.kwargs,
     ) -> ReturnT:
         """Make sync function run in async env."""
-        return await anyio.to_thread.run_sync(  # type: ignore
-            functools.partial(func, *args, **kwargs),
+        called_at = time.monotonic()
+
+        def _run() -> ReturnT:
+            self._record_wait_time(time.monotonic() - called_at)
+            return func(*args, **kwargs)
+
+        return await anyio.to_thread.run_sync(
+            _run,
+            limiter=self.thread_limiter,
         )
 
+    def _record_wait_time(self, wait_time: float) -> None:
+        """Record how long call was waiting for free thread."""
+        with self._stats_lock:
+            self._calls += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def get_thread_stats(self) -> AsyncS3ClientThreadStats:
+        """Get live statistics of worker threads used by client.
+
+        Should be called within event loop.
+
+        """
+        limiter_stats = (
+            self.thread_limiter
+            or anyio.to_thread.current_default_thread_limiter()
+        ).statistics()
+        with self._stats_lock:
+            return AsyncS3ClientThreadStats(
+                total_tokens=limiter_stats.total_tokens,
+                borrowed_tokens=limiter_stats.borrowed_tokens,
+                tasks_waiting=limiter_stats.tasks_waiting,
+                calls=self._calls,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
     async def async_generate_params(
         self,
         filename: str,
@@ -35,7 +199,22 @@ class AsyncS3Client(client.S3Client):
         upload_folder: str = "",
         extra_metadata: dict[str, str] | None = None,
     ) -> client.S3UploadParams:
-        """Generate params for s3 upload in async env."""
+        """Generate params for s3 upload in async env.
+
+        Presigning is pure CPU work, which takes less time than hop to
+        worker thread, so params are generated right in event loop, unless
+        credentials have to be refreshed (see `can_sign_in_event_loop`).
+
+        """
+        if can_sign_in_event_loop(self.boto3_client):
+            return self.generate_params(
+                filename=filename,
+                upload_folder=upload_folder,
+                config=config,
+                bucket=bucket,
+                content_type=content_type,
+                extra_metadata=extra_metadata,
+            )
         return await self.run_sync_as_async(
             self.generate_params,
             filename=filename,
@@ -53,7 +232,31 @@ class AsyncS3Client(client.S3Client):
         file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
         bucket: str = "",
     ) -> str:
-        """Upload file to s3 in async env."""
+        """Upload file to s3 in async env.
+
+        With `transport`, small seekable files are uploaded with single
+        native request. Compressed, content-addressed and large files are
+        uploaded by boto3 in worker thread.
+
+        """
+        if (
+            self.transport
+            and (
+                content := await self._async_read_small_file(
+                    config=config,
+                    file_obj=file_obj,
+                )
+            )
+            is not None
+        ):
+            key = config.key(filename=filename)
+            await self.transport.request(
+                "PutObject",
+                {"Bucket": bucket or self.default_bucket, "Key": key},
+                content=content,
+            )
+            await self.async_invalidate_metadata(keys=(key,), bucket=bucket)
+            return key
         return await self.run_sync_as_async(
             self.upload_file,
             filename=filename,
@@ -62,43 +265,364 @@ class AsyncS3Client(client.S3Client):
             file_obj=file_obj,
         )
 
+    async def _async_read_small_file(
+        self,
+        config: configs.S3FileTypeConfig,
+        file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
+    ) -> bytes | None:
+        """Read file which can be uploaded with single request.
+
+        Files are read in worker thread, so that reading of up to
+        `multipart_threshold` bytes doesn't block event loop. In-memory
+        files are read right away.
+
+        """
+        if isinstance(file_obj, io.BytesIO):
+            return self._read_small_file(config=config, file_obj=file_obj)
+        return await self.run_sync_as_async(
+            self._read_small_file,
+            config=config,
+            file_obj=file_obj,
+        )
+
+    def _read_small_file(
+        self,
+        config: configs.S3FileTypeConfig,
+        file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
+    ) -> bytes | None:
+        """Read file which can be uploaded with single request.
+
+        Return None if file should be uploaded by boto3.
+
+        """
+        if (
+            config.content_encoding
+            or isinstance(config.key, keys.WithPrefixContentHashFileName)
+            or not getattr(file_obj, "seekable", lambda: False)()
+        ):
+            return None
+        position = file_obj.tell()  # type: ignore
+        size = file_obj.seek(0, 2) - position  # type: ignore
+        file_obj.seek(position)  # type: ignore
+        if size >= boto3.s3.transfer.TransferConfig().multipart_threshold:
+            return None
+        return file_obj.read()  # type: ignore
+
     async def async_download_file(
         self,
         key: str,
         file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
         bucket: str = "",
+        decompress: bool = False,
     ) -> mypy_boto3_s3.type_defs.FileobjTypeDef:
-        """Download file from s3 in async env."""
+        """Download file from s3 in async env.
+
+        With `transport` (and without `disk_cache`) file is streamed
+        natively, `Content-Encoding` is taken from response, so no extra
+        HEAD request is needed to decompress file.
+
+        """
+        if self.transport and not self.disk_cache:
+            async with self.transport.stream(
+                "GetObject",
+                {"Bucket": bucket or self.default_bucket, "Key": key},
+            ) as (response, chunks):
+                content_encoding = response.get("ContentEncoding")
+                target: typing.Any = file_obj
+                if decompress and compression.is_supported_content_encoding(
+                    content_encoding,
+                ):
+                    target = compression.DecompressingWriter(
+                        file_obj=file_obj,
+                        content_encoding=str(content_encoding),
+                    )
+                async for chunk in chunks:
+                    target.write(chunk)
+                if isinstance(target, compression.DecompressingWriter):
+                    target.finish()
+            return file_obj
         return await self.run_sync_as_async(
             self.download_file,
             file_obj=file_obj,
             bucket=bucket,
             key=key,
+            decompress=decompress,
         )
 
-    async def async_get_file_metadata(
+    async def async_upload_stream(
+        self,
+        filename: str,
+        config: configs.S3FileTypeConfig,
+        chunks: collections.abc.AsyncIterable[bytes],
+        bucket: str = "",
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> str:
+        """Upload content of async stream to s3 with multipart upload.
+
+        Stream is split into parts of `part_size`, up to `max_concurrency`
+        parts are uploaded at once, so at most `max_concurrency + 1` parts
+        are kept in memory. If config has `content_encoding`, stream is
+        compressed on the fly.
+
+        On error or cancellation multipart upload is aborted, so s3 doesn't
+        keep uploaded parts. Single error of parts' upload or stream is
+        raised as is, not wrapped into exception group.
+
+        """
+        if isinstance(config.key, keys.WithPrefixContentHashFileName):
+            raise ValueError(  # noqa: TRY004
+                "Content hash of stream is unknown before upload, "
+                "use `async_upload_file` instead",
+            )
+        if part_size < sync.min_part_size:
+            raise ValueError(
+                f"Part size should be at least {sync.min_part_size} bytes",
+            )
+        key = config.key(filename=filename)
+        params: dict[str, typing.Any] = {
+            "Bucket": bucket or self.default_bucket,
+            "Key": key,
+        }
+        response = await self._request(
+            "CreateMultipartUpload",
+            (
+                {**params, "ContentEncoding": config.content_encoding}
+                if config.content_encoding
+                else params
+            ),
+        )
+        params["UploadId"] = response["UploadId"]
+        try:
+            parts = await self._upload_parts(
+                params=params,
+                parts=self._iter_parts(
+                    chunks=chunks,
+                    config=config,
+                    part_size=part_size,
+                ),
+                max_concurrency=max_concurrency,
+            )
+            await self._request(
+                "CompleteMultipartUpload",
+                {**params, "MultipartUpload": {"Parts": parts}},
+            )
+            await self.async_invalidate_metadata(keys=(key,), bucket=bucket)
+        except BaseException as error:
+            # Keep original error if abort fails
+            with (
+                anyio.CancelScope(shield=True),
+                contextlib.suppress(Exception),
+            ):
+                await self._request("AbortMultipartUpload", params)
+            original_error = unwrap_exception_group(error)
+            if original_error is error:
+                raise
+            raise original_error from original_error.__cause__
+        return key
+
+    async def _iter_parts(
+        self,
+        chunks: collections.abc.AsyncIterable[bytes],
+        config: configs.S3FileTypeConfig,
+        part_size: int,
+    ) -> collections.abc.AsyncIterator[bytes]:
+        """Split stream into parts for multipart upload.
+
+        At least one part is yielded, even if stream is empty.
+
+        """
+        compressor = (
+            compression.get_compressor(
+                content_encoding=config.content_encoding,
+                level=config.compression_level,
+            )
+            if config.content_encoding
+            else None
+        )
+        buffer = bytearray()
+        is_empty = True
+        async for chunk in chunks:
+            buffer += compressor.compress(chunk) if compressor else chunk
+            while len(buffer) >= part_size:
+                yield bytes(buffer[:part_size])
+                del buffer[:part_size]
+                is_empty = False
+        if compressor:
+            buffer += compressor.flush()
+        if buffer or is_empty:
+            yield bytes(buffer)
+
+    async def _upload_parts(
+        self,
+        params: dict[str, typing.Any],
+        parts: collections.abc.AsyncIterator[bytes],
+        max_concurrency: int,
+    ) -> list[mypy_boto3_s3.type_defs.CompletedPartTypeDef]:
+        """Upload parts of multipart upload concurrently."""
+        etags: dict[int, str] = {}
+        semaphore = anyio.Semaphore(max_concurrency)
+
+        async def _upload_part(part_number: int, content: bytes) -> None:
+            try:
+                response = await self._request(
+                    "UploadPart",
+                    {**params, "PartNumber": part_number},
+                    content=content,
+                )
+                etags[part_number] = response["ETag"]
+            finally:
+                semaphore.release()
+
+        async with anyio.create_task_group() as task_group:
+            part_number = 0
+            async for content in parts:
+                part_number += 1
+                if part_number > sync.max_parts:
+                    raise ValueError(
+                        f"Stream doesn't fit into {sync.max_parts} parts, "
+                        "increase `part_size`",
+                    )
+                await semaphore.acquire()
+                task_group.start_soon(_upload_part, part_number, content)
+        return [
+            {"ETag": etag, "PartNumber": part_number}
+            for part_number, etag in sorted(etags.items())
+        ]
+
+    async def _request(
+        self,
+        operation_name: str,
+        params: dict[str, typing.Any],
+        content: bytes | None = None,
+    ) -> dict[str, typing.Any]:
+        """Perform s3 operation via transport or boto3 in worker thread."""
+        if self.transport:
+            return await self.transport.request(
+                operation_name,
+                params,
+                content=content,
+            )
+        if content is not None:
+            params = {**params, "Body": content}
+        return await self.run_sync_as_async(
+            getattr(self.boto3_client, botocore.xform_name(operation_name)),
+            **params,
+        )
+
+    async def async_download_bytes(
         self,
         key: str,
         bucket: str = "",
-    ) -> mypy_boto3_s3.type_defs.HeadObjectOutputTypeDef:
-        """Get file's metadata in async env."""
+        decompress: bool = False,
+    ) -> bytes:
+        """Download file's content from s3 into memory in async env.
+
+        Should be used only for small files. If `coalesce_reads` is
+        enabled, concurrent downloads of same file share one request.
+
+        """
+        bucket = bucket or self.default_bucket
+
+        async def _download() -> bytes:
+            file_obj = io.BytesIO()
+            await self.async_download_file(
+                key=key,
+                file_obj=file_obj,
+                bucket=bucket,
+                decompress=decompress,
+            )
+            return file_obj.getvalue()
+
+        if self.async_single_flight:
+            return await self.async_single_flight.run(
+                ("GetObject", bucket, key, decompress),
+                _download,
+            )
+        return await _download()
+
+    async def async_download_file_if_changed(
+        self,
+        key: str,
+        file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
+        etag: str = "",
+        modified_since: datetime.datetime | None = None,
+        bucket: str = "",
+        decompress: bool = False,
+    ) -> client.S3ConditionalReadResult:
+        """Download file from s3 only if it was changed in async env."""
         return await self.run_sync_as_async(
-            self.get_file_metadata,
-            bucket=bucket,
+            self.download_file_if_changed,
             key=key,
+            file_obj=file_obj,
+            etag=etag,
+            modified_since=modified_since,
+            bucket=bucket,
+            decompress=decompress,
         )
 
+    async def async_get_file_metadata(
+        self,
+        key: str,
+        bucket: str = "",
+    ) -> metadata_cache.S3FileMetadata:
+        """Get file's metadata in async env.
+
+        If `coalesce_reads` is enabled, concurrent calls for same file share
+        one request.
+
+        """
+        bucket = bucket or self.default_bucket
+
+        async def _head() -> metadata_cache.S3FileMetadata:
+            # Shared cache is sync, so it's used via sync method
+            if self.transport and not self.metadata_cache:
+                return typing.cast(
+                    mypy_boto3_s3.type_defs.HeadObjectOutputTypeDef,
+                    await self.transport.request(
+                        "HeadObject",
+                        {"Bucket": bucket, "Key": key},
+                    ),
+                )
+            return await self.run_sync_as_async(
+                self.get_file_metadata,
+                bucket=bucket,
+                key=key,
+            )
+
+        if self.async_single_flight:
+            return await self.async_single_flight.run(
+                ("HeadObject", bucket, key),
+                _head,
+            )
+        return await _head()
+
     async def async_is_file_in_bucket(
         self,
         key: str,
         bucket: str = "",
     ) -> bool:
         """Check if file is in bucket in async env."""
-        return await self.run_sync_as_async(
-            self.is_file_in_bucket,
-            bucket=bucket,
-            key=key,
-        )
+        try:
+            await self.async_get_file_metadata(key=key, bucket=bucket)
+            return True
+        except botocore.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") == "404":
+                return False
+            raise  # pragma: no cover
+
+    async def async_invalidate_metadata(
+        self,
+        keys: collections.abc.Sequence[str],
+        bucket: str = "",
+    ) -> None:
+        """Remove metadata of files from `metadata_cache` in async env."""
+        if self.metadata_cache:
+            await self.run_sync_as_async(
+                self.invalidate_metadata,
+                keys=keys,
+                bucket=bucket,
+            )
 
     async def async_copy_object(
         self,
@@ -108,6 +632,19 @@ class AsyncS3Client(client.S3Client):
         source_bucket: str = "",
     ) -> None:
         """Copy file object from copy source to key path in async env."""
+        if self.transport:
+            await self.transport.request(
+                "CopyObject",
+                {
+                    "Bucket": bucket or self.default_bucket,
+                    "CopySource": (
+                        f"{source_bucket or self.default_bucket}/{source_key}"
+                    ),
+                    "Key": key,
+                },
+            )
+            await self.async_invalidate_metadata(keys=(key,), bucket=bucket)
+            return None
         return await self.run_sync_as_async(
             self.copy_object,
             key=key,
@@ -122,8 +659,217 @@ class AsyncS3Client(client.S3Client):
         bucket: str = "",
     ) -> None:
         """Delete file object from s3 bucket is async env."""
+        if self.transport:
+            await self.transport.request(
+                "DeleteObject",
+                {"Bucket": bucket or self.default_bucket, "Key": key},
+            )
+            await self.async_invalidate_metadata(keys=(key,), bucket=bucket)
+            return None
         return await self.run_sync_as_async(
             self.delete_object,
             key=key,
             bucket=bucket,
         )
+
+    def async_head_many(
+        self,
+        keys: collections.abc.Iterable[str],
+        bucket: str = "",
+        max_concurrency: int = 10,
+    ) -> S3BatchResults[metadata_cache.S3FileMetadata]:
+        """Get metadata of many files concurrently.
+
+        Results are streamed in order of completion, see `_stream_results`.
+
+        """
+
+        async def _head(
+            key: str,
+        ) -> list[S3BatchResult[metadata_cache.S3FileMetadata]]:
+            return [
+                await self._get_batch_result(
+                    key=key,
+                    operation=self.async_get_file_metadata(
+                        key=key,
+                        bucket=bucket,
+                    ),
+                ),
+            ]
+
+        return self._stream_results(
+            items=keys,
+            func=_head,
+            max_concurrency=max_concurrency,
+        )
+
+    def async_is_file_in_bucket_many(
+        self,
+        keys: collections.abc.Iterable[str],
+        bucket: str = "",
+        max_concurrency: int = 10,
+    ) -> S3BatchResults[bool]:
+        """Check if many files are in bucket concurrently.
+
+        Results are streamed in order of completion, see `_stream_results`.
+
+        """
+
+        async def _check(key: str) -> list[S3BatchResult[bool]]:
+            return [
+                await self._get_batch_result(
+                    key=key,
+                    operation=self.async_is_file_in_bucket(
+                        key=key,
+                        bucket=bucket,
+                    ),
+                ),
+            ]
+
+        return self._stream_results(
+            items=keys,
+            func=_check,
+            max_concurrency=max_concurrency,
+        )
+
+    def async_get_many(
+        self,
+        keys: collections.abc.Iterable[str],
+        bucket: str = "",
+        decompress: bool = False,
+        max_concurrency: int = 10,
+    ) -> S3BatchResults[bytes]:
+        """Download content of many files into memory concurrently.
+
+        Results are streamed in order of completion, see `_stream_results`.
+
+        """
+
+        async def _get(key: str) -> list[S3BatchResult[bytes]]:
+            return [
+                await self._get_batch_result(
+                    key=key,
+                    operation=self.async_download_bytes(
+                        key=key,
+                        bucket=bucket,
+                        decompress=decompress,
+                    ),
+                ),
+            ]
+
+        return self._stream_results(
+            items=keys,
+            func=_get,
+            max_concurrency=max_concurrency,
+        )
+
+    def async_delete_many(
+        self,
+        keys: collections.abc.Iterable[str],
+        bucket: str = "",
+        max_concurrency: int = 10,
+    ) -> S3BatchResults[None]:
+        """Delete many files concurrently.
+
+        Keys are deleted in batches with one `DeleteObjects` request per
+        batch. Results are streamed in order of completion, see
+        `_stream_results`.
+
+        """
+
+        async def _delete(
+            batch: tuple[str, ...],
+        ) -> list[S3BatchResult[None]]:
+            try:
+                errors = await self.run_sync_as_async(
+                    self.delete_objects,
+                    keys=batch,
+                    bucket=bucket,
+                )
+            except Exception as error:  # noqa: BLE001
+                return [S3BatchResult(key=key, error=error) for key in batch]
+            failed = {
+                error.get("Key", ""): botocore.exceptions.ClientError(
+                    {
+                        "Error": {
+                            "Code": error.get("Code", ""),
+                            "Message": error.get("Message", ""),
+                        },
+                    },
+                    "DeleteObjects",
+                )
+                for error in errors
+            }
+            return [
+                S3BatchResult(key=key, error=failed.get(key)) for key in batch
+            ]
+
+        return self._stream_results(
+            items=itertools.batched(keys, client.delete_objects_batch_size),
+            func=_delete,
+            max_concurrency=max_concurrency,
+        )
+
+    async def _get_batch_result[ValueT](
+        self,
+        key: str,
+        operation: collections.abc.Awaitable[ValueT],
+    ) -> S3BatchResult[ValueT]:
+        """Await operation for key and wrap its result or error."""
+        try:
+            return S3BatchResult(key=key, value=await operation)
+        except Exception as error:  # noqa: BLE001
+            return S3BatchResult(key=key, error=error)
+
+    @contextlib.asynccontextmanager
+    async def _stream_results[ItemT, ValueT](
+        self,
+        items: collections.abc.Iterable[ItemT],
+        func: collections.abc.Callable[
+            [ItemT],
+            collections.abc.Awaitable[list[S3BatchResult[ValueT]]],
+        ],
+        max_concurrency: int,
+    ) -> collections.abc.AsyncIterator[
+        anyio.streams.memory.MemoryObjectReceiveStream[S3BatchResult[ValueT]]
+    ]:
+        """Run func for items concurrently and stream its results.
+
+        At most `max_concurrency` items are processed at once and items are
+        taken from iterable only when there is free slot, so huge iterables
+        are not loaded into memory. Errors of operations are returned as
+        results, so one failed key doesn't stop the rest. If consumer
+        leaves context early, pending operations are cancelled.
+
+        """
+        send_stream, receive_stream = anyio.create_memory_object_stream[
+            S3BatchResult[ValueT]
+        ](max_buffer_size=max_concurrency)
+        semaphore = anyio.Semaphore(max_concurrency)
+
+        async def _process(item: ItemT) -> None:
+            try:
+                for result in await func(item):
+                    await send_stream.send(result)
+            finally:
+                semaphore.release()
+
+        async def _produce() -> None:
+            async with send_stream, anyio.create_task_group() as task_group:
+                for item in items:
+                    await semaphore.acquire()
+                    task_group.start_soon(_process, item)
+
+        consumer_error: BaseException | None = None
+        with receive_stream:
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(_produce)
+                try:
+                    yield receive_stream
+                except BaseException as error:  # noqa: BLE001
+                    # Re-raised below, so that it's not wrapped into group
+                    consumer_error = error
+                finally:
+                    task_group.cancel_scope.cancel()
+        if consumer_error:
+            raise consumer_error
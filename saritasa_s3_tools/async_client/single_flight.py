@@ -0,0 +1,56 @@
+import collections.abc
+import dataclasses
+import typing
+
+import anyio
+
+
+@dataclasses.dataclass
+class AsyncSingleFlightCall[ResultT]:
+    """Representation of running call."""
+
+    done: anyio.Event = dataclasses.field(default_factory=anyio.Event)
+    result: ResultT | None = None
+    error: BaseException | None = None
+
+
+class AsyncSingleFlight[ResultT]:
+    """Merge identical concurrent calls into one in async env.
+
+    First caller of key runs function, callers which come while it's
+    running wait for it and share its result or error. Result is shared,
+    so it shouldn't be mutated. If first caller is cancelled, waiters don't
+    get cancelled, instead one of them repeats the call.
+
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[
+            collections.abc.Hashable,
+            AsyncSingleFlightCall[ResultT],
+        ] = {}
+
+    async def run(
+        self,
+        key: collections.abc.Hashable,
+        func: collections.abc.Callable[[], collections.abc.Awaitable[ResultT]],
+    ) -> ResultT:
+        """Run function or wait for result of running call with same key."""
+        while (call := self._calls.get(key)) is not None:
+            await call.done.wait()
+            if isinstance(call.error, anyio.get_cancelled_exc_class()):
+                continue
+            if call.error:
+                raise call.error
+            return typing.cast(ResultT, call.result)
+        call = AsyncSingleFlightCall()
+        self._calls[key] = call
+        try:
+            call.result = await func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,246 @@
+import collections.abc
+import contextlib
+import functools
+import typing
+
+import anyio
+import httpx2
+
+import botocore
+import botocore.awsrequest
+import botocore.exceptions
+import botocore.parsers
+import botocore.serialize
+import mypy_boto3_s3
+
+from . import client
+
+# Status codes of s3 responses which are safe to retry
+retryable_status_codes = frozenset((500, 502, 503, 504))
+# Size of chunk in which response's content is streamed
+default_chunk_size = 64 * 1024
+
+
+class AsyncS3Transport:
+    """Native async transport for s3 requests.
+
+    Requests are signed locally via boto3 client's presigned urls (which
+    involves no I/O) and sent with pooled `httpx2.AsyncClient` right from
+    event loop, so they don't have to wait for free worker thread. If
+    credentials have to be refreshed, requests are signed in worker thread
+    (limited by `thread_limiter`).
+
+    Use it as async context manager or call `aclose` to close connections.
+
+    """
+
+    def __init__(
+        self,
+        boto3_client: mypy_boto3_s3.S3Client,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 60,
+        max_attempts: int = 3,
+        retry_delay: float = 0.1,
+        expires_in: int = 300,
+        thread_limiter: anyio.CapacityLimiter | None = None,
+    ) -> None:
+        self.boto3_client = boto3_client
+        # Limiter of worker threads, None - anyio's default limiter
+        self.thread_limiter = thread_limiter
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        # How long signature of request is valid (in seconds)
+        self.expires_in = expires_in
+        self.http_client = httpx2.AsyncClient(
+            limits=httpx2.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+        )
+        protocol = boto3_client.meta.service_model.protocol
+        self._serializer = botocore.serialize.create_serializer(
+            protocol,
+            include_validation=False,
+        )
+        self._parser = botocore.parsers.create_parser(protocol)
+
+    async def __aenter__(self) -> typing.Self:
+        """Enter context."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close connections on exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self.http_client.aclose()
+
+    def build_request(
+        self,
+        operation_name: str,
+        params: dict[str, typing.Any],
+        content: bytes | None = None,
+    ) -> httpx2.Request:
+        """Build signed request for s3 operation.
+
+        boto3 handlers adjust params (like quoting of `CopySource`), so
+        they are applied to params before headers are serialized, to make
+        headers match signed ones. Payload isn't signed, so if `content` is
+        not set, it's serialized from params (like parts of
+        `CompleteMultipartUpload`).
+
+        """
+        operation_model = self.boto3_client.meta.service_model.operation_model(
+            operation_name,
+        )
+        payload = operation_model.input_shape.serialization.get(  # type: ignore
+            "payload",
+        )
+        url = self.boto3_client.generate_presigned_url(
+            ClientMethod=botocore.xform_name(operation_name),
+            Params={
+                name: value
+                for name, value in params.items()
+                if name != payload
+            },
+            ExpiresIn=self.expires_in,
+        )
+        params = dict(params)
+        self.boto3_client.meta.events.emit(
+            f"before-parameter-build.s3.{operation_name}",
+            params=params,
+            model=operation_model,
+            context={},
+        )
+        request_dict = self._serializer.serialize_to_request(
+            params,
+            operation_model,
+        )
+        return self.http_client.build_request(
+            method=request_dict["method"],
+            url=url,
+            headers=request_dict["headers"],
+            content=(
+                content
+                if content is not None
+                else request_dict["body"] or None
+            ),
+        )
+
+    async def send(
+        self,
+        operation_name: str,
+        params: dict[str, typing.Any],
+        content: bytes | None = None,
+        stream: bool = False,
+    ) -> httpx2.Response:
+        """Send request, retry on connection and server errors."""
+        build_request = functools.partial(
+            self.build_request,
+            operation_name=operation_name,
+            params=params,
+            content=content,
+        )
+        request = (
+            build_request()
+            if client.can_sign_in_event_loop(self.boto3_client)
+            else await anyio.to_thread.run_sync(
+                build_request,
+                limiter=self.thread_limiter,
+            )
+        )
+        for attempt in range(self.max_attempts - 1):
+            try:
+                response = await self.http_client.send(request, stream=stream)
+            except httpx2.TransportError:
+                pass
+            else:
+                if response.status_code not in retryable_status_codes:
+                    return response
+                await response.aclose()
+            await anyio.sleep(self.retry_delay * 2**attempt)
+        return await self.http_client.send(request, stream=stream)
+
+    def parse_response(
+        self,
+        operation_name: str,
+        response: httpx2.Response,
+        body: bytes = b"",
+    ) -> dict[str, typing.Any]:
+        """Parse s3 response, raise `ClientError` for error responses."""
+        operation_model = self.boto3_client.meta.service_model.operation_model(
+            operation_name,
+        )
+        parsed = self._parser.parse(
+            {
+                "status_code": response.status_code,
+                "headers": botocore.awsrequest.HeadersDict(
+                    response.headers.items(),
+                ),
+                "body": body,
+            },
+            operation_model.output_shape,  # type: ignore
+        )
+        if response.status_code >= 300:
+            raise botocore.exceptions.ClientError(
+                parsed,  # type: ignore
+                operation_name,
+            )
+        return parsed
+
+    async def request(
+        self,
+        operation_name: str,
+        params: dict[str, typing.Any],
+        content: bytes | None = None,
+    ) -> dict[str, typing.Any]:
+        """Perform s3 operation and return parsed response."""
+        response = await self.send(
+            operation_name=operation_name,
+            params=params,
+            content=content,
+        )
+        return self.parse_response(
+            operation_name=operation_name,
+            response=response,
+            body=response.content,
+        )
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        operation_name: str,
+        params: dict[str, typing.Any],
+        chunk_size: int = default_chunk_size,
+    ) -> collections.abc.AsyncIterator[
+        tuple[dict[str, typing.Any], collections.abc.AsyncIterator[bytes]]
+    ]:
+        """Perform s3 operation and stream content of response.
+
+        Yield parsed response (without body) and iterator over chunks of
+        body.
+
+        """
+        response = await self.send(
+            operation_name=operation_name,
+            params=params,
+            stream=True,
+        )
+        try:
+            if response.status_code >= 300:
+                self.parse_response(
+                    operation_name=operation_name,
+                    response=response,
+                    body=await response.aread(),
+                )
+            parsed = self.parse_response(
+                operation_name=operation_name,
+                response=response,
+            )
+            parsed.pop("Body", None)
+            yield parsed, response.aiter_raw(chunk_size)
+        finally:
+            await response.aclose()
@@ -1,15 +1,36 @@
 import collections.abc
+import concurrent.futures
 import dataclasses
+import datetime
+import hashlib
+import io
+import itertools
+import pathlib
+import shutil
+import tempfile
+import typing
 import warnings
 
 import boto3
+import boto3.s3.transfer
 import botocore.config
 import botocore.credentials
 import botocore.exceptions
 import mypy_boto3_s3
 import mypy_boto3_s3.type_defs
 
-from . import configs
+from . import (
+    compression,
+    configs,
+    disk_cache,
+    keys,
+    metadata_cache,
+    single_flight,
+    sync,
+)
+
+# s3 allows to delete up to 1000 keys per request
+delete_objects_batch_size = 1000
 
 AccessKeyGetter = collections.abc.Callable[
     [],
@@ -99,7 +120,7 @@ def get_boto3_s3_resource(
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class S3UploadParams:
     """Representation of s3 upload params."""
 
@@ -107,6 +128,20 @@ class S3UploadParams:
     params: dict[str, str]
 
 
+@dataclasses.dataclass
+class S3ConditionalReadResult:
+    """Result of conditional read of s3 file."""
+
+    # False if s3 responded with `304 Not Modified`
+    is_changed: bool
+    etag: str
+    last_modified: datetime.datetime | None = None
+    # Content of file, empty if file wasn't changed
+    chunks: collections.abc.Iterator[bytes] = dataclasses.field(
+        default_factory=lambda: iter(()),
+    )
+
+
 class S3Client:
     """Client for interacting with s3 based on boto3 client."""
 
@@ -115,10 +150,22 @@ class S3Client:
         boto3_client: mypy_boto3_s3.S3Client,
         default_bucket: str,
         default_download_expiration: int = 3600,
+        disk_cache: disk_cache.S3DiskCache | None = None,
+        coalesce_reads: bool = False,
+        metadata_cache: metadata_cache.S3MetadataCache | None = None,
     ) -> None:
         self.boto3_client = boto3_client
         self.default_bucket = default_bucket
         self.default_download_expiration = default_download_expiration
+        # Read-through cache for `download_file` and `stream_file`
+        self.disk_cache = disk_cache
+        # Merge identical concurrent `get_file_metadata`,
+        # `is_file_in_bucket` and `download_bytes` calls into one request
+        self.single_flight: single_flight.SingleFlight[typing.Any] | None = (
+            single_flight.SingleFlight() if coalesce_reads else None
+        )
+        # Shared cache of files' metadata, invalidated on writes of client
+        self.metadata_cache = metadata_cache
 
     def _get_fields(
         self,
@@ -227,22 +274,117 @@ class S3Client:
         file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
         bucket: str = "",
     ) -> str:
-        """Upload file to s3."""
-        key = config.key(filename=filename)
+        """Upload file to s3.
+
+        If config has `content_encoding`, file is compressed chunk by chunk
+        during upload and `Content-Encoding` is set for s3 object.
+
+        If config's key is `WithPrefixContentHashFileName`, file is hashed
+        chunk by chunk and upload is skipped if s3 already has file with
+        same content.
+
+        """
+        bucket = bucket or self.default_bucket
+        if isinstance(config.key, keys.WithPrefixContentHashFileName):
+            content_hash, file_obj = self._hash_file(file_obj)
+            key = config.key(filename=filename, content_hash=content_hash)
+            if self.is_file_in_bucket(key=key, bucket=bucket):
+                return key
+        else:
+            key = config.key(filename=filename)
+        extra_args: dict[str, str] = {}
+        if config.content_encoding:
+            file_obj = compression.CompressingReader(  # type: ignore
+                file_obj=file_obj,
+                content_encoding=config.content_encoding,
+                level=config.compression_level,
+            )
+            extra_args["ContentEncoding"] = config.content_encoding
         self.boto3_client.upload_fileobj(
             Fileobj=file_obj,
-            Bucket=bucket or self.default_bucket,
+            Bucket=bucket,
             Key=key,
+            ExtraArgs=extra_args or None,
         )
+        self.invalidate_metadata(keys=(key,), bucket=bucket)
         return key
 
+    def _hash_file(
+        self,
+        file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
+    ) -> tuple[str, mypy_boto3_s3.type_defs.FileobjTypeDef]:
+        """Compute sha256 of file's content chunk by chunk.
+
+        Seekable files are rewound to initial position afterwards, other
+        files are spooled into temporary file, so that they could be
+        uploaded.
+
+        """
+        content_hash = hashlib.sha256()
+        is_seekable = getattr(file_obj, "seekable", lambda: False)()
+        if is_seekable:
+            position = file_obj.tell()  # type: ignore
+            while chunk := file_obj.read(compression.default_chunk_size):
+                content_hash.update(chunk)
+            file_obj.seek(position)  # type: ignore
+            return content_hash.hexdigest(), file_obj
+        # Keep files up to 8MB in memory
+        spooled_file = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=8 * 1024 * 1024,
+        )
+        while chunk := file_obj.read(compression.default_chunk_size):
+            content_hash.update(chunk)
+            spooled_file.write(chunk)
+        spooled_file.seek(0)
+        return content_hash.hexdigest(), spooled_file
+
     def download_file(
         self,
         key: str,
         file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
         bucket: str = "",
+        decompress: bool = False,
     ) -> mypy_boto3_s3.type_defs.FileobjTypeDef:
-        """Download file from s3."""
+        """Download file from s3.
+
+        If `decompress` is enabled, files with supported `Content-Encoding`
+        are decompressed chunk by chunk into `file_obj`. Such files are
+        streamed with single GET request, which provides encoding of file,
+        instead of managed (parallel) download.
+
+        If client has `disk_cache`, cached file is revalidated with
+        conditional GET and served from disk if it wasn't changed.
+
+        """
+        if self.disk_cache:
+            bucket = bucket or self.default_bucket
+            cached = self._get_cached_file(key=key, bucket=bucket)
+            if isinstance(cached, tuple):
+                content_encoding, cached_file = cached
+            else:
+                content_encoding = cached.get("ContentEncoding")
+                cached_file = self._store_in_disk_cache(
+                    response=cached,
+                    bucket=bucket,
+                    key=key,
+                )
+            with cached_file:
+                if decompress and compression.is_supported_content_encoding(
+                    content_encoding,
+                ):
+                    writer = compression.DecompressingWriter(
+                        file_obj=file_obj,
+                        content_encoding=str(content_encoding),
+                    )
+                    shutil.copyfileobj(cached_file, writer)  # type: ignore
+                    writer.finish()
+                else:
+                    disk_cache.copy_file(cached_file, file_obj)
+            return file_obj
+        if decompress:
+            for chunk in self.stream_file(key=key, bucket=bucket):
+                file_obj.write(chunk)  # type: ignore
+            return file_obj
         self.boto3_client.download_fileobj(
             Fileobj=file_obj,
             Bucket=bucket or self.default_bucket,
@@ -250,6 +392,280 @@ class S3Client:
         )
         return file_obj
 
+    def download_bytes(
+        self,
+        key: str,
+        bucket: str = "",
+        decompress: bool = False,
+    ) -> bytes:
+        """Download file's content from s3 into memory.
+
+        Should be used only for small files. If `coalesce_reads` is
+        enabled, concurrent downloads of same file share one request.
+
+        """
+        bucket = bucket or self.default_bucket
+
+        def _download() -> bytes:
+            file_obj = io.BytesIO()
+            self.download_file(
+                key=key,
+                file_obj=file_obj,
+                bucket=bucket,
+                decompress=decompress,
+            )
+            return file_obj.getvalue()
+
+        if self.single_flight:
+            return self.single_flight.run(
+                ("GetObject", bucket, key, decompress),
+                _download,
+            )
+        return _download()
+
+    def download_file_if_changed(
+        self,
+        key: str,
+        file_obj: mypy_boto3_s3.type_defs.FileobjTypeDef,
+        etag: str = "",
+        modified_since: datetime.datetime | None = None,
+        bucket: str = "",
+        decompress: bool = False,
+    ) -> S3ConditionalReadResult:
+        """Download file from s3 only if it was changed.
+
+        File is requested with `If-None-Match` (`etag`) and
+        `If-Modified-Since` (`modified_since`) headers, so if local copy is
+        still fresh, s3 responds with `304 Not Modified` and nothing is
+        written to `file_obj`.
+
+        """
+        result = self.stream_file_if_changed(
+            key=key,
+            etag=etag,
+            modified_since=modified_since,
+            bucket=bucket,
+            decompress=decompress,
+        )
+        for chunk in result.chunks:
+            file_obj.write(chunk)  # type: ignore
+        return result
+
+    def stream_file(
+        self,
+        key: str,
+        bucket: str = "",
+        chunk_size: int = compression.default_chunk_size,
+        decompress: bool = True,
+    ) -> collections.abc.Iterator[bytes]:
+        """Stream file's content from s3 chunk by chunk.
+
+        Files with supported `Content-Encoding` are decompressed on the fly
+        unless `decompress` is disabled.
+
+        If client has `disk_cache`, cached file is revalidated with
+        conditional GET and served from disk if it wasn't changed, otherwise
+        file is stored in cache while being streamed.
+
+        """
+        bucket = bucket or self.default_bucket
+        chunks: collections.abc.Iterator[bytes]
+        if self.disk_cache:
+            cached = self._get_cached_file(key=key, bucket=bucket)
+            if isinstance(cached, tuple):
+                content_encoding, cached_file = cached
+                chunks = disk_cache.iter_file(cached_file, chunk_size)
+            else:
+                content_encoding = cached.get("ContentEncoding")
+                chunks = self._iter_and_cache_body(
+                    response=cached,
+                    bucket=bucket,
+                    key=key,
+                    chunk_size=chunk_size,
+                )
+        else:
+            response = self.boto3_client.get_object(
+                Bucket=bucket,
+                Key=key,
+            )
+            content_encoding = response.get("ContentEncoding")
+            chunks = self._iter_body(
+                response=response,
+                chunk_size=chunk_size,
+            )
+        if decompress and compression.is_supported_content_encoding(
+            content_encoding,
+        ):
+            chunks = compression.decompress_chunks(
+                chunks=chunks,
+                content_encoding=str(content_encoding),
+            )
+        yield from chunks
+
+    def stream_file_if_changed(
+        self,
+        key: str,
+        etag: str = "",
+        modified_since: datetime.datetime | None = None,
+        bucket: str = "",
+        chunk_size: int = compression.default_chunk_size,
+        decompress: bool = True,
+    ) -> S3ConditionalReadResult:
+        """Stream file's content from s3 only if it was changed.
+
+        Works like `download_file_if_changed`, but content of changed file
+        is available via `chunks` of result.
+
+        """
+        response = self.get_object_if_changed(
+            key=key,
+            etag=etag,
+            modified_since=modified_since,
+            bucket=bucket,
+        )
+        if response is None:
+            return S3ConditionalReadResult(
+                is_changed=False,
+                etag=etag,
+                last_modified=modified_since,
+            )
+        chunks = self._iter_body(response=response, chunk_size=chunk_size)
+        content_encoding = response.get("ContentEncoding")
+        if decompress and compression.is_supported_content_encoding(
+            content_encoding,
+        ):
+            chunks = compression.decompress_chunks(
+                chunks=chunks,
+                content_encoding=str(content_encoding),
+            )
+        return S3ConditionalReadResult(
+            is_changed=True,
+            etag=response["ETag"],
+            last_modified=response.get("LastModified"),
+            chunks=chunks,
+        )
+
+    def get_object_if_changed(
+        self,
+        key: str,
+        etag: str = "",
+        modified_since: datetime.datetime | None = None,
+        bucket: str = "",
+    ) -> mypy_boto3_s3.type_defs.GetObjectOutputTypeDef | None:
+        """Get s3 object, return None if s3 responded `304 Not Modified`."""
+        params: dict[str, typing.Any] = {
+            "Bucket": bucket or self.default_bucket,
+            "Key": key,
+        }
+        if etag:
+            params["IfNoneMatch"] = etag
+        if modified_since:
+            params["IfModifiedSince"] = modified_since
+        try:
+            return self.boto3_client.get_object(**params)
+        except botocore.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") == "304":
+                return None
+            raise
+
+    def _iter_body(
+        self,
+        response: mypy_boto3_s3.type_defs.GetObjectOutputTypeDef,
+        chunk_size: int,
+    ) -> collections.abc.Iterator[bytes]:
+        """Iterate over body of s3 object and close it afterwards."""
+        try:
+            yield from response["Body"].iter_chunks(chunk_size=chunk_size)
+        finally:
+            response["Body"].close()
+
+    def _get_cached_file(
+        self,
+        key: str,
+        bucket: str,
+    ) -> (
+        tuple[str | None, typing.BinaryIO]
+        | mypy_boto3_s3.type_defs.GetObjectOutputTypeDef
+    ):
+        """Get file from disk cache revalidating it with conditional GET.
+
+        Return content encoding and opened cached file on cache hit,
+        otherwise return s3 response.
+
+        """
+        entry = self.disk_cache.get_entry(  # type: ignore
+            bucket=bucket,
+            key=key,
+        )
+        if entry:
+            response = self.get_object_if_changed(
+                key=key,
+                etag=entry.etag,
+                bucket=bucket,
+            )
+            if response:
+                return response
+            # File could be evicted by other process after revalidation
+            if cached_file := entry.open():
+                return entry.content_encoding, cached_file
+        return self.boto3_client.get_object(
+            Bucket=bucket,
+            Key=key,
+        )
+
+    def _store_in_disk_cache(
+        self,
+        response: mypy_boto3_s3.type_defs.GetObjectOutputTypeDef,
+        bucket: str,
+        key: str,
+    ) -> typing.BinaryIO:
+        """Store body of s3 object in disk cache and return cached file."""
+        writer = self.disk_cache.writer(  # type: ignore
+            bucket=bucket,
+            key=key,
+            etag=response["ETag"],
+            content_encoding=response.get("ContentEncoding"),
+        )
+        try:
+            for chunk in response["Body"].iter_chunks():
+                writer.write(chunk)
+        except BaseException:
+            writer.discard()
+            raise
+        finally:
+            response["Body"].close()
+        return writer.commit()
+
+    def _iter_and_cache_body(
+        self,
+        response: mypy_boto3_s3.type_defs.GetObjectOutputTypeDef,
+        bucket: str,
+        key: str,
+        chunk_size: int,
+    ) -> collections.abc.Iterator[bytes]:
+        """Iterate over body of s3 object and store it in disk cache.
+
+        File is stored only if body was fully read.
+
+        """
+        writer = self.disk_cache.writer(  # type: ignore
+            bucket=bucket,
+            key=key,
+            etag=response["ETag"],
+            content_encoding=response.get("ContentEncoding"),
+        )
+        is_committed = False
+        try:
+            for chunk in response["Body"].iter_chunks(chunk_size=chunk_size):
+                writer.write(chunk)
+                yield chunk
+            writer.commit().close()
+            is_committed = True
+        finally:
+            response["Body"].close()
+            if not is_committed:
+                writer.discard()
+
     def generate_presigned_url(
         self,
         key: str,
@@ -287,13 +703,55 @@ class S3Client:
         self,
         key: str,
         bucket: str = "",
+    ) -> metadata_cache.S3FileMetadata:
+        """Get file's metadata.
+
+        If `coalesce_reads` is enabled, concurrent calls for same file share
+        one request. If client has `metadata_cache`, metadata is read from it
+        first, cached metadata contains only `cached_metadata_fields`.
+
+        """
+        bucket = bucket or self.default_bucket
+        if self.metadata_cache and (
+            cached := self.metadata_cache.get_many(bucket, (key,)).get(key)
+        ):
+            return cached
+        metadata = self._head_object(key=key, bucket=bucket)
+        if self.metadata_cache:
+            self.metadata_cache.set_many(
+                bucket,
+                {key: metadata_cache.compact_metadata(metadata)},
+            )
+        return metadata
+
+    def _head_object(
+        self,
+        key: str,
+        bucket: str,
     ) -> mypy_boto3_s3.type_defs.HeadObjectOutputTypeDef:
-        """Get file's metadata."""
+        """Request file's metadata from s3."""
+        if self.single_flight:
+            return self.single_flight.run(
+                ("HeadObject", bucket, key),
+                lambda: self.boto3_client.head_object(Key=key, Bucket=bucket),
+            )
         return self.boto3_client.head_object(
             Key=key,
-            Bucket=bucket or self.default_bucket,
+            Bucket=bucket,
         )
 
+    def invalidate_metadata(
+        self,
+        keys: collections.abc.Sequence[str],
+        bucket: str = "",
+    ) -> None:
+        """Remove metadata of files from `metadata_cache`."""
+        if self.metadata_cache and keys:
+            self.metadata_cache.delete_many(
+                bucket or self.default_bucket,
+                keys,
+            )
+
     def is_file_in_bucket(
         self,
         key: str,
@@ -311,6 +769,62 @@ class S3Client:
                 return False
             raise  # pragma: no cover
 
+    def get_files_metadata(
+        self,
+        keys: collections.abc.Iterable[str],
+        bucket: str = "",
+        max_workers: int = 10,
+    ) -> dict[str, metadata_cache.S3FileMetadata | None]:
+        """Get metadata of several files requesting it in parallel.
+
+        Metadata of files which are not in bucket is None. If client has
+        `metadata_cache`, metadata of all files is read from it at once and
+        only missing files are requested.
+
+        """
+        bucket = bucket or self.default_bucket
+
+        def _get_file_metadata(
+            key: str,
+        ) -> mypy_boto3_s3.type_defs.HeadObjectOutputTypeDef | None:
+            try:
+                return self._head_object(key=key, bucket=bucket)
+            except botocore.exceptions.ClientError as error:
+                if error.response.get("Error", {}).get("Code") == "404":
+                    return None
+                raise
+
+        unique_keys = list(dict.fromkeys(keys))
+        files_metadata: dict[str, metadata_cache.S3FileMetadata | None] = {}
+        if self.metadata_cache:
+            files_metadata.update(
+                self.metadata_cache.get_many(bucket, unique_keys),
+            )
+        missing_keys = [
+            key for key in unique_keys if key not in files_metadata
+        ]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+        ) as executor:
+            fetched_metadata = dict(
+                zip(
+                    missing_keys,
+                    executor.map(_get_file_metadata, missing_keys),
+                    strict=True,
+                ),
+            )
+        if self.metadata_cache:
+            self.metadata_cache.set_many(
+                bucket,
+                {
+                    key: metadata_cache.compact_metadata(metadata)
+                    for key, metadata in fetched_metadata.items()
+                    if metadata is not None
+                },
+            )
+        files_metadata.update(fetched_metadata)
+        return {key: files_metadata[key] for key in unique_keys}
+
     def copy_object(
         self,
         key: str,
@@ -324,6 +838,7 @@ class S3Client:
             CopySource=f"{source_bucket or self.default_bucket}/{source_key}",
             Key=key,
         )
+        self.invalidate_metadata(keys=(key,), bucket=bucket)
 
     def delete_object(
         self,
@@ -335,3 +850,262 @@ class S3Client:
             Bucket=bucket or self.default_bucket,
             Key=key,
         )
+        self.invalidate_metadata(keys=(key,), bucket=bucket)
+
+    def delete_objects(
+        self,
+        keys: collections.abc.Iterable[str],
+        bucket: str = "",
+    ) -> list[mypy_boto3_s3.type_defs.ErrorTypeDef]:
+        """Delete file objects from s3 bucket in batches.
+
+        Return errors for keys which s3 failed to delete.
+
+        """
+        errors: list[mypy_boto3_s3.type_defs.ErrorTypeDef] = []
+        for batch in itertools.batched(keys, delete_objects_batch_size):
+            response = self.boto3_client.delete_objects(
+                Bucket=bucket or self.default_bucket,
+                Delete={
+                    "Objects": [{"Key": key} for key in batch],
+                    "Quiet": True,
+                },
+            )
+            errors.extend(response.get("Errors", []))
+            self.invalidate_metadata(keys=batch, bucket=bucket)
+        return errors
+
+    def iter_objects(
+        self,
+        prefix: str = "",
+        bucket: str = "",
+        start_after: str = "",
+    ) -> collections.abc.Iterator[mypy_boto3_s3.type_defs.ObjectTypeDef]:
+        """Iterate over objects in bucket page by page.
+
+        If `start_after` is set, only keys which are greater are listed.
+
+        """
+        params: dict[str, str] = {
+            "Bucket": bucket or self.default_bucket,
+            "Prefix": prefix,
+        }
+        if start_after:
+            params["StartAfter"] = start_after
+        paginator = self.boto3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(**params):  # type: ignore
+            yield from page.get("Contents", [])
+
+    def iter_objects_since(
+        self,
+        key: keys.UUIDv7KeyMixin,
+        since: datetime.datetime,
+        bucket: str = "",
+    ) -> collections.abc.Iterator[mypy_boto3_s3.type_defs.ObjectTypeDef]:
+        """Iterate over objects which keys were generated since timestamp.
+
+        Works for time-ordered keys (like `WithPrefixUUIDv7FileName`),
+        listing starts right after `since` watermark instead of full scan
+        of prefix.
+
+        """
+        return self.iter_objects(
+            prefix=f"{key.prefix}/",
+            bucket=bucket,
+            start_after=key.get_start_after(since),
+        )
+
+    def iter_objects_in_prefixes(
+        self,
+        prefixes: collections.abc.Sequence[str],
+        bucket: str = "",
+        max_workers: int = 10,
+    ) -> collections.abc.Iterator[mypy_boto3_s3.type_defs.ObjectTypeDef]:
+        """Iterate over objects of several prefixes listing them in parallel.
+
+        Objects are yielded in order in which pages are received, amount of
+        pages waiting to be consumed is bounded by `max_workers`.
+
+        """
+
+        def _iter_pages(
+            prefix: str,
+        ) -> collections.abc.Iterator[
+            list[mypy_boto3_s3.type_defs.ObjectTypeDef]
+        ]:
+            paginator = self.boto3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(
+                Bucket=bucket or self.default_bucket,
+                Prefix=prefix,
+            ):
+                yield page.get("Contents", [])
+
+        return sync.iter_batches_in_parallel(
+            func=_iter_pages,
+            args=prefixes,
+            max_workers=max_workers,
+        )
+
+    def sync_directory(
+        self,
+        local_path: str | pathlib.Path,
+        prefix: str,
+        bucket: str = "",
+        delete: bool = False,
+        max_workers: int = 10,
+        transfer_config: boto3.s3.transfer.TransferConfig | None = None,
+    ) -> sync.S3SyncResult:
+        """Upload files from local directory which differ from s3 prefix.
+
+        Files are compared by size and locally computed ETag. If `delete` is
+        set, keys which are missing in local directory are deleted.
+
+        Listing of prefix and walk of directory are merged as two sorted
+        streams, so memory usage doesn't depend on amount of files.
+
+        """
+        bucket = bucket or self.default_bucket
+        local_path = pathlib.Path(local_path)
+        prefix = prefix.removesuffix("/")
+        result = sync.S3SyncResult()
+        remote_objects = (
+            (obj["Key"].removeprefix(f"{prefix}/"), obj)
+            for obj in self.iter_objects(
+                prefix=f"{prefix}/" if prefix else "",
+                bucket=bucket,
+            )
+        )
+
+        def _upload_if_changed(
+            path: pathlib.Path,
+            key: str,
+            remote_object: mypy_boto3_s3.type_defs.ObjectTypeDef | None,
+        ) -> None:
+            if remote_object and not sync.is_file_changed(
+                path=path,
+                size=remote_object["Size"],
+                etag=remote_object["ETag"],
+                transfer_config=transfer_config,
+            ):
+                result.skipped.append(key)
+                return
+            self.boto3_client.upload_file(
+                Filename=str(path),
+                Bucket=bucket,
+                Key=key,
+                Config=transfer_config,
+            )
+            self.invalidate_metadata(keys=(key,), bucket=bucket)
+            result.transferred.append(key)
+
+        extra_keys: list[str] = []
+        with sync.BoundedExecutor(max_workers=max_workers) as executor:
+            for relative_path, path, remote_object in sync.merge_by_path(
+                local_items=sync.iter_local_files(local_path),
+                remote_items=remote_objects,
+            ):
+                if path:
+                    executor.submit(
+                        _upload_if_changed,
+                        path,
+                        "/".join(filter(None, (prefix, relative_path))),
+                        remote_object,
+                    )
+                elif delete and remote_object:
+                    extra_keys.append(remote_object["Key"])
+                if len(extra_keys) == delete_objects_batch_size:
+                    self.delete_objects(keys=extra_keys, bucket=bucket)
+                    result.deleted.extend(extra_keys)
+                    extra_keys = []
+        if extra_keys:
+            self.delete_objects(keys=extra_keys, bucket=bucket)
+            result.deleted.extend(extra_keys)
+        return result
+
+    def sync_prefix(
+        self,
+        prefix: str,
+        local_path: str | pathlib.Path,
+        bucket: str = "",
+        delete: bool = False,
+        max_workers: int = 10,
+        transfer_config: boto3.s3.transfer.TransferConfig | None = None,
+    ) -> sync.S3SyncResult:
+        """Download files from s3 prefix which differ from local directory.
+
+        Files are compared by size and locally computed ETag. If `delete` is
+        set, local files which are missing in s3 are deleted.
+
+        Listing of prefix and walk of directory are merged as two sorted
+        streams, so memory usage doesn't depend on amount of files.
+
+        """
+        bucket = bucket or self.default_bucket
+        local_path = pathlib.Path(local_path)
+        resolved_local_path = local_path.resolve()
+        prefix = prefix.removesuffix("/")
+        result = sync.S3SyncResult()
+
+        def _download_if_changed(
+            path: pathlib.Path,
+            relative_path: str,
+            remote_object: mypy_boto3_s3.type_defs.ObjectTypeDef,
+        ) -> None:
+            if not sync.is_file_changed(
+                path=path,
+                size=remote_object["Size"],
+                etag=remote_object["ETag"],
+                transfer_config=transfer_config,
+            ):
+                result.skipped.append(relative_path)
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.boto3_client.download_file(
+                Bucket=bucket,
+                Key=remote_object["Key"],
+                Filename=str(path),
+                Config=transfer_config,
+            )
+            result.transferred.append(relative_path)
+
+        def _iter_remote_objects() -> collections.abc.Iterator[
+            tuple[str, mypy_boto3_s3.type_defs.ObjectTypeDef]
+        ]:
+            for obj in self.iter_objects(
+                prefix=f"{prefix}/" if prefix else "",
+                bucket=bucket,
+            ):
+                relative_path = obj["Key"].removeprefix(f"{prefix}/")
+                # Skip folder markers, keys which are not normalized paths
+                # and keys pointing outside of directory
+                is_not_normalized = any(
+                    part in ("", ".", "..")
+                    for part in relative_path.split("/")
+                )
+                if is_not_normalized or not (
+                    (local_path / relative_path)
+                    .resolve()
+                    .is_relative_to(resolved_local_path)
+                ):
+                    continue
+                yield relative_path, obj
+
+        # Directories are read by walk once it reaches them, while files
+        # are downloaded only after walk has passed their paths, so new
+        # files are never treated as extra ones
+        with sync.BoundedExecutor(max_workers=max_workers) as executor:
+            for relative_path, path, remote_object in sync.merge_by_path(
+                local_items=sync.iter_local_files(local_path),
+                remote_items=_iter_remote_objects(),
+            ):
+                if remote_object:
+                    executor.submit(
+                        _download_if_changed,
+                        local_path / relative_path,
+                        relative_path,
+                        remote_object,
+                    )
+                elif delete and path:
+                    path.unlink()
+                    result.deleted.append(relative_path)
+        return result
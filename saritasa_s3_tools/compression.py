@@ -0,0 +1,169 @@
+import collections.abc
+import typing
+import zlib
+
+ContentEncoding = typing.Literal["gzip", "zstd"]
+supported_content_encodings: tuple[str, ...] = typing.get_args(
+    ContentEncoding,
+)
+# Size of chunk which is read from source file at once
+default_chunk_size = 64 * 1024
+
+
+class Compressor(typing.Protocol):
+    """Protocol for streaming compressors."""
+
+    def compress(self, data: bytes, /) -> bytes:
+        """Compress chunk of data."""
+
+    def flush(self) -> bytes:
+        """Finish compression and return remaining data."""
+
+
+class Decompressor(typing.Protocol):
+    """Protocol for streaming decompressors."""
+
+    def decompress(self, data: bytes, /) -> bytes:
+        """Decompress chunk of data."""
+
+
+def _import_zstd() -> typing.Any:
+    """Import zstd module from standard library."""
+    try:
+        from compression import zstd  # type: ignore
+    except ImportError as error:  # pragma: no cover
+        raise ValueError(
+            "zstd content encoding requires python 3.14 or newer",
+        ) from error
+    return zstd
+
+
+def get_compressor(
+    content_encoding: str,
+    level: int | None = None,
+) -> Compressor:
+    """Get streaming compressor for content encoding."""
+    match content_encoding:
+        case "gzip":
+            # wbits=31 makes zlib produce gzip header and trailer
+            return zlib.compressobj(
+                level=zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+                wbits=31,
+            )
+        case "zstd":
+            return _import_zstd().ZstdCompressor(level=level)
+    raise ValueError(
+        f"Unsupported content encoding: {content_encoding}",
+    )  # pragma: no cover
+
+
+def get_decompressor(content_encoding: str) -> Decompressor:
+    """Get streaming decompressor for content encoding."""
+    match content_encoding:
+        case "gzip":
+            return zlib.decompressobj(wbits=31)
+        case "zstd":
+            return _import_zstd().ZstdDecompressor()
+    raise ValueError(
+        f"Unsupported content encoding: {content_encoding}",
+    )  # pragma: no cover
+
+
+def is_supported_content_encoding(content_encoding: str | None) -> bool:
+    """Check if content encoding can be decompressed."""
+    return content_encoding in supported_content_encodings
+
+
+class CompressingReader:
+    """Read-only file-like object which compresses source on the fly.
+
+    Source file is read chunk by chunk, so only compressed data for
+    requested size is kept in memory.
+
+    """
+
+    def __init__(
+        self,
+        file_obj: typing.Any,
+        content_encoding: str,
+        level: int | None = None,
+        chunk_size: int = default_chunk_size,
+    ) -> None:
+        self.file_obj = file_obj
+        self.chunk_size = chunk_size
+        self._compressor = get_compressor(
+            content_encoding=content_encoding,
+            level=level,
+        )
+        self._buffer = bytearray()
+        self._eof = False
+
+    def readable(self) -> bool:
+        """Return whether object was opened for reading."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether object supports random access."""
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        """Read and return up to size compressed bytes."""
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self.file_obj.read(self.chunk_size)
+            if chunk:
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._eof = True
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+class DecompressingWriter:
+    """Write-only file-like object which decompresses data on the fly.
+
+    Decompressed data is written to wrapped file object.
+
+    """
+
+    def __init__(
+        self,
+        file_obj: typing.Any,
+        content_encoding: str,
+    ) -> None:
+        self.file_obj = file_obj
+        self._decompressor = get_decompressor(content_encoding)
+
+    def writable(self) -> bool:
+        """Return whether object was opened for writing."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether object supports random access."""
+        return False
+
+    def write(self, data: bytes) -> int:
+        """Decompress data and write it to wrapped file object."""
+        self.file_obj.write(self._decompressor.decompress(data))
+        return len(data)
+
+    def finish(self) -> None:
+        """Write remaining decompressed data."""
+        if flush := getattr(self._decompressor, "flush", None):
+            self.file_obj.write(flush())
+
+
+def decompress_chunks(
+    chunks: collections.abc.Iterable[bytes],
+    content_encoding: str,
+) -> collections.abc.Iterator[bytes]:
+    """Decompress stream of chunks."""
+    decompressor = get_decompressor(content_encoding)
+    for chunk in chunks:
+        if data := decompressor.decompress(chunk):
+            yield data
+    if (flush := getattr(decompressor, "flush", None)) and (data := flush()):
+        yield data
@@ -1,7 +1,9 @@
+import collections.abc
 import dataclasses
+import functools
 import typing
 
-from . import keys
+from . import compression, keys
 
 
 class S3FileTypeConfigMeta(type):
@@ -17,14 +19,87 @@ class S3FileTypeConfigMeta(type):
         if instance.name in S3FileTypeConfig.configs:
             raise ValueError(f"{instance.name} config is already defined")
         S3FileTypeConfig.configs[instance.name] = instance
+        S3FileTypeConfig.version += 1
+        # Index will be rebuilt with new config on next resolution
+        S3FileTypeConfig.index = None
+        S3FileTypeConfig.descriptions = None
         return instance
 
 
+@dataclasses.dataclass
+class S3FileTypeConfigIndexNode:
+    """Node of prefix trie of S3FileTypeConfigIndex."""
+
+    children: dict[str, "S3FileTypeConfigIndexNode"] = dataclasses.field(
+        default_factory=dict,
+    )
+    configs: list["S3FileTypeConfig"] = dataclasses.field(
+        default_factory=list,
+    )
+
+
+class S3FileTypeConfigIndex:
+    """Index for resolving s3 key to config it was generated by.
+
+    Configs are stored in trie by folders of their keys' prefixes, so
+    resolution of key checks only patterns of configs whose prefix matches
+    key, instead of validating key against every registered config. Configs
+    with keys without prefix are checked after prefixed ones.
+
+    """
+
+    def __init__(
+        self,
+        configs: collections.abc.Iterable["S3FileTypeConfig"],
+    ) -> None:
+        self.root = S3FileTypeConfigIndexNode()
+        self.unprefixed: list[S3FileTypeConfig] = []
+        for config in configs:
+            prefix: str | None = getattr(config.key, "prefix", None)
+            if prefix is None:
+                self.unprefixed.append(config)
+                continue
+            node = self.root
+            for folder in prefix.split("/"):
+                node = node.children.setdefault(
+                    folder,
+                    S3FileTypeConfigIndexNode(),
+                )
+            node.configs.append(config)
+
+    def resolve(self, key: str) -> "S3FileTypeConfig | None":
+        """Get config which key belongs to, None if there is no such."""
+        candidates: list[S3FileTypeConfigIndexNode] = []
+        node = self.root
+        # Last folder is a file name, it can't be a part of prefix
+        for folder in key.split("/")[:-1]:
+            if (child := node.children.get(folder)) is None:
+                break
+            node = child
+            candidates.append(node)
+        # Configs with longer prefixes are more specific
+        for candidate in reversed(candidates):
+            for config in candidate.configs:
+                if config.key.validate(key):
+                    return config
+        for config in self.unprefixed:
+            if config.key.validate(key):
+                return config
+        return None
+
+
 @dataclasses.dataclass(frozen=True)
 class S3FileTypeConfig(metaclass=S3FileTypeConfigMeta):
     """Configuration for S3 file upload."""
 
     configs: typing.ClassVar[dict[str, "S3FileTypeConfig"]] = {}
+    # Version of registry, it's increased on each registration of config,
+    # so that structures derived from registry know when to rebuild
+    version: typing.ClassVar[int] = 0
+    # Index of configs, built on first resolution of key
+    index: typing.ClassVar[S3FileTypeConfigIndex | None] = None
+    # Names and short descriptions of configs, built on first access
+    descriptions: typing.ClassVar[tuple[tuple[str, str], ...] | None] = None
 
     name: str
     # S3Key are used to generate file's path
@@ -40,9 +115,44 @@ class S3FileTypeConfig(metaclass=S3FileTypeConfigMeta):
     success_action_status: int = 201
     # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Content-Disposition
     content_disposition: typing.Literal["attachment", "inline"] = "attachment"
+    # Compress files uploaded via `S3Client.upload_file` (None - store as is)
+    content_encoding: compression.ContentEncoding | None = None
+    # Compression level for content encoding, None - default level
+    compression_level: int | None = None
+
+    @classmethod
+    def get_index(cls) -> S3FileTypeConfigIndex:
+        """Get index of registered configs."""
+        index = S3FileTypeConfig.index
+        if index is None:
+            index = S3FileTypeConfigIndex(S3FileTypeConfig.configs.values())
+            S3FileTypeConfig.index = index
+        return index
+
+    @classmethod
+    def resolve(cls, key: str) -> "S3FileTypeConfig | None":
+        """Get config which key belongs to, None if there is no such."""
+        return cls.get_index().resolve(key)
+
+    @classmethod
+    def get_descriptions(cls) -> tuple[tuple[str, str], ...]:
+        """Get names and short descriptions of registered configs."""
+        descriptions = S3FileTypeConfig.descriptions
+        if descriptions is None:
+            descriptions = tuple(
+                (name, config.get_short_description())
+                for name, config in S3FileTypeConfig.configs.items()
+            )
+            S3FileTypeConfig.descriptions = descriptions
+        return descriptions
 
     def get_short_description(self) -> str:
         """Get short description for config."""
+        return self.short_description
+
+    @functools.cached_property
+    def short_description(self) -> str:
+        """Short description for config, it's built once."""
         allowed_types = (
             ", ".join(self.allowed) if self.allowed else "All types"
         )
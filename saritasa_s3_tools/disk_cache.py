@@ -0,0 +1,322 @@
+import collections.abc
+import contextlib
+import dataclasses
+import hashlib
+import io
+import os
+import pathlib
+import shutil
+import tempfile
+import typing
+import urllib.parse
+
+with contextlib.suppress(ImportError):
+    import fcntl
+
+
+@dataclasses.dataclass(frozen=True)
+class S3DiskCacheEntry:
+    """Representation of file stored in disk cache."""
+
+    etag: str
+    content_encoding: str | None
+    path: pathlib.Path
+
+    def open(self) -> typing.BinaryIO | None:
+        """Open cached file for reading, return None if it was evicted.
+
+        Opened file stays readable even if it gets evicted by other process.
+
+        """
+        try:
+            cached_file = self.path.open("rb")
+        except FileNotFoundError:
+            return None
+        # Update modification time to keep track of recently used files
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(self.path)
+        return cached_file
+
+
+class S3DiskCacheWriter:
+    """Writer of s3 file's content into disk cache.
+
+    Data is written into temporary file, which is atomically moved into
+    cache on `commit`.
+
+    """
+
+    def __init__(
+        self,
+        cache: "S3DiskCache",
+        path: pathlib.Path,
+    ) -> None:
+        self.cache = cache
+        self.path = path
+        self._file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+            dir=cache.tmp_directory,
+            delete=False,
+        )
+
+    def writable(self) -> bool:
+        """Return whether object was opened for writing."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether object supports random access."""
+        return False
+
+    def write(self, data: bytes) -> int:
+        """Write data to temporary file."""
+        return self._file.write(data)
+
+    def commit(self) -> typing.BinaryIO:
+        """Move written file into cache and return it opened for reading.
+
+        File is opened before it's moved, so it stays readable even if it
+        doesn't fit into cache and gets evicted right away.
+
+        """
+        self._file.close()
+        tmp_path = pathlib.Path(self._file.name)
+        cached_file = tmp_path.open("rb")
+        size_delta = tmp_path.stat().st_size
+        with self.cache.lock():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Remove content of older versions of the same file
+            for stale_path in self.path.parent.iterdir():
+                with contextlib.suppress(FileNotFoundError):
+                    size_delta -= stale_path.stat().st_size
+                    stale_path.unlink()
+            tmp_path.replace(self.path)
+            total_size = self.cache.update_size(size_delta)
+        if total_size is None or total_size > self.cache.max_size:
+            self.cache.evict()
+        return cached_file
+
+    def discard(self) -> None:
+        """Remove written temporary file."""
+        self._file.close()
+        pathlib.Path(self._file.name).unlink(missing_ok=True)
+
+
+class S3DiskCache:
+    """Size bounded LRU cache of s3 files on local disk.
+
+    Files are keyed by bucket, key and ETag, so new version of file will
+    never be served from cache. Cache is safe to be shared between
+    processes: files are written atomically and cache maintenance is
+    guarded with file lock (on systems that support `fcntl`).
+
+    Total size of cached files is tracked in `.size` file, so directory
+    is scanned only once cache outgrows max size. Eviction shrinks cache
+    to `eviction_ratio` of max size, so that it's not repeated on every
+    write to full cache.
+
+    Layout of cache directory:
+        {sha256 of bucket and key}/{quoted ETag}[@{content encoding}]
+
+    """
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        max_size: int,
+        eviction_ratio: float = 0.9,
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+        self.eviction_ratio = eviction_ratio
+        self.tmp_directory = self.directory / ".tmp"
+        self.tmp_directory.mkdir(parents=True, exist_ok=True)
+        self.lock_path = self.directory / ".lock"
+        self.size_path = self.directory / ".size"
+
+    @contextlib.contextmanager
+    def lock(self) -> collections.abc.Iterator[None]:
+        """Acquire exclusive cross-process lock for cache maintenance."""
+        with self.lock_path.open("a") as lock_file:
+            if "fcntl" in globals():
+                # Lock is released once lock file is closed
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def get_path(
+        self,
+        bucket: str,
+        key: str,
+        etag: str,
+        content_encoding: str | None = None,
+    ) -> pathlib.Path:
+        """Get path of file in cache."""
+        name = urllib.parse.quote(etag, safe="")
+        if content_encoding:
+            name = f"{name}@{urllib.parse.quote(content_encoding, safe='')}"
+        return self.get_key_directory(bucket=bucket, key=key) / name
+
+    def get_key_directory(
+        self,
+        bucket: str,
+        key: str,
+    ) -> pathlib.Path:
+        """Get directory which contains cached versions of file."""
+        return self.directory / (
+            hashlib.sha256(f"{bucket}/{key}".encode()).hexdigest()
+        )
+
+    def get_entry(
+        self,
+        bucket: str,
+        key: str,
+    ) -> S3DiskCacheEntry | None:
+        """Get cached version of file, return None on cache miss."""
+        try:
+            path = next(
+                self.get_key_directory(bucket=bucket, key=key).iterdir(),
+            )
+        except (FileNotFoundError, StopIteration):
+            return None
+        etag, _, content_encoding = path.name.partition("@")
+        return S3DiskCacheEntry(
+            etag=urllib.parse.unquote(etag),
+            content_encoding=urllib.parse.unquote(content_encoding) or None,
+            path=path,
+        )
+
+    def open(
+        self,
+        bucket: str,
+        key: str,
+        etag: str,
+    ) -> typing.BinaryIO | None:
+        """Open cached file for reading, return None on cache miss."""
+        entry = self.get_entry(bucket=bucket, key=key)
+        if not entry or entry.etag != etag:
+            return None
+        return entry.open()
+
+    def writer(
+        self,
+        bucket: str,
+        key: str,
+        etag: str,
+        content_encoding: str | None = None,
+    ) -> S3DiskCacheWriter:
+        """Get writer for storing file in cache."""
+        return S3DiskCacheWriter(
+            cache=self,
+            path=self.get_path(
+                bucket=bucket,
+                key=key,
+                etag=etag,
+                content_encoding=content_encoding,
+            ),
+        )
+
+    def get_size(self) -> int | None:
+        """Get tracked total size of cached files, None if it's unknown."""
+        try:
+            return int(self.size_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def update_size(self, delta: int) -> int | None:
+        """Update tracked total size of cached files and return it.
+
+        Must be called under `lock`. If size is unknown, it stays unknown
+        till next eviction.
+
+        """
+        size = self.get_size()
+        if size is None:
+            return None
+        size += delta
+        self.size_path.write_text(str(size))
+        return size
+
+    def evict(self) -> None:
+        """Remove least recently used files if cache outgrew max size."""
+        with self.lock():
+            entries: list[tuple[float, int, pathlib.Path]] = []
+            total_size = 0
+            for key_directory in self.directory.iterdir():
+                if not key_directory.is_dir() or key_directory.name.startswith(
+                    ".",
+                ):
+                    continue
+                for path in key_directory.iterdir():
+                    with contextlib.suppress(FileNotFoundError):
+                        stat = path.stat()
+                        entries.append((stat.st_mtime, stat.st_size, path))
+                        total_size += stat.st_size
+            if total_size > self.max_size:
+                entries.sort()
+                target_size = self.max_size * self.eviction_ratio
+                for _, size, path in entries:
+                    if total_size <= target_size:
+                        break
+                    path.unlink(missing_ok=True)
+                    with contextlib.suppress(OSError):
+                        path.parent.rmdir()
+                    total_size -= size
+            self.size_path.write_text(str(total_size))
+
+    def clear(self) -> None:
+        """Remove all files from cache."""
+        with self.lock():
+            for path in self.directory.iterdir():
+                if path.is_dir() and not path.name.startswith("."):
+                    shutil.rmtree(path, ignore_errors=True)
+            self.size_path.write_text("0")
+
+
+def copy_file(
+    source: typing.BinaryIO,
+    file_obj: typing.Any,
+) -> None:
+    """Copy content of cached file to file object.
+
+    Use zero-copy `os.sendfile` when target is a real seekable file. Pipes,
+    sockets and spooled files (which would be rolled over to disk by
+    `fileno`) are copied as usual.
+
+    """
+    out_fd = None
+    is_seekable = (
+        not isinstance(
+            file_obj,
+            tempfile.SpooledTemporaryFile,
+        )
+        and getattr(file_obj, "seekable", lambda: False)()
+    )
+    if is_seekable:
+        try:
+            out_fd = file_obj.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            out_fd = None
+    if out_fd is None or not hasattr(os, "sendfile"):
+        shutil.copyfileobj(source, file_obj)
+        return
+    file_obj.flush()
+    position = file_obj.tell()
+    os.lseek(out_fd, position, os.SEEK_SET)
+    in_fd = source.fileno()
+    offset = 0
+    size = os.fstat(in_fd).st_size
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if not sent:
+            break  # pragma: no cover
+        offset += sent
+    # Sync position of file object with written data
+    file_obj.seek(position + offset)
+
+
+def iter_file(
+    source: typing.BinaryIO,
+    chunk_size: int,
+) -> collections.abc.Iterator[bytes]:
+    """Iterate over content of cached file and close it afterwards."""
+    with source:
+        while chunk := source.read(chunk_size):
+            yield chunk
@@ -1,11 +1,30 @@
 from .drf_fields import S3FileTypeConfigField, S3UploadURLField
-from .model_fields import S3FileField, S3FileFieldMixin, S3ImageField
+from .model_fields import (
+    S3FieldFile,
+    S3FieldFileMixin,
+    S3FileExistenceValidator,
+    S3FileField,
+    S3FileFieldMixin,
+    S3ImageField,
+    S3ImageFieldFile,
+    full_clean_many,
+    prefetch_files_existence,
+)
+from .querysets import S3Manager, S3QuerySet, prefetch_s3_metadata
 from .serializers import (
     S3ConfigSerializer,
     S3FieldsConfigMixin,
     S3ParamsSerializer,
     S3RequestParamsSerializer,
     S3UploadSerializer,
+    S3UploadURLListSerializer,
+)
+from .shortcuts import (
+    clear_s3_clients,
+    get_async_s3_client,
+    get_s3_client,
+    get_storage_alias,
+    invalidate_files_metadata,
 )
-from .shortcuts import get_s3_client
+from .storage import S3MetadataCacheStorageMixin, S3Storage
 from .views import S3GetParamsView
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class S3ToolsConfig(AppConfig):
+    """Config of app which provides management commands."""
+
+    name = "saritasa_s3_tools.django"
+    label = "saritasa_s3_tools"
+    verbose_name = "Saritasa S3 Tools"
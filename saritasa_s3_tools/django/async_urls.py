@@ -0,0 +1,21 @@
+from django.urls import path
+
+from . import async_views
+
+urlpatterns = [
+    path(
+        "get-params/",
+        async_views.S3AsyncGetParamsView.as_view(),
+        name="s3-get-params",
+    ),
+    path(
+        "list-configs/",
+        async_views.S3AsyncListConfigsView.as_view(),
+        name="s3-list-configs",
+    ),
+    path(
+        "retrieve-config/<str:name>/",
+        async_views.S3AsyncRetrieveConfigView.as_view(),
+        name="s3-retrieve-config",
+    ),
+]
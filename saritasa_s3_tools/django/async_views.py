@@ -0,0 +1,203 @@
+import json
+import typing
+
+from asgiref.sync import sync_to_async
+from django import http, views
+from django.db import transaction
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import authentication, exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from . import payloads, serializers, shortcuts
+
+if typing.TYPE_CHECKING:
+    from .. import async_client
+
+
+class S3AsyncView(views.View):
+    """Base async view for s3 upload api.
+
+    Plain async Django view, which doesn't occupy sync thread under ASGI.
+    Unlike `S3GetParamsView`, DRF's permissions and throttling are not
+    applied.
+
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs) -> typing.Callable[..., typing.Any]:
+        """Exclude view from `ATOMIC_REQUESTS` as async views can't use it.
+
+        Same as DRF's views, view is exempted from Django's CSRF check, since
+        `SessionAuthentication` enforces it for session authenticated users.
+
+        """
+        return transaction.non_atomic_requests(
+            csrf_exempt(super().as_view(**initkwargs)),
+        )
+
+
+class S3AsyncGetParamsView(S3AsyncView):
+    """Async view for getting params for s3 to upload file to S3."""
+
+    http_method_names = ("post",)
+    authentication_classes: typing.Sequence[
+        type[authentication.BaseAuthentication]
+    ] = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+
+    async def post(self, request: http.HttpRequest) -> http.JsonResponse:
+        """Get parameters for upload to S3 bucket.
+
+        Same as `S3GetParamsView.get_params`. Authentication and validation
+        (which calls config's `auth`) may query database, so they're run in
+        worker thread.
+
+        """
+        try:
+            drf_request = await sync_to_async(self.authenticate)(request)
+            data = self.get_data(request)
+        except exceptions.APIException as error:
+            return self.get_error_response(request=request, error=error)
+        serializer = serializers.S3RequestParamsSerializer(
+            context_request=drf_request,
+            data=data,
+        )
+        if not await sync_to_async(serializer.is_valid)():
+            return http.JsonResponse(serializer.errors, status=400)
+        params = await self.get_s3_client().async_generate_params(
+            filename=serializer.validated_data["filename"],
+            config=serializer.validated_data["config"],
+            content_type=serializer.validated_data["content_type"],
+            extra_metadata=self.get_extra_meta_data(user=drf_request.user),
+        )
+        return http.JsonResponse(serializers.serialize_upload_params(params))
+
+    def get_authenticators(self) -> list[authentication.BaseAuthentication]:
+        """Get instances of DRF authenticators of view."""
+        return [
+            authentication_class()
+            for authentication_class in self.authentication_classes
+        ]
+
+    def authenticate(self, request: http.HttpRequest) -> Request:
+        """Authenticate request with DRF authenticators.
+
+        Authenticators may query database, so it's called in worker thread.
+
+        """
+        drf_request = Request(
+            request,
+            authenticators=self.get_authenticators(),
+        )
+        # Same as `APIView.perform_authentication`
+        drf_request.user  # noqa: B018
+        return drf_request
+
+    def get_error_response(
+        self,
+        request: http.HttpRequest,
+        error: exceptions.APIException,
+    ) -> http.JsonResponse:
+        """Get response for api error same way as DRF's views."""
+        response = http.JsonResponse(
+            {"detail": str(error.detail)},
+            status=error.status_code,
+        )
+        if isinstance(
+            error,
+            exceptions.NotAuthenticated | exceptions.AuthenticationFailed,
+        ):
+            authenticators = self.get_authenticators()
+            authenticate_header = (
+                authenticators[0].authenticate_header(Request(request))
+                if authenticators
+                else None
+            )
+            if authenticate_header:
+                response["WWW-Authenticate"] = authenticate_header
+            else:
+                response.status_code = 403
+        return response
+
+    def get_data(self, request: http.HttpRequest) -> typing.Any:
+        """Get data from json or form body."""
+        if request.content_type != "application/json":
+            return request.POST
+        try:
+            return json.loads(request.body)
+        except ValueError as error:
+            raise exceptions.ParseError(
+                f"JSON parse error - {error}",
+            ) from error
+
+    def get_s3_client(self) -> "async_client.AsyncS3Client":
+        """Get s3 client for params generation."""
+        return shortcuts.get_async_s3_client()
+
+    def get_extra_meta_data(
+        self,
+        user: typing.Any,
+    ) -> dict[str, str]:
+        """Extend meta data for file."""
+        return {
+            "user-id": str(user.pk),
+        }
+
+
+class S3AsyncConfigsView(S3AsyncView):
+    """Base async view for pre-rendered configs responses."""
+
+    http_method_names = ("get",)
+    # Cache-Control directives of configs responses
+    configs_cache_control: typing.ClassVar[dict[str, typing.Any]] = {
+        "no_cache": True,
+    }
+
+    def get_configs_response(
+        self,
+        request: http.HttpRequest,
+        payload: payloads.S3ConfigsPayload,
+    ) -> http.HttpResponseBase:
+        """Get response for pre-rendered configs payload.
+
+        Respond with `304` if client already has payload.
+
+        """
+        return payloads.patch_configs_response(
+            response=payload.get_not_modified_response(request)
+            or http.HttpResponse(
+                payload.content,
+                content_type="application/json",
+            ),
+            payload=payload,
+            cache_control=self.configs_cache_control,
+        )
+
+
+class S3AsyncListConfigsView(S3AsyncConfigsView):
+    """Async view for listing all configs for s3 upload."""
+
+    async def get(self, request: http.HttpRequest) -> http.HttpResponseBase:
+        """List all configs for s3 upload."""
+        return self.get_configs_response(
+            request=request,
+            payload=payloads.get_configs_payloads().configs_list,
+        )
+
+
+class S3AsyncRetrieveConfigView(S3AsyncConfigsView):
+    """Async view for retrieving config for s3 upload."""
+
+    async def get(
+        self,
+        request: http.HttpRequest,
+        name: str,
+    ) -> http.HttpResponseBase:
+        """Retrieve config for s3 upload."""
+        payload = payloads.get_configs_payloads().configs.get(name)
+        if payload is None:
+            return http.JsonResponse(
+                {"detail": str(exceptions.NotFound.default_detail)},
+                status=404,
+            )
+        return self.get_configs_response(request=request, payload=payload)
@@ -0,0 +1,193 @@
+import collections.abc
+import functools
+import hashlib
+import typing
+
+from django.conf import settings
+from django.core import signals
+from django.core.cache import BaseCache, caches
+from django.core.files.storage import Storage
+from django.dispatch import receiver
+
+from .. import metadata_cache
+
+
+class S3DjangoCache:
+    """Base for caches which store entries in Django cache.
+
+    Entries are shared between processes using same cache. Keys of entries
+    are hashed, so that they fit any cache backend, and versioned, so that
+    all entries can be dropped by changing `version`.
+
+    """
+
+    def __init__(
+        self,
+        alias: str = "default",
+        version: int = 1,
+        key_prefix: str = "saritasa-s3-tools",
+        timeout: int = 300,
+    ) -> None:
+        self.alias = alias
+        self.version = version
+        self.key_prefix = key_prefix
+        # Max time entries are stored in cache (in seconds)
+        self.timeout = timeout
+
+    @property
+    def cache(self) -> BaseCache:
+        """Get Django cache."""
+        return caches[self.alias]
+
+    def make_key(self, *parts: str) -> str:
+        """Make key of entry from its parts."""
+        digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    def get_entries(
+        self,
+        keys: collections.abc.Mapping[str, str],
+    ) -> dict[str, typing.Any]:
+        """Get entries by names using mapping of names to cache keys."""
+        names = {key: name for name, key in keys.items()}
+        return {
+            names[key]: value
+            for key, value in self.cache.get_many(
+                keys.values(),
+                version=self.version,
+            ).items()
+        }
+
+
+class S3DjangoMetadataCache(S3DjangoCache):
+    """Cache of files' metadata for `S3Client` in Django cache."""
+
+    def _make_keys(
+        self,
+        bucket: str,
+        keys: collections.abc.Iterable[str],
+    ) -> dict[str, str]:
+        """Make cache keys for s3 keys."""
+        return {key: self.make_key("metadata", bucket, key) for key in keys}
+
+    def get_many(
+        self,
+        bucket: str,
+        keys: collections.abc.Sequence[str],
+    ) -> dict[str, metadata_cache.S3CachedMetadata]:
+        """Get cached metadata of files, missing files are omitted."""
+        return self.get_entries(self._make_keys(bucket, keys))
+
+    def set_many(
+        self,
+        bucket: str,
+        metadata: collections.abc.Mapping[
+            str,
+            metadata_cache.S3CachedMetadata,
+        ],
+    ) -> None:
+        """Store metadata of files."""
+        if not metadata:
+            return
+        cache_keys = self._make_keys(bucket, metadata)
+        self.cache.set_many(
+            {cache_keys[key]: value for key, value in metadata.items()},
+            timeout=self.timeout,
+            version=self.version,
+        )
+
+    def delete_many(
+        self,
+        bucket: str,
+        keys: collections.abc.Sequence[str],
+    ) -> None:
+        """Remove metadata of files."""
+        self.cache.delete_many(
+            list(self._make_keys(bucket, keys).values()),
+            version=self.version,
+        )
+
+
+class S3DjangoURLCache(S3DjangoCache):
+    """Cache of urls of files of Django storages in Django cache.
+
+    Presigned urls are stored for at most half of their expiration time,
+    so that urls from cache stay valid for a while.
+
+    """
+
+    def _make_keys(
+        self,
+        storage: Storage,
+        names: collections.abc.Iterable[str],
+    ) -> dict[str, str]:
+        """Make cache keys for names of files of storage."""
+        # Urls of same file differ for storages with different settings
+        storage_parts = tuple(
+            str(getattr(storage, attr, ""))
+            for attr in (
+                "bucket_name",
+                "location",
+                "custom_domain",
+                "querystring_auth",
+                "querystring_expire",
+            )
+        )
+        return {
+            name: self.make_key("url", *storage_parts, name) for name in names
+        }
+
+    def get_timeout(self, storage: Storage) -> int:
+        """Get time urls of storage are stored in cache."""
+        if not getattr(storage, "querystring_auth", False):
+            return self.timeout
+        return min(self.timeout, storage.querystring_expire // 2)  # type: ignore
+
+    def get_many(
+        self,
+        storage: Storage,
+        names: collections.abc.Iterable[str],
+    ) -> dict[str, str]:
+        """Get cached urls of files, missing files are omitted."""
+        return self.get_entries(self._make_keys(storage, names))
+
+    def set_many(
+        self,
+        storage: Storage,
+        urls: collections.abc.Mapping[str, str],
+    ) -> None:
+        """Store urls of files."""
+        if not urls:
+            return
+        cache_keys = self._make_keys(storage, urls)
+        self.cache.set_many(
+            {cache_keys[name]: url for name, url in urls.items()},
+            timeout=self.get_timeout(storage),
+            version=self.version,
+        )
+
+
+@functools.cache
+def get_metadata_cache() -> S3DjangoMetadataCache | None:
+    """Get metadata cache configured by `SARITASA_S3_TOOLS_CACHE`."""
+    options = getattr(settings, "SARITASA_S3_TOOLS_CACHE", None)
+    if options is None:
+        return None
+    return S3DjangoMetadataCache(**options)
+
+
+@functools.cache
+def get_url_cache() -> S3DjangoURLCache | None:
+    """Get url cache configured by `SARITASA_S3_TOOLS_CACHE`."""
+    options = getattr(settings, "SARITASA_S3_TOOLS_CACHE", None)
+    if options is None:
+        return None
+    return S3DjangoURLCache(**options)
+
+
+@receiver(signals.setting_changed)
+def clear_caches(setting: str, **kwargs) -> None:
+    """Clear configured caches once setting is changed."""
+    if setting == "SARITASA_S3_TOOLS_CACHE":
+        get_metadata_cache.cache_clear()
+        get_url_cache.cache_clear()
@@ -0,0 +1,260 @@
+import collections
+import collections.abc
+import dataclasses
+import datetime
+import heapq
+
+from django.apps import apps
+from django.core.files.storage import Storage
+from django.db import connections, models
+from django.db.models import functions
+from django.utils import timezone
+
+import mypy_boto3_s3
+
+from .. import configs
+from . import model_fields, shortcuts
+
+# Collations which order strings same way as s3 orders keys in listing
+# (by bytes of UTF-8 encoded keys) by database vendors
+binary_collations = {
+    "postgresql": "C",
+    "sqlite": "BINARY",
+    "mysql": "utf8mb4_bin",
+    "oracle": "BINARY",
+}
+
+
+@dataclasses.dataclass
+class S3OrphansCleanupResult:
+    """Result of cleanup of orphaned files of config."""
+
+    config: configs.S3FileTypeConfig
+    storage: Storage
+    # Keys of orphaned files found in bucket
+    found: int = 0
+    # Errors of `DeleteObjects` requests
+    errors: list[mypy_boto3_s3.type_defs.ErrorTypeDef] = dataclasses.field(
+        default_factory=list,
+    )
+
+    @property
+    def deleted(self) -> int:
+        """Get count of deleted files."""
+        return self.found - len(self.errors)
+
+
+def get_s3_fields() -> list[model_fields.S3FileFieldMixin]:
+    """Get s3 file fields of all installed models."""
+    return [
+        field
+        for model in apps.get_models()
+        for field in model._meta.local_concrete_fields
+        if isinstance(field, model_fields.S3FileFieldMixin)
+    ]
+
+
+def get_cleanup_targets(
+    fields: collections.abc.Iterable[model_fields.S3FileFieldMixin],
+) -> dict[
+    tuple[configs.S3FileTypeConfig, Storage],
+    list[model_fields.S3FileFieldMixin],
+]:
+    """Get configs with prefixes used by fields and fields of their storages.
+
+    Files of config can be referenced by any s3 file field of storage (for
+    example, by field without key pattern validation), so fields of
+    storage are checked for all its configs.
+
+    """
+    storage_fields: dict[Storage, list[model_fields.S3FileFieldMixin]] = (
+        collections.defaultdict(list)
+    )
+    for field in fields:
+        storage_fields[field.storage].append(field)  # type: ignore
+    targets: dict[
+        tuple[configs.S3FileTypeConfig, Storage],
+        list[model_fields.S3FileFieldMixin],
+    ] = {}
+    for storage, fields_of_storage in storage_fields.items():
+        for field in fields_of_storage:
+            config = field.s3_config
+            if config is None or getattr(config.key, "prefix", None) is None:
+                continue
+            targets.setdefault((config, storage), fields_of_storage)
+    return targets
+
+
+def iter_referenced_names(
+    fields: collections.abc.Iterable[model_fields.S3FileFieldMixin],
+    prefix: str,
+    chunk_size: int = 2000,
+) -> collections.abc.Iterator[str]:
+    """Iterate over sorted unique names of files under prefix of fields.
+
+    Names are streamed from database in chunks ordered by binary collation,
+    so that they are ordered same way as keys in s3 listing, and merged
+    from all fields.
+
+    """
+    names = heapq.merge(
+        *(
+            _iter_field_names(
+                field=field,
+                prefix=prefix,
+                chunk_size=chunk_size,
+            )
+            for field in fields
+        ),
+    )
+    previous = ""
+    for name in names:
+        if name < previous:
+            raise ValueError(
+                "Names of files are not ordered by database same way as s3 "
+                "keys, check collation of database",
+            )
+        if name != previous:
+            yield name
+        previous = name
+
+
+def check_referenced_names_order(
+    fields: collections.abc.Iterable[model_fields.S3FileFieldMixin],
+    prefix: str,
+    chunk_size: int = 2000,
+) -> None:
+    """Check that database orders names of files same way as s3 keys.
+
+    Names are streamed same way as by `iter_referenced_names`, so memory
+    usage doesn't depend on count of files. Raise `ValueError` if names are
+    not ordered.
+
+    """
+    collections.deque(
+        iter_referenced_names(
+            fields=fields,
+            prefix=prefix,
+            chunk_size=chunk_size,
+        ),
+        maxlen=0,
+    )
+
+
+def _iter_field_names(
+    field: model_fields.S3FileFieldMixin,
+    prefix: str,
+    chunk_size: int,
+) -> collections.abc.Iterator[str]:
+    """Iterate over names of files under prefix of field in binary order."""
+    attname: str = field.attname  # type: ignore
+    queryset = field.model._default_manager.filter(  # type: ignore
+        **{f"{attname}__startswith": f"{prefix}/"},
+    ).exclude(**{attname: ""})
+    vendor = connections[queryset.db].vendor
+    if vendor not in binary_collations:
+        raise ValueError(f"Database {vendor} is not supported")
+    yield from (
+        queryset.order_by(
+            functions.Collate(
+                models.F(attname),
+                binary_collations[vendor],
+            ),
+        )
+        .values_list(attname, flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def iter_orphaned_keys(
+    config: configs.S3FileTypeConfig,
+    storage: Storage,
+    fields: collections.abc.Iterable[model_fields.S3FileFieldMixin],
+    grace_period: datetime.timedelta,
+    chunk_size: int = 2000,
+) -> collections.abc.Iterator[str]:
+    """Iterate over keys of files of config which are not referenced.
+
+    Listing of bucket under prefix of config and referenced names are
+    merged as two sorted streams, so memory usage doesn't depend on count
+    of files. Files modified within grace period are skipped, since their
+    instances may be not saved yet, as well as files which belong to other
+    configs with overlapping prefixes.
+
+    Merge relies on ordering of names, so it's checked by separate pass
+    over names before listing, and `ValueError` is raised before any key is
+    yielded if names are not ordered.
+
+    """
+    prefix: str = config.key.prefix  # type: ignore
+    check_referenced_names_order(
+        fields=fields,
+        prefix=prefix,
+        chunk_size=chunk_size,
+    )
+    listing_prefix = shortcuts.get_s3_key(storage=storage, name=f"{prefix}/")
+    location_prefix = listing_prefix.removesuffix(f"{prefix}/")
+    modified_before = timezone.now() - grace_period
+    names = iter_referenced_names(
+        fields=fields,
+        prefix=prefix,
+        chunk_size=chunk_size,
+    )
+    name = next(names, None)
+    for s3_object in shortcuts.get_s3_client(storage=storage).iter_objects(
+        prefix=listing_prefix,
+    ):
+        key = s3_object["Key"]
+        file_name = key.removeprefix(location_prefix)
+        while name is not None and name < file_name:
+            name = next(names, None)
+        if (
+            file_name == name
+            or s3_object["LastModified"] >= modified_before
+            or configs.S3FileTypeConfig.resolve(file_name) is not config
+        ):
+            continue
+        yield key
+
+
+def delete_orphaned_files(
+    config: configs.S3FileTypeConfig,
+    storage: Storage,
+    fields: collections.abc.Iterable[model_fields.S3FileFieldMixin],
+    grace_period: datetime.timedelta,
+    chunk_size: int = 2000,
+    dry_run: bool = False,
+) -> S3OrphansCleanupResult:
+    """Delete files of config which are not referenced by fields.
+
+    Orphaned keys are deleted in batches while listing goes on. Ordering of
+    names is checked before listing, so nothing is deleted if database
+    orders names differently from s3.
+
+    """
+    result = S3OrphansCleanupResult(config=config, storage=storage)
+
+    def count_keys(
+        keys: collections.abc.Iterable[str],
+    ) -> collections.abc.Iterator[str]:
+        """Count keys while they are consumed."""
+        for key in keys:
+            result.found += 1
+            yield key
+
+    orphaned_keys = count_keys(
+        iter_orphaned_keys(
+            config=config,
+            storage=storage,
+            fields=fields,
+            grace_period=grace_period,
+            chunk_size=chunk_size,
+        ),
+    )
+    if dry_run:
+        collections.deque(orphaned_keys, maxlen=0)
+        return result
+    result.errors = shortcuts.get_s3_client(storage=storage).delete_objects(
+        keys=orphaned_keys,
+    )
+    return result
@@ -1,12 +1,41 @@
+import collections
+import collections.abc
+import functools
 import typing
 import urllib.parse
 
 from django.core import validators
 from django.core.files.storage import Storage, default_storage
+from django.db.models.fields import files
 from rest_framework import fields, serializers
 from rest_framework.utils.formatting import lazy_format
 
 from .. import configs
+from . import cache
+
+# Key of serializer's context where urls of files are cached
+s3_upload_urls_context_key = "s3_upload_urls"
+
+
+@functools.lru_cache(maxsize=1)
+def _build_choices(
+    version: int,
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """Build choices of S3FileTypeConfigField for version of registry.
+
+    Result is shared between all fields, so that fields created per request
+    don't rebuild same choices.
+
+    """
+    grouped_choices = fields.to_choices_dict(
+        configs.S3FileTypeConfig.get_descriptions(),
+    )
+    choices = fields.flatten_choices_dict(grouped_choices)
+    return (
+        grouped_choices,
+        choices,
+        {str(key): key for key in choices},
+    )
 
 
 class S3FileTypeConfigField(serializers.ChoiceField):
@@ -18,22 +47,24 @@ class S3FileTypeConfigField(serializers.ChoiceField):
     """
 
     def __init__(self, **kwargs) -> None:
+        # Version of configs registry choices were built for
+        self.choices_version: int | None = None
         super().__init__(choices=(), **kwargs)
 
     def _get_choices(self) -> dict[str, str]:
-        """Get choices from S3FileTypeConfig."""
-        current_choices = tuple(
+        """Get choices from S3FileTypeConfig.
+
+        Choices are rebuilt only if configs registry has changed.
+
+        """
+        version = configs.S3FileTypeConfig.version
+        if self.choices_version != version:
             (
-                config_name,
-                configs.S3FileTypeConfig.configs[
-                    config_name
-                ].get_short_description(),
-            )
-            for config_name in configs.S3FileTypeConfig.configs
-        )
-        choices = super()._get_choices()
-        if current_choices != choices:
-            self._set_choices(current_choices)
+                self.grouped_choices,
+                self._choices,
+                self.choice_strings_to_values,
+            ) = _build_choices(version)
+            self.choices_version = version
         return super()._get_choices()
 
     def _set_choices(self, choices: tuple[tuple[str, str], ...]) -> None:
@@ -53,6 +84,7 @@ class S3FileTypeConfigField(serializers.ChoiceField):
         self.choice_strings_to_values = {
             str(key): key for key in self._choices
         }
+        self.choices_version = None
 
     choices = property(_get_choices, _set_choices)
 
@@ -142,6 +174,59 @@ class S3UploadURLField(serializers.CharField):
         """Return full file url."""
         if not value:
             return None
+        if (file := self.get_file(value)) is None:
+            return value.url
+        storage, name = file
+        return self.get_url(storage=storage, name=name)
+
+    def get_file(self, value: typing.Any) -> tuple[Storage, str] | None:
+        """Get storage and name of file of value, None if it's unknown."""
         if isinstance(value, str):
-            return self.storage.url(name=value)
-        return value.url
+            return self.storage, value
+        if isinstance(value, files.FieldFile) and value.name:
+            return value.storage, value.name
+        return None
+
+    def get_url(self, storage: Storage, name: str) -> str:
+        """Get url of file.
+
+        Urls are cached in serializer's context, so that same file is
+        presigned only once per serialization.
+
+        """
+        context = self.context
+        cache_urls(context=context, files=((storage, name),))
+        return context[s3_upload_urls_context_key][storage, name]
+
+
+def cache_urls(
+    context: dict[str, typing.Any],
+    files: collections.abc.Iterable[tuple[Storage, str]],
+) -> None:
+    """Generate urls of files and store them in serializer's context.
+
+    If url cache is configured by `SARITASA_S3_TOOLS_CACHE`, urls are read
+    from it for all files of storage at once and only missing ones are
+    generated.
+
+    """
+    urls: dict[tuple[Storage, str], str] = context.setdefault(
+        s3_upload_urls_context_key,
+        {},
+    )
+    missing: dict[Storage, dict[str, None]] = collections.defaultdict(dict)
+    for storage, name in files:
+        if (storage, name) not in urls:
+            missing[storage][name] = None
+    url_cache = cache.get_url_cache()
+    for storage, names in missing.items():
+        cached_urls = url_cache.get_many(storage, names) if url_cache else {}
+        generated_urls = {
+            name: storage.url(name=name)
+            for name in names
+            if name not in cached_urls
+        }
+        if url_cache:
+            url_cache.set_many(storage, generated_urls)
+        for name, url in (cached_urls | generated_urls).items():
+            urls[storage, name] = url
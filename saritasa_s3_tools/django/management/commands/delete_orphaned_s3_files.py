@@ -0,0 +1,89 @@
+import argparse
+import datetime
+import typing
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import cleanup
+
+
+class Command(BaseCommand):
+    """Delete files of s3 configs which are not referenced by models."""
+
+    help = (
+        "Delete files under prefixes of s3 configs used by model fields "
+        "which are not referenced by any s3 file field."
+    )
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Add arguments of command."""
+        parser.add_argument(
+            "--config",
+            action="append",
+            dest="configs",
+            default=[],
+            help="Name of config to clean up, all configs by default.",
+        )
+        parser.add_argument(
+            "--grace-period",
+            type=float,
+            default=24,
+            help="Skip files modified within this period (in hours).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Count of names fetched from database at once.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count orphaned files without deleting them.",
+        )
+
+    def handle(
+        self,
+        *args: typing.Any,
+        configs: list[str],
+        grace_period: float,
+        chunk_size: int,
+        dry_run: bool,
+        **options: typing.Any,
+    ) -> None:
+        """Delete orphaned files of configs."""
+        targets = cleanup.get_cleanup_targets(cleanup.get_s3_fields())
+        unknown_configs = set(configs) - {config.name for config, _ in targets}
+        if unknown_configs:
+            raise CommandError(
+                "Configs are not used by s3 file fields: "
+                f"{', '.join(sorted(unknown_configs))}",
+            )
+        for (config, storage), fields in targets.items():
+            if configs and config.name not in configs:
+                continue
+            try:
+                result = cleanup.delete_orphaned_files(
+                    config=config,
+                    storage=storage,
+                    fields=fields,
+                    grace_period=datetime.timedelta(hours=grace_period),
+                    chunk_size=chunk_size,
+                    dry_run=dry_run,
+                )
+            except ValueError as exception:
+                raise CommandError(str(exception)) from exception
+            if dry_run:
+                self.stdout.write(
+                    f"{config.name}: found {result.found} orphaned files",
+                )
+                continue
+            self.stdout.write(
+                f"{config.name}: deleted {result.deleted} of "
+                f"{result.found} orphaned files",
+            )
+            for error in result.errors:
+                self.stderr.write(
+                    f"{config.name}: failed to delete {error.get('Key')}: "
+                    f"{error.get('Message')}",
+                )
@@ -1,7 +1,12 @@
+import collections
 import collections.abc
+import contextlib
+import contextvars
+import typing
 
 from django.core import exceptions
 from django.core.files import utils
+from django.core.files.storage import Storage
 from django.db import models
 from django.db.models.fields import files
 from django.utils.functional import cached_property
@@ -9,7 +14,179 @@ from django.utils.translation import gettext_lazy as _
 
 import botocore.exceptions
 
-from .. import configs
+from .. import configs, metadata_cache
+from . import shortcuts
+
+# Existence of files checked in bulk by `prefetch_files_existence` by
+# storage and name of file
+files_existence: contextvars.ContextVar[
+    dict[tuple[Storage, str], bool] | None
+] = contextvars.ContextVar("files_existence", default=None)
+
+
+@contextlib.contextmanager
+def prefetch_files_existence(
+    files: collections.abc.Iterable[tuple[Storage, str]],
+    max_workers: int = 10,
+) -> collections.abc.Iterator[None]:
+    """Check existence of files in bulk for validation inside context.
+
+    Existence of files is checked with parallel requests, validators of s3
+    file fields inside context use results of check instead of making
+    request per file.
+
+    """
+    names: dict[Storage, set[str]] = collections.defaultdict(set)
+    for storage, name in files:
+        if name:
+            names[storage].add(name)
+    existence = dict(files_existence.get() or {})
+    for storage, storage_names in names.items():
+        keys: dict[str, str] = {}
+        for name in storage_names:
+            # Invalid names are left for validator to report
+            with contextlib.suppress(exceptions.SuspiciousOperation):
+                keys[name] = shortcuts.get_s3_key(storage=storage, name=name)
+        files_metadata = shortcuts.get_s3_client(
+            storage=storage,
+        ).get_files_metadata(
+            keys=keys.values(),
+            max_workers=max_workers,
+        )
+        for name, key in keys.items():
+            existence[storage, name] = files_metadata[key] is not None
+    token = files_existence.set(existence)
+    try:
+        yield
+    finally:
+        files_existence.reset(token)
+
+
+def full_clean_many(
+    instances: collections.abc.Sequence[models.Model],
+    max_workers: int = 10,
+    **kwargs: typing.Any,
+) -> dict[int, exceptions.ValidationError]:
+    """Call `full_clean` of instances checking existence of files in bulk.
+
+    Return validation errors by indexes of invalid instances.
+
+    """
+    files: list[tuple[Storage, str]] = [
+        (field.storage, str(field.value_from_object(instance)))  # type: ignore
+        for instance in instances
+        for field in instance._meta.fields
+        if isinstance(field, S3FileFieldMixin)
+    ]
+    errors: dict[int, exceptions.ValidationError] = {}
+    with prefetch_files_existence(files=files, max_workers=max_workers):
+        for index, instance in enumerate(instances):
+            try:
+                instance.full_clean(**kwargs)
+            except exceptions.ValidationError as error:
+                errors[index] = error
+    return errors
+
+
+class S3FieldFileMixin:
+    """Mixin for FieldFile which uses prefetched metadata of file.
+
+    Metadata is prefetched by `S3QuerySet.s3_prefetch`, without it file
+    behaves as usual.
+
+    """
+
+    # Whether metadata of file was prefetched
+    is_s3_prefetched = False
+    # Prefetched metadata, None if file is not in bucket
+    s3_metadata: metadata_cache.S3FileMetadata | None = None
+
+    def set_s3_metadata(
+        self,
+        metadata: metadata_cache.S3FileMetadata | None,
+    ) -> None:
+        """Set prefetched metadata of file."""
+        self.is_s3_prefetched = True
+        self.s3_metadata = metadata
+
+    def reset_s3_metadata(self) -> None:
+        """Forget prefetched metadata of file."""
+        self.is_s3_prefetched = False
+        self.s3_metadata = None
+
+    @property
+    def size(self) -> int:
+        """Get size of file, use prefetched metadata if it's present."""
+        if (
+            self.is_s3_prefetched
+            and self._committed  # type: ignore
+            and self.s3_metadata is not None
+        ):
+            return self.s3_metadata["ContentLength"]
+        return super().size  # type: ignore
+
+    def exists(self) -> bool:
+        """Check that file is in bucket."""
+        if self.is_s3_prefetched:
+            return self.s3_metadata is not None
+        return bool(self.name) and self.storage.exists(self.name)  # type: ignore
+
+    def save(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Save file and forget metadata of previous one.
+
+        Cached metadata of saved file is invalidated as well.
+
+        """
+        self.reset_s3_metadata()
+        super().save(*args, **kwargs)  # type: ignore
+        shortcuts.invalidate_files_metadata(
+            storage=self.storage,  # type: ignore
+            names=(self.name,),  # type: ignore
+        )
+
+    def delete(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Delete file and forget its metadata.
+
+        Cached metadata of deleted file is invalidated as well.
+
+        """
+        name = self.name  # type: ignore
+        self.reset_s3_metadata()
+        super().delete(*args, **kwargs)  # type: ignore
+        if name:
+            shortcuts.invalidate_files_metadata(
+                storage=self.storage,  # type: ignore
+                names=(name,),
+            )
+
+
+class S3FieldFile(S3FieldFileMixin, files.FieldFile):
+    """FieldFile of S3FileField."""
+
+
+class S3ImageFieldFile(S3FieldFileMixin, files.ImageFieldFile):
+    """FieldFile of S3ImageField."""
+
+
+class S3FileExistenceValidator:
+    """Validator which checks that file of s3 file field is in bucket.
+
+    Exposes storage which is checked, so that existence of files can be
+    prefetched in bulk (see `S3UploadURLListSerializer`).
+
+    """
+
+    def __init__(self, field: "S3FileFieldMixin") -> None:
+        self.field = field
+
+    @property
+    def storage(self) -> Storage:
+        """Get storage in which file is checked."""
+        return self.field.storage  # type: ignore
+
+    def __call__(self, value: files.FieldFile | str) -> None:
+        """Check that file is present in storage."""
+        self.field._validate_file_existence(value)
 
 
 class S3FileFieldMixin:
@@ -42,7 +219,7 @@ class S3FileFieldMixin:
     ]:
         """Get validators."""
         validators = super().validators  # type: ignore
-        validators.append(self._validate_file_existence)
+        validators.append(S3FileExistenceValidator(field=self))
         if self.validate_key_pattern:
             validators.append(self._validate_key)
         return validators
@@ -75,8 +252,12 @@ class S3FileFieldMixin:
             # Skip if value has reference to actual file
             return  # pragma: no cover
 
+        existence = files_existence.get() or {}
         try:
-            if not self.storage.exists(str(value)):  # type: ignore
+            is_existing = existence.get((self.storage, str(value)))  # type: ignore
+            if is_existing is None:
+                is_existing = self.storage.exists(str(value))  # type: ignore
+            if not is_existing:
                 raise exceptions.ValidationError(
                     _("File does not exist."),
                 )
@@ -117,6 +298,10 @@ class S3FileFieldMixin:
 class S3FileField(S3FileFieldMixin, models.FileField):
     """FileField with S3 capabilities."""
 
+    attr_class = S3FieldFile
+
 
 class S3ImageField(S3FileFieldMixin, models.ImageField):
     """FileField with S3 capabilities."""
+
+    attr_class = S3ImageFieldFile
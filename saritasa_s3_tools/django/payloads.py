@@ -0,0 +1,91 @@
+import dataclasses
+import functools
+import hashlib
+import typing
+
+from django import http
+from django.utils import cache
+from rest_framework import renderers
+
+from .. import configs
+from . import serializers
+
+
+@dataclasses.dataclass(frozen=True)
+class S3ConfigsPayload:
+    """Pre-rendered payload of configs response."""
+
+    # Serialized data of response
+    data: typing.Any
+    # Data rendered to json
+    content: bytes
+    # Strong ETag of rendered content
+    etag: str
+
+    @classmethod
+    def from_data(cls, data: typing.Any) -> "S3ConfigsPayload":
+        """Render data and calculate its ETag."""
+        content = renderers.JSONRenderer().render(data)
+        return cls(
+            data=data,
+            content=content,
+            etag=f'"{hashlib.sha256(content).hexdigest()}"',
+        )
+
+    def get_not_modified_response(
+        self,
+        request: http.HttpRequest,
+    ) -> http.HttpResponseBase | None:
+        """Get `304` response if client has payload in cache."""
+        return cache.get_conditional_response(request, etag=self.etag)
+
+
+@dataclasses.dataclass(frozen=True)
+class S3ConfigsPayloads:
+    """Pre-rendered payloads of configs for version of registry."""
+
+    version: int
+    # Payload of list of all configs
+    configs_list: S3ConfigsPayload
+    # Payloads of configs by their names
+    configs: dict[str, S3ConfigsPayload]
+
+
+def get_configs_payloads() -> S3ConfigsPayloads:
+    """Get pre-rendered payloads of registered configs.
+
+    Payloads are rendered once and re-rendered only when new config is
+    registered.
+
+    """
+    return _render_configs_payloads(configs.S3FileTypeConfig.version)
+
+
+@functools.lru_cache(maxsize=1)
+def _render_configs_payloads(version: int) -> S3ConfigsPayloads:
+    """Render payloads of configs for version of registry."""
+    configs_payloads = {
+        name: S3ConfigsPayload.from_data(
+            serializers.S3ConfigSerializer(instance=config).data,
+        )
+        for name, config in configs.S3FileTypeConfig.configs.items()
+    }
+    return S3ConfigsPayloads(
+        version=version,
+        configs_list=S3ConfigsPayload.from_data(
+            [payload.data for payload in configs_payloads.values()],
+        ),
+        configs=configs_payloads,
+    )
+
+
+def patch_configs_response(
+    response: http.HttpResponseBase,
+    payload: S3ConfigsPayload,
+    cache_control: dict[str, typing.Any],
+) -> http.HttpResponseBase:
+    """Set caching headers of payload to response."""
+    response.headers["ETag"] = payload.etag
+    cache.patch_cache_control(response, **cache_control)
+    cache.patch_vary_headers(response, ("Accept",))
+    return response
@@ -0,0 +1,87 @@
+import collections
+import collections.abc
+import typing
+
+from django.core.files.storage import Storage
+from django.db import models
+
+from . import model_fields, shortcuts
+
+
+def prefetch_s3_metadata(
+    instances: collections.abc.Iterable[models.Model],
+    fields: collections.abc.Sequence[str],
+    max_workers: int = 10,
+) -> None:
+    """Prefetch metadata of files of instances in bulk.
+
+    Metadata is requested in parallel for all files of storage at once and
+    attached to files, so that later `size` and `exists` calls of files
+    don't make requests to s3.
+
+    """
+    field_files: dict[Storage, list[model_fields.S3FieldFileMixin]] = (
+        collections.defaultdict(list)
+    )
+    for instance in instances:
+        for field in fields:
+            field_file = getattr(instance, field)
+            if not isinstance(field_file, model_fields.S3FieldFileMixin):
+                raise ValueError(  # noqa: TRY004
+                    f"{field} is not S3FileField or S3ImageField",
+                )
+            if field_file:
+                field_files[field_file.storage].append(  # type: ignore
+                    field_file,
+                )
+    for storage, storage_field_files in field_files.items():
+        keys = [
+            shortcuts.get_s3_key(storage=storage, name=field_file.name)  # type: ignore
+            for field_file in storage_field_files
+        ]
+        files_metadata = shortcuts.get_s3_client(
+            storage=storage,
+        ).get_files_metadata(
+            keys=keys,
+            max_workers=max_workers,
+        )
+        for key, field_file in zip(keys, storage_field_files, strict=True):
+            field_file.set_s3_metadata(files_metadata[key])
+
+
+class S3QuerySet[ModelT: models.Model](models.QuerySet[ModelT]):
+    """QuerySet which can prefetch metadata of s3 files of instances."""
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._s3_prefetch_fields: tuple[str, ...] = ()
+        self._s3_prefetch_done = False
+
+    def s3_prefetch(self, *fields: str) -> typing.Self:
+        """Prefetch metadata of files of fields on evaluation."""
+        clone = self._chain()  # type: ignore
+        clone._s3_prefetch_fields = (*self._s3_prefetch_fields, *fields)
+        return clone
+
+    def _clone(self) -> typing.Self:
+        """Copy fields to prefetch to clone."""
+        clone = super()._clone()  # type: ignore
+        clone._s3_prefetch_fields = self._s3_prefetch_fields
+        return clone
+
+    def _fetch_all(self) -> None:
+        """Prefetch metadata of files once results are fetched."""
+        super()._fetch_all()  # type: ignore
+        if (
+            self._s3_prefetch_fields
+            and not self._s3_prefetch_done
+            and issubclass(self._iterable_class, models.query.ModelIterable)  # type: ignore
+        ):
+            prefetch_s3_metadata(
+                instances=self._result_cache,  # type: ignore
+                fields=self._s3_prefetch_fields,
+            )
+            self._s3_prefetch_done = True
+
+
+S3Manager = models.Manager.from_queryset(S3QuerySet)
@@ -1,12 +1,60 @@
+import collections.abc
+import contextlib
+import functools
+import itertools
 import typing
 
 import humanize
 from django.conf import settings
+from django.core import signals
+from django.core.files.storage import Storage
 from django.db import models
+from django.dispatch import receiver
 from rest_framework import exceptions, request, serializers
 
-from .. import configs, constants
-from . import drf_fields
+from .. import client, configs, constants
+from . import drf_fields, model_fields
+
+
+@functools.cache
+def get_upload_params_fields() -> tuple[str, ...]:
+    """Get names of upload params which are shown in api."""
+    return tuple(
+        getattr(
+            settings,
+            "SARITASA_S3_TOOLS_UPLOAD_PARAMS",
+            constants.s3v4_signature_fields,
+        ),
+    )
+
+
+@receiver(signals.setting_changed)
+def clear_upload_params_fields(setting: str, **kwargs) -> None:
+    """Clear cached upload params fields once setting is changed."""
+    if setting == "SARITASA_S3_TOOLS_UPLOAD_PARAMS":
+        get_upload_params_fields.cache_clear()
+
+
+def serialize_upload_params(
+    params: client.S3UploadParams,
+) -> dict[str, typing.Any]:
+    """Serialize upload params same way as S3UploadSerializer does.
+
+    Fast path for views, which builds data right from params without
+    instantiating serializers.
+
+    """
+    return {
+        "url": params.url,
+        "params": {
+            field: (
+                None
+                if (value := params.params.get(field)) is None
+                else str(value)
+            )
+            for field in get_upload_params_fields()
+        },
+    }
 
 
 class S3FieldsConfigMixin:
@@ -31,6 +79,78 @@ class S3FieldsConfigMixin:
         return serializer_field_mapping
 
 
+class S3UploadURLListSerializer(serializers.ListSerializer):
+    """List serializer which presigns urls of files of all items at once.
+
+    Before items are represented, urls for `S3UploadURLField` fields of
+    all items are generated in one pass. Urls are cached in context, so
+    each file is presigned once even if it's referenced by several items,
+    and representation of items just takes ready urls.
+
+    Set it as `list_serializer_class` in serializer's `Meta`.
+
+    """
+
+    def to_representation(self, data: typing.Any) -> list[typing.Any]:
+        """Presign urls of files and represent items."""
+        items = list(
+            data.all()
+            if isinstance(data, models.manager.BaseManager)
+            else data,
+        )
+        self.prefetch_urls(items)
+        return super().to_representation(items)
+
+    def to_internal_value(self, data: typing.Any) -> list[typing.Any]:
+        """Validate items checking existence of their files in bulk."""
+        with model_fields.prefetch_files_existence(self.get_files(data)):
+            return super().to_internal_value(data)
+
+    def get_files(
+        self,
+        data: typing.Any,
+    ) -> collections.abc.Iterator[tuple[Storage, str]]:
+        """Get files of items which existence is validated."""
+        if not isinstance(data, list):
+            return
+        for field in self.child.fields.values():  # type: ignore
+            if not isinstance(field, drf_fields.S3UploadURLField):
+                continue
+            storages = [
+                validator.storage
+                for validator in field.validators
+                if isinstance(validator, model_fields.S3FileExistenceValidator)
+            ]
+            for item, storage in itertools.product(data, storages):
+                value = (
+                    item.get(field.field_name)
+                    if isinstance(item, collections.abc.Mapping)
+                    else None
+                )
+                if not value:
+                    continue
+                with contextlib.suppress(exceptions.ValidationError):
+                    yield storage, field.to_internal_value(value)
+
+    def prefetch_urls(self, items: list[typing.Any]) -> None:
+        """Generate urls for files of items."""
+        url_fields = [
+            field
+            for field in self.child.fields.values()  # type: ignore
+            if isinstance(field, drf_fields.S3UploadURLField)
+            and not field.write_only
+        ]
+        files: list[tuple[Storage, str]] = []
+        for item, field in itertools.product(items, url_fields):
+            try:
+                value = field.get_attribute(item)
+            except (serializers.SkipField, AttributeError, KeyError):
+                continue
+            if value and (file := field.get_file(value)) is not None:
+                files.append(file)
+        drf_fields.cache_urls(context=self.context, files=files)
+
+
 class S3RequestParamsSerializer(serializers.Serializer):
     """Serializer for validation s3 uploading fields."""
 
@@ -49,18 +169,30 @@ class S3RequestParamsSerializer(serializers.Serializer):
         super().__init__(*args, **kwargs)
         self._request: request.Request | None = context_request
         self._user = getattr(self._request, "user", None)
+        # Results of configs' auth checks by names of configs, with
+        # `many=True` same serializer validates all items, so `auth` of each
+        # config is called only once
+        self._auth_results: dict[str, bool] = {}
 
     def validate_config(
         self,
         config: configs.S3FileTypeConfig,
     ) -> configs.S3FileTypeConfig:
         """Check that user can use dest."""
-        if config.auth and not config.auth(self._user):
+        if not self.check_config_auth(config):
             raise exceptions.ValidationError(
                 "Current user can't use this destination",
             )
         return config
 
+    def check_config_auth(self, config: configs.S3FileTypeConfig) -> bool:
+        """Check that user passes config's auth."""
+        if config.name not in self._auth_results:
+            self._auth_results[config.name] = not config.auth or config.auth(
+                self._user,
+            )
+        return self._auth_results[config.name]
+
     def validate(self, attrs: dict[str, typing.Any]) -> dict[str, typing.Any]:
         """Perform validations.
 
@@ -106,12 +238,7 @@ class S3ParamsSerializer(serializers.Serializer):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        fields = getattr(
-            settings,
-            "SARITASA_S3_TOOLS_UPLOAD_PARAMS",
-            constants.s3v4_signature_fields,
-        )
-        for field in fields:
+        for field in get_upload_params_fields():
             self.fields[field] = serializers.CharField(
                 label=field,
                 required=False,
@@ -1,11 +1,149 @@
-from django.core.files.storage import default_storage
+import collections.abc
+import contextlib
+import functools
+
+from django.conf import DEFAULT_STORAGE_ALIAS, settings
+from django.core import signals
+from django.core.exceptions import SuspiciousOperation
+from django.core.files.storage import (
+    InvalidStorageError,
+    Storage,
+    default_storage,
+    storages,
+)
+from django.dispatch import receiver
+from storages.utils import clean_name, safe_join
 
 from .. import client
+from . import cache
+
+with contextlib.suppress(ImportError):
+    from .. import async_client
+
+
+def get_s3_client(
+    storage: Storage | str = DEFAULT_STORAGE_ALIAS,
+) -> client.S3Client:
+    """Get s3 client based on Django storage or its alias.
+
+    Clients of storages from `STORAGES` are created once per process and
+    reused till settings are changed. Client uses metadata cache configured
+    by `SARITASA_S3_TOOLS_CACHE`.
+
+    """
+    alias = storage if isinstance(storage, str) else get_storage_alias(storage)
+    if alias is None:
+        return _create_s3_client(storage)  # type: ignore
+    return _get_storage_s3_client(alias)
+
+
+def get_async_s3_client(
+    storage: Storage | str = DEFAULT_STORAGE_ALIAS,
+) -> "async_client.AsyncS3Client":
+    """Get async s3 client based on Django storage or its alias.
+
+    Same as `get_s3_client`, but for async client.
+
+    """
+    alias = storage if isinstance(storage, str) else get_storage_alias(storage)
+    if alias is None:
+        return _create_async_s3_client(storage)  # type: ignore
+    return _get_storage_async_s3_client(alias)
+
+
+def get_storage_alias(storage: Storage) -> str | None:
+    """Get alias of storage in `STORAGES`, None if it's not from there."""
+    if storage is default_storage:
+        return DEFAULT_STORAGE_ALIAS
+    return _get_storages_aliases().get(id(storage))
+
+
+@functools.cache
+def _get_storages_aliases() -> dict[int, str]:
+    """Get aliases of storages from `STORAGES` by ids of storages.
+
+    Storages are instantiated once, till settings of storages are changed.
+
+    """
+    # Storages are kept alive by `storages` handler, so their ids are stable
+    aliases: dict[int, str] = {}
+    for alias in settings.STORAGES:
+        with contextlib.suppress(InvalidStorageError):
+            aliases.setdefault(id(storages[alias]), alias)
+    return aliases
+
 
+@functools.cache
+def _get_storage_s3_client(alias: str) -> client.S3Client:
+    """Get s3 client of storage by its alias."""
+    return _create_s3_client(storages[alias])
 
-def get_s3_client() -> client.S3Client:
-    """Get s3 client based on Django default storage."""
+
+@functools.cache
+def _get_storage_async_s3_client(alias: str) -> "async_client.AsyncS3Client":
+    """Get async s3 client of storage by its alias."""
+    return _create_async_s3_client(storages[alias])
+
+
+def _create_s3_client(storage: Storage) -> client.S3Client:
+    """Create s3 client for storage."""
     return client.S3Client(
-        boto3_client=default_storage.connection.meta.client,  # type: ignore
-        default_bucket=default_storage.bucket_name,  # type: ignore
+        boto3_client=storage.connection.meta.client,  # type: ignore
+        default_bucket=storage.bucket_name,  # type: ignore
+        metadata_cache=cache.get_metadata_cache(),
+    )
+
+
+def _create_async_s3_client(storage: Storage) -> "async_client.AsyncS3Client":
+    """Create async s3 client for storage."""
+    return async_client.AsyncS3Client(
+        boto3_client=storage.connection.meta.client,  # type: ignore
+        default_bucket=storage.bucket_name,  # type: ignore
+        metadata_cache=cache.get_metadata_cache(),
+    )
+
+
+def clear_s3_clients() -> None:
+    """Clear s3 clients of storages, they will be created on next use."""
+    _get_storages_aliases.cache_clear()
+    _get_storage_s3_client.cache_clear()
+    _get_storage_async_s3_client.cache_clear()
+
+
+@receiver(signals.setting_changed)
+def clear_s3_clients_on_setting_changed(setting: str, **kwargs) -> None:
+    """Clear s3 clients once settings of storages are changed."""
+    if setting in ("STORAGES", "SARITASA_S3_TOOLS_CACHE") or (
+        setting.startswith("AWS_")
+    ):
+        clear_s3_clients()
+
+
+def get_s3_key(storage: Storage, name: str) -> str:
+    """Get s3 key of file of storage, same as storage uses for requests.
+
+    Key is name of file joined with `location` of storage, names outside of
+    location are rejected same way as storage does.
+
+    """
+    try:
+        return safe_join(
+            getattr(storage, "location", ""),
+            clean_name(name),
+        )
+    except ValueError as error:
+        raise SuspiciousOperation(
+            f"Attempted access to '{name}' denied.",
+        ) from error
+
+
+def invalidate_files_metadata(
+    storage: Storage,
+    names: collections.abc.Iterable[str],
+) -> None:
+    """Remove metadata of files of storage from metadata cache."""
+    if cache.get_metadata_cache() is None:
+        return
+    get_s3_client(storage=storage).invalidate_metadata(
+        keys=[get_s3_key(storage=storage, name=name) for name in names],
     )
@@ -0,0 +1,35 @@
+import typing
+
+from storages.backends import s3
+
+from . import shortcuts
+
+
+class S3MetadataCacheStorageMixin:
+    """Mixin for s3 storages which invalidates cached metadata of files.
+
+    Metadata of files saved or deleted via storage is removed from cache
+    configured by `SARITASA_S3_TOOLS_CACHE`.
+
+    """
+
+    def _save(self, name: str, content: typing.Any) -> str:
+        """Save file and invalidate its cached metadata."""
+        name = super()._save(name, content)  # type: ignore
+        shortcuts.invalidate_files_metadata(
+            storage=self,  # type: ignore
+            names=(name,),
+        )
+        return name
+
+    def delete(self, name: str) -> None:
+        """Delete file and invalidate its cached metadata."""
+        super().delete(name)  # type: ignore
+        shortcuts.invalidate_files_metadata(
+            storage=self,  # type: ignore
+            names=(name,),
+        )
+
+
+class S3Storage(S3MetadataCacheStorageMixin, s3.S3Storage):
+    """S3 storage which invalidates cached metadata of files."""
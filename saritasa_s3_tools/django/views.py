@@ -1,19 +1,20 @@
 import contextlib
-import dataclasses
 import typing
 
+from django import http
 from rest_framework import (
     decorators,
     exceptions,
     permissions,
+    renderers,
     response,
     status,
     viewsets,
 )
 from rest_framework.request import Request
 
-from .. import client, configs
-from . import serializers, shortcuts
+from .. import client
+from . import payloads, serializers, shortcuts
 
 
 class S3GetParamsView(viewsets.GenericViewSet):
@@ -32,6 +33,13 @@ class S3GetParamsView(viewsets.GenericViewSet):
     # This will work because `filter_backends` is empty for
     # this viewset.
     queryset = ()
+    # Cache-Control directives of configs responses. Configs don't change
+    # between deploys, so clients can revalidate them cheaply via ETag.
+    configs_cache_control: typing.ClassVar[dict[str, typing.Any]] = {
+        "no_cache": True,
+    }
+    # Max amount of files params can be requested for in one batch
+    batch_max_size = 100
 
     @decorators.action(
         methods=["POST"],
@@ -60,16 +68,56 @@ class S3GetParamsView(viewsets.GenericViewSet):
         serializer.is_valid(raise_exception=True)
         s3_client = self.get_s3_client()
         params = s3_client.generate_params(
-            filename=serializer.data["filename"],  # type: ignore
-            config=serializer.data["config"],  # type: ignore
-            content_type=serializer.data["content_type"],  # type: ignore
+            filename=serializer.validated_data["filename"],
+            config=serializer.validated_data["config"],
+            content_type=serializer.validated_data["content_type"],
             extra_metadata=self.get_extra_meta_data(user=request.user),
         )
         return response.Response(
             status=status.HTTP_200_OK,
-            data=serializers.S3UploadSerializer(
-                instance=dataclasses.asdict(params),
-            ).data,
+            data=serializers.serialize_upload_params(params),
+        )
+
+    @decorators.action(
+        methods=["POST"],
+        url_path="get-params-batch",
+        url_name="get-params-batch",
+        detail=False,
+    )
+    def get_params_batch(
+        self,
+        request: Request,
+    ) -> response.Response:
+        """Get parameters for upload of several files to S3 bucket.
+
+        Same as `get-params`, but accepts list of files and returns list of
+        params in same order, so that several files could be uploaded after
+        one request.
+
+        """
+        serializer = self.serializer_class(
+            context_request=request,
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.batch_max_size,
+        )
+        serializer.is_valid(raise_exception=True)
+        s3_client = self.get_s3_client()
+        extra_metadata = self.get_extra_meta_data(user=request.user)
+        return response.Response(
+            status=status.HTTP_200_OK,
+            data=[
+                serializers.serialize_upload_params(
+                    s3_client.generate_params(
+                        filename=item["filename"],
+                        config=item["config"],
+                        content_type=item["content_type"],
+                        extra_metadata=extra_metadata,
+                    ),
+                )
+                for item in serializer.validated_data
+            ],
         )
 
     @decorators.action(
@@ -81,17 +129,11 @@ class S3GetParamsView(viewsets.GenericViewSet):
     def list_configs(
         self,
         request: Request,
-    ) -> response.Response:
+    ) -> http.HttpResponseBase:
         """List all configs for s3 upload."""
-        return response.Response(
-            status=status.HTTP_200_OK,
-            data=serializers.S3ConfigSerializer(
-                instance=map(
-                    dataclasses.asdict,
-                    configs.S3FileTypeConfig.configs.values(),
-                ),
-                many=True,
-            ).data,
+        return self.get_configs_response(
+            request=request,
+            payload=payloads.get_configs_payloads().configs_list,
         )
 
     @decorators.action(
@@ -104,17 +146,45 @@ class S3GetParamsView(viewsets.GenericViewSet):
         self,
         request: Request,
         name: str,
-    ) -> response.Response:
+    ) -> http.HttpResponseBase:
         """Retrieve config for s3 upload."""
-        if name not in configs.S3FileTypeConfig.configs:
+        payload = payloads.get_configs_payloads().configs.get(name)
+        if payload is None:
             raise exceptions.NotFound
-        return response.Response(
-            status=status.HTTP_200_OK,
-            data=serializers.S3ConfigSerializer(
-                instance=dataclasses.asdict(
-                    configs.S3FileTypeConfig.configs[name],
-                ),
-            ).data,
+        return self.get_configs_response(request=request, payload=payload)
+
+    def get_configs_response(
+        self,
+        request: Request,
+        payload: payloads.S3ConfigsPayload,
+    ) -> http.HttpResponseBase:
+        """Get response for pre-rendered configs payload.
+
+        Respond with `304` if client already has payload. Payload is
+        pre-rendered to plain json, so it's served as is only if response
+        should be rendered same way, other representations (like browsable
+        api) are rendered as usual without ETag.
+
+        """
+        renderer = request.accepted_renderer
+        # Subclasses of renderer or media type params (like `indent`) may
+        # change rendered content
+        if (
+            type(renderer) is not renderers.JSONRenderer
+            or request.accepted_media_type != renderer.media_type
+        ):
+            return response.Response(
+                status=status.HTTP_200_OK,
+                data=payload.data,
+            )
+        return payloads.patch_configs_response(
+            response=payload.get_not_modified_response(request)
+            or http.HttpResponse(
+                payload.content,
+                content_type=renderer.media_type,
+            ),
+            payload=payload,
+            cache_control=self.configs_cache_control,
         )
 
     def get_s3_client(self) -> client.S3Client:
@@ -139,6 +209,10 @@ with contextlib.suppress(ImportError):
             request=serializers.S3RequestParamsSerializer,
             responses=serializers.S3UploadSerializer,
         ),
+        get_params_batch=drf_spectacular.utils.extend_schema(
+            request=serializers.S3RequestParamsSerializer(many=True),
+            responses=serializers.S3UploadSerializer(many=True),
+        ),
         list_configs=drf_spectacular.utils.extend_schema(
             responses=serializers.S3ConfigSerializer(many=True),
         ),
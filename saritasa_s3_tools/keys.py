@@ -1,14 +1,48 @@
 import abc
+import collections.abc
+import datetime
+import functools
+import hashlib
+import os
 import pathlib
 import re
+import time
 import unicodedata
 import uuid
 
 
+def uuid7(timestamp: datetime.datetime | None = None) -> uuid.UUID:
+    """Generate time-ordered UUID version 7.
+
+    First 48 bits are unix timestamp in milliseconds, so uuids generated
+    later are greater both as numbers and as strings.
+    https://www.rfc-editor.org/rfc/rfc9562#name-uuid-version-7
+
+    """
+    milliseconds = (
+        int(timestamp.timestamp() * 1000)
+        if timestamp
+        else time.time_ns() // 1_000_000
+    )
+    value = (milliseconds & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10)) & ~(0xF << 76 | 0x3 << 62)
+    value |= 0x7 << 76 | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+def get_uuid7_lower_bound(timestamp: datetime.datetime) -> uuid.UUID:
+    """Get smallest UUID version 7 which could be generated at timestamp."""
+    milliseconds = int(timestamp.timestamp() * 1000)
+    return uuid.UUID(
+        int=(milliseconds & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | 0x2 << 62,
+    )
+
+
 class S3Key:
     """Base class for s3 keys."""
 
     uuid_regex = r"[\d|\w]{8}-[\d|\w]{4}-[\d|\w]{4}-[\d|\w]{4}-[\d|\w]{12}"
+    sha256_regex = r"[0-9a-f]{64}"
 
     @abc.abstractmethod
     def __call__(self, filename: str | None) -> str:
@@ -58,9 +92,30 @@ class S3Key:
 
         return f"{path}{ext}"
 
+    def get_pattern(self) -> str:
+        """Get regex pattern of keys, empty pattern matches any key."""
+        return ""
+
+    @functools.cached_property
+    def pattern(self) -> re.Pattern[str]:
+        """Get compiled regex pattern of keys.
+
+        Pattern is compiled once per key instance, so validation of huge
+        amount of keys doesn't spend time on building regex.
+
+        """
+        return re.compile(self.get_pattern())
+
     def validate(self, key: str) -> bool:
         """Check that input key is matching Key pattern."""
-        return True  # pragma: no cover
+        return bool(self.pattern.match(key))
+
+    def validate_many(
+        self,
+        keys: collections.abc.Iterable[str],
+    ) -> list[bool]:
+        """Check that input keys are matching Key pattern."""
+        return [self.validate(key) for key in keys]
 
 
 class WithPrefixUUIDFileName(S3Key):
@@ -81,13 +136,9 @@ class WithPrefixUUIDFileName(S3Key):
             return f"{self.prefix}/{uuid.uuid4()}.incorrect"
         return f"{self.prefix}/{self.get_random_filename(filename)}"
 
-    def validate(self, key: str) -> bool:
-        """Check that input key is matching Key pattern."""
-        return bool(
-            re.compile(pattern=rf"{self.prefix}/{self.uuid_regex}\..+").match(
-                key,
-            ),
-        )
+    def get_pattern(self) -> str:
+        """Get regex pattern of keys."""
+        return rf"{re.escape(self.prefix)}/{self.uuid_regex}\..+"
 
 
 class WithPrefixUUIDFolder(S3Key):
@@ -108,12 +159,171 @@ class WithPrefixUUIDFolder(S3Key):
             return f"{self.prefix}/{uuid.uuid4()}/{uuid.uuid4()}.incorrect"
         return f"{self.prefix}/{uuid.uuid4()}/{self.clean_filename(filename)}"
 
+    def get_pattern(self) -> str:
+        """Get regex pattern of keys."""
+        return rf"{re.escape(self.prefix)}/{self.uuid_regex}/.+\..+"
+
+
+class WithPrefixContentHashFileName(S3Key):
+    """Generate S3 key with prefix folder and sha256 of content as filename.
+
+    Identical files get identical keys, so `S3Client.upload_file` uploads
+    such file only once. If content is unknown (for example when upload
+    params are generated for frontend), uuid is used as filename instead,
+    so such keys never pass for content addresses.
+
+    Example:
+    -------
+        prefix/{SHA256.extension}
+        prefix/{UUID.extension}
+
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix.removesuffix("/")
+
+    def __call__(
+        self,
+        filename: str | None,
+        content_hash: str | None = None,
+    ) -> str:
+        """Return prefixed S3 key."""
+        if content_hash is not None and not re.fullmatch(
+            self.sha256_regex,
+            content_hash,
+        ):
+            raise ValueError(f"{content_hash} is not sha256 hex digest")
+        name = content_hash or str(uuid.uuid4())
+        if not filename:
+            return f"{self.prefix}/{name}.incorrect"
+        ext = pathlib.Path(filename).suffix.lower()
+        return f"{self.prefix}/{name}{ext}"
+
+    def get_pattern(self) -> str:
+        """Get regex pattern of keys."""
+        return (
+            rf"{re.escape(self.prefix)}/"
+            rf"(?:{self.sha256_regex}|{self.uuid_regex})\..+"
+        )
+
+    def get_content_hash(self, key: str) -> str | None:
+        """Get sha256 of content from key, None if content was unknown."""
+        match = re.fullmatch(
+            rf"{re.escape(self.prefix)}/({self.sha256_regex})\..+",
+            key,
+        )
+        return match.group(1) if match else None
+
+
+class WithPrefixShardUUIDFolder(S3Key):
+    """Generate S3 key with prefix folder, shard folder and uuid folder.
+
+    Shard is derived from hash of uuid, so keys are evenly spread between
+    `16 ** shard_length` prefixes. s3 scales request rate per prefix, so
+    this helps to avoid `SlowDown` errors on high upload rates.
+
+    Example:
+    -------
+        prefix/{SHARD}/{UUID}/filename
+
+    """
+
+    def __init__(self, prefix: str, shard_length: int = 2) -> None:
+        self.prefix = prefix.removesuffix("/")
+        self.shard_length = shard_length
+
+    def get_shard(self, value: str) -> str:
+        """Get shard for value."""
+        return hashlib.sha256(value.encode()).hexdigest()[: self.shard_length]
+
+    def get_shard_prefixes(self) -> list[str]:
+        """Get all shard prefixes.
+
+        Use it to list or clean up files of all shards in parallel.
+
+        """
+        return [
+            f"{self.prefix}/{shard:0{self.shard_length}x}/"
+            for shard in range(16**self.shard_length)
+        ]
+
+    def __call__(self, filename: str | None) -> str:
+        """Create key for destination using filename."""
+        folder = str(uuid.uuid4())
+        shard = self.get_shard(folder)
+        if not filename:
+            return f"{self.prefix}/{shard}/{folder}/{uuid.uuid4()}.incorrect"
+        return (
+            f"{self.prefix}/{shard}/{folder}/{self.clean_filename(filename)}"
+        )
+
+    def get_pattern(self) -> str:
+        """Get regex pattern of keys."""
+        return (
+            rf"{re.escape(self.prefix)}/"
+            rf"(?P<shard>[0-9a-f]{{{self.shard_length}}})/"
+            rf"(?P<folder>{self.uuid_regex})/.+\..+"
+        )
+
     def validate(self, key: str) -> bool:
         """Check that input key is matching Key pattern."""
+        match = self.pattern.match(key)
         return bool(
-            re.compile(
-                pattern=rf"{self.prefix}/{self.uuid_regex}/.+\..+",
-            ).match(
-                key,
-            ),
+            match and match["shard"] == self.get_shard(match["folder"]),
         )
+
+
+class UUIDv7KeyMixin:
+    """Mixin for keys which start with time-ordered uuid after prefix."""
+
+    prefix: str
+    uuid_regex = (
+        r"[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
+    )
+
+    def get_start_after(self, since: datetime.datetime) -> str:
+        """Get key after which all keys generated since timestamp are.
+
+        Use it as `StartAfter` for listing of objects.
+
+        """
+        return f"{self.prefix}/{get_uuid7_lower_bound(since)}"
+
+
+class WithPrefixUUIDv7FileName(UUIDv7KeyMixin, WithPrefixUUIDFileName):
+    """Generate S3 key with prefix folder and time-ordered uuid filename.
+
+    Keys are sorted by time of generation, so keys of files uploaded after
+    some moment can be listed without full scan of prefix.
+
+    Example:
+    -------
+        prefix/{UUIDv7.extension}
+
+    """
+
+    def __call__(self, filename: str | None) -> str:
+        """Return prefixed S3 key."""
+        if not filename:
+            return f"{self.prefix}/{uuid7()}.incorrect"
+        ext = pathlib.Path(filename).suffix.lower()
+        return f"{self.prefix}/{uuid7()}{ext}"
+
+
+class WithPrefixUUIDv7Folder(UUIDv7KeyMixin, WithPrefixUUIDFolder):
+    """Generate S3 key with prefix folder and time-ordered uuid folder.
+
+    Keys are sorted by time of generation, so keys of files uploaded after
+    some moment can be listed without full scan of prefix.
+
+    Example:
+    -------
+        prefix/{UUIDv7}/filename
+
+    """
+
+    def __call__(self, filename: str | None) -> str:
+        """Create key for destination using filename."""
+        if not filename:
+            return f"{self.prefix}/{uuid7()}/{uuid.uuid4()}.incorrect"
+        return f"{self.prefix}/{uuid7()}/{self.clean_filename(filename)}"
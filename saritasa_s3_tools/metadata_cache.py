@@ -0,0 +1,68 @@
+import collections.abc
+import datetime
+import typing
+
+import mypy_boto3_s3
+
+
+class S3CachedMetadata(typing.TypedDict, total=False):
+    """Metadata of file which is stored in cache."""
+
+    ContentLength: int
+    ContentType: str
+    ContentEncoding: str
+    ContentDisposition: str
+    ETag: str
+    LastModified: datetime.datetime
+    Metadata: dict[str, str]
+
+
+# Metadata of file returned by `S3Client`, it's compact if it's read from
+# cache
+type S3FileMetadata = (
+    mypy_boto3_s3.type_defs.HeadObjectOutputTypeDef | S3CachedMetadata
+)
+# Fields of file's metadata which are stored in cache
+cached_metadata_fields = tuple(S3CachedMetadata.__annotations__)
+
+
+class S3MetadataCache(typing.Protocol):
+    """Protocol for shared caches of files' metadata of `S3Client`.
+
+    Client reads metadata through cache and invalidates entries of files it
+    writes, copies or deletes.
+
+    """
+
+    def get_many(
+        self,
+        bucket: str,
+        keys: collections.abc.Sequence[str],
+    ) -> dict[str, S3CachedMetadata]:
+        """Get cached metadata of files, missing files are omitted."""
+
+    def set_many(
+        self,
+        bucket: str,
+        metadata: collections.abc.Mapping[str, S3CachedMetadata],
+    ) -> None:
+        """Store metadata of files."""
+
+    def delete_many(
+        self,
+        bucket: str,
+        keys: collections.abc.Sequence[str],
+    ) -> None:
+        """Remove metadata of files."""
+
+
+def compact_metadata(metadata: S3FileMetadata) -> S3CachedMetadata:
+    """Leave only fields of metadata which are stored in cache."""
+    return typing.cast(
+        S3CachedMetadata,
+        {
+            field: metadata[field]  # type: ignore
+            for field in cached_metadata_fields
+            if field in metadata
+        },
+    )
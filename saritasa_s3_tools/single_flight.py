@@ -0,0 +1,45 @@
+import collections.abc
+import concurrent.futures
+import threading
+
+
+class SingleFlight[ResultT]:
+    """Merge identical concurrent calls into one.
+
+    First caller of key runs function, callers which come while it's
+    running wait for it and share its result or error. Result is shared,
+    so it shouldn't be mutated.
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[
+            collections.abc.Hashable,
+            concurrent.futures.Future[ResultT],
+        ] = {}
+
+    def run(
+        self,
+        key: collections.abc.Hashable,
+        func: collections.abc.Callable[[], ResultT],
+    ) -> ResultT:
+        """Run function or wait for result of running call with same key."""
+        with self._lock:
+            future = self._calls.get(key)
+            is_running = future is not None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+        if is_running:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+        future.set_result(result)
+        return result
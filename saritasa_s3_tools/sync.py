@@ -0,0 +1,273 @@
+import collections.abc
+import concurrent.futures
+import dataclasses
+import hashlib
+import math
+import operator
+import os
+import pathlib
+import queue
+import threading
+import typing
+
+import boto3.s3.transfer
+
+# Max amount of parts in s3 multipart upload
+max_parts = 10000
+# Min size of part in s3 multipart upload
+min_part_size = 5 * 1024 * 1024
+# Size of chunk which is read from file at once to compute its hash
+read_chunk_size = 1024 * 1024
+
+
+@dataclasses.dataclass
+class S3SyncResult:
+    """Result of synchronization between local directory and s3 prefix."""
+
+    # Keys or relative paths of transferred files
+    transferred: list[str] = dataclasses.field(default_factory=list)
+    # Keys or relative paths of files which were not changed
+    skipped: list[str] = dataclasses.field(default_factory=list)
+    # Keys or relative paths of removed files
+    deleted: list[str] = dataclasses.field(default_factory=list)
+
+
+def get_multipart_chunksize(
+    size: int,
+    transfer_config: boto3.s3.transfer.TransferConfig,
+) -> int:
+    """Get size of part which will be used for multipart upload.
+
+    Mimics adjustments made by `s3transfer` to fit limits of s3.
+
+    """
+    chunksize = max(transfer_config.multipart_chunksize, min_part_size)
+    while math.ceil(size / chunksize) > max_parts:
+        chunksize *= 2
+    return chunksize
+
+
+def compute_etag(
+    path: pathlib.Path,
+    transfer_config: boto3.s3.transfer.TransferConfig | None = None,
+) -> str:
+    """Compute ETag which s3 will assign to file once it's uploaded.
+
+    For files uploaded in one request ETag is md5 of content. For
+    multipart uploads it's md5 of concatenated md5 digests of parts
+    followed by amount of parts, like `"{md5}-{parts}"`.
+
+    """
+    transfer_config = transfer_config or boto3.s3.transfer.TransferConfig()
+    size = path.stat().st_size
+    if size < transfer_config.multipart_threshold:
+        file_hash = hashlib.md5(usedforsecurity=False)
+        with path.open("rb") as file:
+            while chunk := file.read(read_chunk_size):
+                file_hash.update(chunk)
+        return f'"{file_hash.hexdigest()}"'
+
+    chunksize = get_multipart_chunksize(
+        size=size,
+        transfer_config=transfer_config,
+    )
+    parts_digests = []
+    with path.open("rb") as file:
+        while True:
+            part_hash = hashlib.md5(usedforsecurity=False)
+            part_size = 0
+            while part_size < chunksize and (
+                chunk := file.read(min(read_chunk_size, chunksize - part_size))
+            ):
+                part_hash.update(chunk)
+                part_size += len(chunk)
+            if not part_size:
+                break
+            parts_digests.append(part_hash.digest())
+    etag = hashlib.md5(b"".join(parts_digests), usedforsecurity=False)
+    return f'"{etag.hexdigest()}-{len(parts_digests)}"'
+
+
+def iter_local_files(
+    local_path: pathlib.Path,
+    relative_path: str = "",
+) -> collections.abc.Iterator[tuple[str, pathlib.Path]]:
+    """Iterate over files in directory in order of s3 listing.
+
+    Yield relative posix path and absolute path of each file. Paths are
+    sorted same way as s3 sorts keys, so that files can be merged with
+    listing of prefix. Directories are read lazily one by one, symlinks to
+    directories and missing directory are skipped like `os.walk` does.
+
+    """
+    entries: list[tuple[str, os.DirEntry[str], bool]] = []
+    if not local_path.is_dir():
+        return
+    with os.scandir(local_path) as scanned_entries:
+        for entry in scanned_entries:
+            is_dir = entry.is_dir()
+            if is_dir and entry.is_symlink():
+                continue
+            # Directory is sorted by `{name}/`, since all paths of its files
+            # start with it
+            entries.append(
+                (f"{entry.name}/" if is_dir else entry.name, entry, is_dir),
+            )
+    entries.sort(key=operator.itemgetter(0))
+    for name, entry, is_dir in entries:
+        if is_dir:
+            yield from iter_local_files(
+                local_path=pathlib.Path(entry.path),
+                relative_path=f"{relative_path}{name}",
+            )
+        else:
+            yield f"{relative_path}{name}", pathlib.Path(entry.path)
+
+
+def merge_by_path[LocalT, RemoteT](
+    local_items: collections.abc.Iterable[tuple[str, LocalT]],
+    remote_items: collections.abc.Iterable[tuple[str, RemoteT]],
+) -> collections.abc.Iterator[tuple[str, LocalT | None, RemoteT | None]]:
+    """Merge local files and s3 objects sorted by their relative paths.
+
+    Yield relative path with local and remote items, item is None if it's
+    missing on its side. Only current item of each side is kept in memory.
+
+    """
+    local_iterator = iter(local_items)
+    remote_iterator = iter(remote_items)
+    local = next(local_iterator, None)
+    remote = next(remote_iterator, None)
+    while local is not None or remote is not None:
+        if remote is None or (local is not None and local[0] < remote[0]):
+            yield local[0], local[1], None  # type: ignore
+            local = next(local_iterator, None)
+        elif local is None or remote[0] < local[0]:
+            yield remote[0], None, remote[1]
+            remote = next(remote_iterator, None)
+        else:
+            yield local[0], local[1], remote[1]
+            local = next(local_iterator, None)
+            remote = next(remote_iterator, None)
+
+
+def is_file_changed(
+    path: pathlib.Path,
+    size: int,
+    etag: str,
+    transfer_config: boto3.s3.transfer.TransferConfig | None = None,
+) -> bool:
+    """Check if local file differs from s3 object by size and ETag."""
+    if not path.is_file() or path.stat().st_size != size:
+        return True
+    return compute_etag(path=path, transfer_config=transfer_config) != etag
+
+
+class BoundedExecutor:
+    """Thread pool which limits amount of queued tasks.
+
+    Used to avoid keeping tasks for every file of huge directory in
+    memory. First error of tasks is raised on exit.
+
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+        )
+        self._semaphore = threading.BoundedSemaphore(max_workers * 2)
+        self._error: BaseException | None = None
+
+    def submit(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        *args: typing.Any,
+    ) -> None:
+        """Submit task, wait if there are too many queued tasks."""
+        self._semaphore.acquire()
+        if self._error:
+            self._semaphore.release()
+            raise self._error
+        self._executor.submit(func, *args).add_done_callback(self._on_done)
+
+    def _on_done(self, future: concurrent.futures.Future[typing.Any]) -> None:
+        """Release slot for next task and remember error."""
+        if (error := future.exception()) and not self._error:
+            self._error = error
+        self._semaphore.release()
+
+    def __enter__(self) -> typing.Self:
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Wait for all tasks and raise first error if any."""
+        self._executor.shutdown(wait=True)
+        if self._error:
+            raise self._error
+
+
+class StoppableQueue[ItemT](queue.Queue[ItemT]):
+    """Queue which stops blocking producers once consumer has stopped."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize=maxsize)
+        self.stopped = threading.Event()
+
+    def put_unless_stopped(self, item: ItemT) -> None:
+        """Put item into queue, give up if consumer has stopped."""
+        while not self.stopped.is_set():
+            try:
+                self.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def iter_batches_in_parallel[ArgT, ItemT](
+    func: collections.abc.Callable[
+        [ArgT],
+        collections.abc.Iterable[collections.abc.Iterable[ItemT]],
+    ],
+    args: collections.abc.Sequence[ArgT],
+    max_workers: int = 10,
+) -> collections.abc.Iterator[ItemT]:
+    """Run func for each arg in thread pool and iterate over its results.
+
+    `func` should yield batches of items (like pages of listing). Items are
+    yielded in order in which batches are produced, amount of batches
+    waiting to be consumed is bounded by `max_workers`. Threads are stopped
+    once iterator is closed.
+
+    """
+    batches: StoppableQueue[
+        collections.abc.Iterable[ItemT] | BaseException | None
+    ] = StoppableQueue(maxsize=max_workers)
+
+    def _run(arg: ArgT) -> None:
+        try:
+            for batch in func(arg):
+                if batches.stopped.is_set():
+                    return
+                batches.put_unless_stopped(batch)
+        except BaseException as error:  # noqa: BLE001
+            batches.put_unless_stopped(error)
+        # Mark that func is finished
+        batches.put_unless_stopped(None)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for arg in args:
+            executor.submit(_run, arg)
+        finished = 0
+        while finished < len(args):
+            item = batches.get()
+            if item is None:
+                finished += 1
+                continue
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+    finally:
+        batches.stopped.set()
+        executor.shutdown(wait=True, cancel_futures=True)
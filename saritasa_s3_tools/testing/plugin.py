@@ -301,6 +301,29 @@ def async_s3_client(
     )
 
 
+@pytest.fixture
+def s3_config_factory() -> collections.abc.Iterator[
+    collections.abc.Callable[..., saritasa_s3_tools.S3FileTypeConfig]
+]:
+    """Register configs which are removed from registry after test."""
+    registered: list[str] = []
+
+    def _create(**kwargs: typing.Any) -> saritasa_s3_tools.S3FileTypeConfig:
+        config = saritasa_s3_tools.S3FileTypeConfig(**kwargs)
+        registered.append(config.name)
+        return config
+
+    yield _create
+    if not registered:
+        return
+    for name in registered:
+        saritasa_s3_tools.S3FileTypeConfig.configs.pop(name, None)
+    # Structures derived from registry will be rebuilt without configs
+    saritasa_s3_tools.S3FileTypeConfig.version += 1
+    saritasa_s3_tools.S3FileTypeConfig.index = None
+    saritasa_s3_tools.S3FileTypeConfig.descriptions = None
+
+
 @pytest.fixture
 def django_storage_changer() -> collections.abc.Iterator[
     collections.abc.Callable[
@@ -311,16 +334,20 @@ def django_storage_changer() -> collections.abc.Iterator[
     """Temporary change default storage settings."""
     from django.core.files.storage import default_storage
 
+    from ..django import shortcuts
+
     old_settings: dict[str, typing.Any] = {}
 
     def _changer(key: str, value: typing.Any) -> None:
         if key not in old_settings and hasattr(default_storage, key):
             old_settings[key] = getattr(default_storage, key)
         setattr(default_storage, key, value)
+        shortcuts.clear_s3_clients()
 
     yield _changer
     for key, value in old_settings.items():
         setattr(default_storage, key, value)
+    shortcuts.clear_s3_clients()
 
 
 @pytest.fixture(scope="session")
@@ -330,9 +357,12 @@ def django_adjust_s3_bucket(s3_bucket: str) -> None:
     from django.core.files import storage
     from storages.backends import s3
 
+    from ..django import shortcuts
+
     for storage_alias in settings.STORAGES:
         with contextlib.suppress(storage.InvalidStorageError):
             storage_instance = storage.storages[storage_alias]
             if isinstance(storage_instance, s3.S3Storage):
                 storage_instance.bucket_name = s3_bucket  # type: ignore
     settings.AWS_STORAGE_BUCKET_NAME = s3_bucket
+    shortcuts.clear_s3_clients()
@@ -1,7 +1,10 @@
+import collections.abc
 import typing
 
 import pytest
 
+import mypy_boto3_s3
+
 import saritasa_s3_tools
 
 saritasa_s3_tools.S3FileTypeConfig(
@@ -16,6 +19,19 @@ saritasa_s3_tools.S3FileTypeConfig(
     expires_in=1,
 )
 
+saritasa_s3_tools.S3FileTypeConfig(
+    name="gzip-files",
+    key=saritasa_s3_tools.keys.WithPrefixUUIDFileName("gzip-files"),
+    content_encoding="gzip",
+)
+
+saritasa_s3_tools.S3FileTypeConfig(
+    name="content-hash-files",
+    key=saritasa_s3_tools.keys.WithPrefixContentHashFileName(
+        "content-hash-files",
+    ),
+)
+
 
 @pytest.fixture
 def anyio_backend() -> str:
@@ -23,6 +39,22 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture
+async def native_async_s3_client(
+    boto3_client: mypy_boto3_s3.S3Client,
+    s3_bucket: str,
+) -> collections.abc.AsyncIterator[saritasa_s3_tools.AsyncS3Client]:
+    """Set up async s3 client with native async transport."""
+    async with saritasa_s3_tools.AsyncS3Client(
+        boto3_client=boto3_client,
+        default_bucket=s3_bucket,
+        transport=saritasa_s3_tools.async_client.AsyncS3Transport(
+            boto3_client=boto3_client,
+        ),
+    ) as async_s3_client:
+        yield async_s3_client
+
+
 @pytest.fixture(scope="session")
 def s3_bucket_policy(
     s3_bucket_name: str,
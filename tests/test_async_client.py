@@ -1,9 +1,18 @@
+import collections.abc
+import datetime
 import io
+import os
 import pathlib
+import threading
 
 import anyio
 import pytest
 
+import boto3
+import botocore.credentials
+import botocore.exceptions
+import botocore.session
+
 import saritasa_s3_tools
 
 
@@ -91,3 +100,309 @@ async def test_copy(
     assert await async_s3_client.async_is_file_in_bucket(
         key=copy_key,
     ), copy_key
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_native_transport(
+    native_async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test file operations via native async transport."""
+    content = await anyio.Path(__file__).read_bytes()
+    upload_key = await native_async_s3_client.async_upload_file(
+        filename="test file.py",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["files"],
+        file_obj=io.BytesIO(content),
+    )
+    assert await native_async_s3_client.async_is_file_in_bucket(
+        key=upload_key,
+    ), upload_key
+    meta_data = await native_async_s3_client.async_get_file_metadata(
+        key=upload_key,
+    )
+    assert meta_data["ContentLength"] == len(content)
+    copy_key = saritasa_s3_tools.keys.WithPrefixUUIDFolder("copy")("ü.py")
+    await native_async_s3_client.async_copy_object(
+        key=copy_key,
+        source_key=upload_key,
+    )
+    file_data = await native_async_s3_client.async_download_file(
+        key=copy_key,
+        file_obj=io.BytesIO(),
+    )
+    assert file_data.getvalue() == content  # type: ignore
+    await native_async_s3_client.async_delete_object(key=upload_key)
+    assert not await native_async_s3_client.async_is_file_in_bucket(
+        key=upload_key,
+    ), upload_key
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_native_transport_decompress(
+    native_async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that compressed file is uploaded by boto3 and decompressed."""
+    content = await anyio.Path(__file__).read_bytes()
+    upload_key = await native_async_s3_client.async_upload_file(
+        filename="test.py",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["gzip-files"],
+        file_obj=io.BytesIO(content),
+    )
+    file_data = await native_async_s3_client.async_download_file(
+        key=upload_key,
+        file_obj=io.BytesIO(),
+        decompress=True,
+    )
+    assert file_data.getvalue() == content  # type: ignore
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_native_transport_error(
+    native_async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that s3 errors are raised as boto3 errors."""
+    with pytest.raises(botocore.exceptions.ClientError) as error:
+        await native_async_s3_client.async_download_file(
+            key="missing/file.txt",
+            file_obj=io.BytesIO(),
+        )
+    assert error.value.response["Error"]["Code"] == "NoSuchKey"
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_thread_limiter(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that client runs calls with its own limiter of threads."""
+    limited_s3_client = saritasa_s3_tools.AsyncS3Client(
+        boto3_client=async_s3_client.boto3_client,
+        default_bucket=async_s3_client.default_bucket,
+        thread_limiter=1,
+    )
+    async with anyio.create_task_group() as task_group:
+        for _ in range(3):
+            task_group.start_soon(
+                limited_s3_client.async_is_file_in_bucket,
+                "missing/file.txt",
+            )
+    stats = limited_s3_client.get_thread_stats()
+    assert stats.total_tokens == 1
+    assert stats.borrowed_tokens == 0
+    assert stats.tasks_waiting == 0
+    assert stats.calls == 3
+    assert 0 < stats.max_wait_time <= stats.total_wait_time
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_generate_params_inline(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that params are generated without hop to worker thread."""
+    limited_s3_client = saritasa_s3_tools.AsyncS3Client(
+        boto3_client=async_s3_client.boto3_client,
+        default_bucket=async_s3_client.default_bucket,
+        thread_limiter=1,
+    )
+    s3_params = await limited_s3_client.async_generate_params(
+        filename="test.txt",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["files"],
+        content_type="text/plain",
+    )
+    assert s3_params.params["key"].startswith("files/")
+    assert limited_s3_client.get_thread_stats().calls == 0
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_many(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test batch operations on many files."""
+    config = saritasa_s3_tools.S3FileTypeConfig.configs["files"]
+    uploaded = {
+        await async_s3_client.async_upload_file(
+            filename="test.txt",
+            config=config,
+            file_obj=io.BytesIO(content),
+        ): content
+        for content in (b"first", b"second", b"third")
+    }
+    missing_key = config.key("missing.txt")
+    all_keys = [*uploaded, missing_key]
+    async with async_s3_client.async_get_many(
+        all_keys,
+        max_concurrency=2,
+    ) as results:
+        downloaded = {result.key: result async for result in results}
+    assert downloaded.keys() == set(all_keys)
+    for key, content in uploaded.items():
+        assert downloaded[key].value == content
+        assert downloaded[key].error is None
+    assert downloaded[missing_key].value is None
+    assert isinstance(
+        downloaded[missing_key].error,
+        botocore.exceptions.ClientError,
+    )
+    async with async_s3_client.async_head_many(all_keys) as results:
+        metadata = {result.key: result async for result in results}
+    assert metadata[next(iter(uploaded))].value["ContentLength"] == 5  # type: ignore
+    assert metadata[missing_key].error
+
+    async with async_s3_client.async_delete_many(uploaded) as results:
+        assert {result.key async for result in results} == uploaded.keys()
+    async with async_s3_client.async_is_file_in_bucket_many(
+        all_keys,
+    ) as results:
+        assert not [result async for result in results if result.value]
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_many_early_exit(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that pending operations are cancelled once consumer leaves."""
+    keys = (f"missing/{index}.txt" for index in range(1000))
+    async with async_s3_client.async_is_file_in_bucket_many(
+        keys,
+        max_concurrency=2,
+    ) as results:
+        async for result in results:
+            assert result.value is False
+            break
+    # Only keys which were taken for processing are consumed
+    assert len(list(keys)) > 900
+    with pytest.raises(ValueError, match="Stop"):
+        async with async_s3_client.async_is_file_in_bucket_many(
+            ["missing/file.txt"],
+        ) as results:
+            raise ValueError("Stop")
+
+
+async def _iter_chunks(
+    content: bytes,
+    chunk_size: int = 1024 * 1024,
+    error: Exception | None = None,
+) -> collections.abc.AsyncIterator[bytes]:
+    """Stream content in chunks, raise error in the middle if set."""
+    for index in range(0, len(content), chunk_size):
+        if error and index > len(content) / 2:
+            raise error
+        yield content[index : index + chunk_size]
+
+
+@pytest.mark.parametrize("is_native", [False, True])
+@pytest.mark.usefixtures("anyio_backend")
+async def test_upload_stream(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+    native_async_s3_client: saritasa_s3_tools.AsyncS3Client,
+    is_native: bool,
+) -> None:
+    """Test multipart upload of async stream."""
+    s3_client = native_async_s3_client if is_native else async_s3_client
+    content = os.urandom(11 * 1024 * 1024)
+    upload_key = await s3_client.async_upload_stream(
+        filename="test.bin",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["files"],
+        chunks=_iter_chunks(content),
+        part_size=5 * 1024 * 1024,
+    )
+    metadata = await s3_client.async_get_file_metadata(key=upload_key)
+    assert metadata["ETag"].endswith('-3"')
+    assert await s3_client.async_download_bytes(key=upload_key) == content
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_upload_stream_compressed(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test upload of empty stream with compression."""
+    upload_key = await async_s3_client.async_upload_stream(
+        filename="test.txt",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["gzip-files"],
+        chunks=_iter_chunks(b""),
+    )
+    assert (
+        await async_s3_client.async_download_bytes(
+            key=upload_key,
+            decompress=True,
+        )
+        == b""
+    )
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_upload_stream_abort(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that multipart upload is aborted on error."""
+    with pytest.raises(ValueError, match="Stream is broken"):
+        await async_s3_client.async_upload_stream(
+            filename="test.bin",
+            config=saritasa_s3_tools.S3FileTypeConfig.configs["files"],
+            chunks=_iter_chunks(
+                os.urandom(11 * 1024 * 1024),
+                error=ValueError("Stream is broken"),
+            ),
+            part_size=5 * 1024 * 1024,
+        )
+    uploads = async_s3_client.boto3_client.list_multipart_uploads(
+        Bucket=async_s3_client.default_bucket,
+    )
+    assert not uploads.get("Uploads")
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_generate_params_refreshable_credentials(
+    async_s3_client: saritasa_s3_tools.AsyncS3Client,
+) -> None:
+    """Test that expiring credentials are refreshed in worker thread."""
+    refresh_threads: list[threading.Thread] = []
+
+    def _refresh() -> dict[str, str]:
+        refresh_threads.append(threading.current_thread())
+        return {
+            "access_key": "root",
+            "secret_key": "rootroot",
+            "token": "",
+            "expiry_time": (
+                datetime.datetime.now(datetime.UTC)
+                + datetime.timedelta(hours=1)
+            ).isoformat(),
+        }
+
+    botocore_session = botocore.session.Session()
+    botocore_session._credentials = (  # type: ignore[attr-defined]
+        botocore.credentials.RefreshableCredentials.create_from_metadata(
+            metadata={
+                **_refresh(),
+                "expiry_time": datetime.datetime.now(
+                    datetime.UTC,
+                ).isoformat(),
+            },
+            refresh_using=_refresh,
+            method="test",
+        )
+    )
+    refresh_threads.clear()
+    boto3_client = boto3.session.Session(
+        botocore_session=botocore_session,
+        region_name=async_s3_client.boto3_client.meta.region_name,
+    ).client(
+        "s3",
+        endpoint_url=async_s3_client.boto3_client.meta.endpoint_url,
+    )
+    assert not saritasa_s3_tools.async_client.client.can_sign_in_event_loop(
+        boto3_client,
+    )
+    s3_params = await saritasa_s3_tools.AsyncS3Client(
+        boto3_client=boto3_client,
+        default_bucket=async_s3_client.default_bucket,
+    ).async_generate_params(
+        filename="test.txt",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["files"],
+        content_type="text/plain",
+    )
+    assert s3_params.params
+    assert refresh_threads
+    assert threading.main_thread() not in refresh_threads
+    assert saritasa_s3_tools.async_client.client.can_sign_in_event_loop(
+        boto3_client,
+    )
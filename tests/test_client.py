@@ -1,7 +1,14 @@
+import concurrent.futures
+import datetime
+import gzip
+import hashlib
 import io
+import os
 import pathlib
 import re
+import tempfile
 import time
+import typing
 import xml.etree.ElementTree
 
 import httpx2
@@ -147,3 +154,289 @@ def test_meta_data_key_warning(s3_client: saritasa_s3_tools.S3Client) -> None:
                 "user_id": "1",
             },
         )
+
+
+def test_compressed_upload(s3_client: saritasa_s3_tools.S3Client) -> None:
+    """Test upload and download of compressed file."""
+    with pathlib.Path(__file__).open("rb") as upload_file:
+        upload_key = s3_client.upload_file(
+            filename=pathlib.Path(__file__).name,
+            config=saritasa_s3_tools.S3FileTypeConfig.configs["gzip-files"],
+            file_obj=upload_file,
+        )
+    expected_data = pathlib.Path(__file__).read_bytes()
+    meta_data = s3_client.get_file_metadata(key=upload_key)
+    assert meta_data["ContentEncoding"] == "gzip"
+    assert meta_data["ContentLength"] < len(expected_data)
+
+    raw_data = io.BytesIO()
+    s3_client.download_file(
+        key=upload_key,
+        file_obj=raw_data,
+    )
+    assert gzip.decompress(raw_data.getvalue()) == expected_data
+    file_data = io.BytesIO()
+    s3_client.download_file(
+        key=upload_key,
+        file_obj=file_data,
+        decompress=True,
+    )
+    assert file_data.getvalue() == expected_data
+    assert (
+        b"".join(s3_client.stream_file(key=upload_key, chunk_size=100))
+        == expected_data
+    )
+
+
+def test_disk_cache(
+    s3_client: saritasa_s3_tools.S3Client,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test that downloads are served from disk cache."""
+    cache = saritasa_s3_tools.disk_cache.S3DiskCache(
+        directory=tmp_path,
+        max_size=1024 * 1024,
+    )
+    cached_s3_client = saritasa_s3_tools.S3Client(
+        boto3_client=s3_client.boto3_client,
+        default_bucket=s3_client.default_bucket,
+        disk_cache=cache,
+    )
+    key = saritasa_s3_tools.keys.WithPrefixUUIDFileName("cache")("test.txt")
+    s3_client.boto3_client.put_object(
+        Bucket=s3_client.default_bucket,
+        Key=key,
+        Body=b"v1",
+    )
+    file_data = io.BytesIO()
+    cached_s3_client.download_file(key=key, file_obj=file_data)
+    assert file_data.getvalue() == b"v1"
+    etag = s3_client.get_file_metadata(key=key)["ETag"]
+    cached_path = cache.get_path(
+        bucket=s3_client.default_bucket,
+        key=key,
+        etag=etag,
+    )
+    assert cached_path.read_bytes() == b"v1"
+
+    # Change cached file to check that it's used instead of s3
+    cached_path.write_bytes(b"cached")
+    with (tmp_path / "download.txt").open("wb+") as download_file:
+        cached_s3_client.download_file(key=key, file_obj=download_file)
+        download_file.seek(0)
+        assert download_file.read() == b"cached"
+    assert b"".join(cached_s3_client.stream_file(key=key)) == b"cached"
+
+    # New version of file must not be served from cache
+    s3_client.boto3_client.put_object(
+        Bucket=s3_client.default_bucket,
+        Key=key,
+        Body=b"v2",
+    )
+    assert b"".join(cached_s3_client.stream_file(key=key)) == b"v2"
+    file_data = io.BytesIO()
+    cached_s3_client.download_file(key=key, file_obj=file_data)
+    assert file_data.getvalue() == b"v2"
+    assert not cached_path.exists()
+
+
+def test_disk_cache_eviction(
+    s3_client: saritasa_s3_tools.S3Client,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test that disk cache is bounded by size."""
+    cache = saritasa_s3_tools.disk_cache.S3DiskCache(
+        directory=tmp_path,
+        max_size=3,
+    )
+    cached_s3_client = saritasa_s3_tools.S3Client(
+        boto3_client=s3_client.boto3_client,
+        default_bucket=s3_client.default_bucket,
+        disk_cache=cache,
+    )
+    key_generator = saritasa_s3_tools.keys.WithPrefixUUIDFileName("cache")
+    keys = [key_generator("test.txt") for _ in range(3)]
+    for key in keys:
+        s3_client.boto3_client.put_object(
+            Bucket=s3_client.default_bucket,
+            Key=key,
+            Body=b"12",
+        )
+        file_data = io.BytesIO()
+        cached_s3_client.download_file(key=key, file_obj=file_data)
+        assert file_data.getvalue() == b"12"
+    cached_files = [path for path in tmp_path.glob("*/*") if path.is_file()]
+    assert len(cached_files) == 1
+    assert cache.get_size() == 2
+
+
+def test_disk_cache_copy_file(tmp_path: pathlib.Path) -> None:
+    """Test that cached file is copied to non-seekable and spooled files."""
+    source_path = tmp_path / "cached"
+    source_path.write_bytes(b"cached")
+    read_fd, write_fd = os.pipe()
+    with (
+        source_path.open("rb") as source,
+        os.fdopen(read_fd, "rb") as pipe_out,
+        os.fdopen(write_fd, "wb") as pipe_in,
+    ):
+        saritasa_s3_tools.disk_cache.copy_file(source, pipe_in)
+        pipe_in.close()
+        assert pipe_out.read() == b"cached"
+    with (
+        source_path.open("rb") as source,
+        tempfile.SpooledTemporaryFile() as spooled_file,
+    ):
+        saritasa_s3_tools.disk_cache.copy_file(source, spooled_file)
+        assert not spooled_file._rolled  # type: ignore[attr-defined]
+        spooled_file.seek(0)
+        assert spooled_file.read() == b"cached"
+
+
+def test_download_file_if_changed(
+    s3_client: saritasa_s3_tools.S3Client,
+) -> None:
+    """Test conditional download of file."""
+    key = saritasa_s3_tools.keys.WithPrefixUUIDFileName("cache")("test.txt")
+    s3_client.boto3_client.put_object(
+        Bucket=s3_client.default_bucket,
+        Key=key,
+        Body=b"v1",
+    )
+    file_data = io.BytesIO()
+    result = s3_client.download_file_if_changed(key=key, file_obj=file_data)
+    assert result.is_changed
+    assert file_data.getvalue() == b"v1"
+
+    file_data = io.BytesIO()
+    not_changed_result = s3_client.download_file_if_changed(
+        key=key,
+        file_obj=file_data,
+        etag=result.etag,
+    )
+    assert not not_changed_result.is_changed
+    assert not_changed_result.etag == result.etag
+    assert not file_data.getvalue()
+
+    s3_client.boto3_client.put_object(
+        Bucket=s3_client.default_bucket,
+        Key=key,
+        Body=b"v2",
+    )
+    changed_result = s3_client.stream_file_if_changed(
+        key=key,
+        etag=result.etag,
+    )
+    assert changed_result.is_changed
+    assert changed_result.etag != result.etag
+    assert b"".join(changed_result.chunks) == b"v2"
+
+
+def test_content_hash_upload(s3_client: saritasa_s3_tools.S3Client) -> None:
+    """Test that files with same content are uploaded only once."""
+    config = saritasa_s3_tools.S3FileTypeConfig.configs["content-hash-files"]
+    content = f"{time.time()}".encode()
+    first_key = s3_client.upload_file(
+        filename="test.txt",
+        config=config,
+        file_obj=io.BytesIO(content),
+    )
+    assert config.key.validate(first_key), first_key
+    assert first_key == (
+        f"content-hash-files/{hashlib.sha256(content).hexdigest()}.txt"
+    )
+    last_modified = s3_client.get_file_metadata(key=first_key)["LastModified"]
+
+    time.sleep(1)
+    second_key = s3_client.upload_file(
+        filename="other.txt",
+        config=config,
+        file_obj=io.BufferedReader(io.BytesIO(content)),  # type: ignore
+    )
+    assert second_key == first_key
+    metadata = s3_client.get_file_metadata(key=second_key)
+    assert metadata["LastModified"] == last_modified
+    assert not config.key.validate("content-hash-files/not-a-hash.txt")
+
+
+def test_iter_objects_in_prefixes(
+    s3_client: saritasa_s3_tools.S3Client,
+) -> None:
+    """Test listing of sharded keys in parallel."""
+    key_generator = saritasa_s3_tools.keys.WithPrefixShardUUIDFolder(
+        f"shards-{time.time()}",
+        shard_length=1,
+    )
+    keys = {key_generator("test.txt") for _ in range(10)}
+    for key in keys:
+        s3_client.boto3_client.put_object(
+            Bucket=s3_client.default_bucket,
+            Key=key,
+            Body=b"test",
+        )
+    listed_keys = [
+        obj["Key"]
+        for obj in s3_client.iter_objects_in_prefixes(
+            prefixes=key_generator.get_shard_prefixes(),
+            max_workers=4,
+        )
+    ]
+    assert sorted(listed_keys) == sorted(keys)
+
+
+def test_iter_objects_since(s3_client: saritasa_s3_tools.S3Client) -> None:
+    """Test listing of objects uploaded after timestamp."""
+    key_generator = saritasa_s3_tools.keys.WithPrefixUUIDv7FileName(
+        f"ordered-{time.time()}",
+    )
+    old_key = key_generator("test.txt")
+    time.sleep(0.01)
+    since = datetime.datetime.now(tz=datetime.UTC)
+    new_key = key_generator("test.txt")
+    for key in (old_key, new_key):
+        s3_client.boto3_client.put_object(
+            Bucket=s3_client.default_bucket,
+            Key=key,
+            Body=b"test",
+        )
+    listed_keys = [
+        obj["Key"]
+        for obj in s3_client.iter_objects_since(key=key_generator, since=since)
+    ]
+    assert listed_keys == [new_key]
+
+
+def test_coalesce_reads(
+    s3_client: saritasa_s3_tools.S3Client,
+) -> None:
+    """Test that concurrent reads of same file share one request."""
+    coalescing_s3_client = saritasa_s3_tools.S3Client(
+        boto3_client=s3_client.boto3_client,
+        default_bucket=s3_client.default_bucket,
+        coalesce_reads=True,
+    )
+    key = s3_client.upload_file(
+        filename="test.txt",
+        config=saritasa_s3_tools.S3FileTypeConfig.configs["files"],
+        file_obj=io.BytesIO(b"content"),
+    )
+    requests: list[str] = []
+
+    def _on_head(**kwargs: typing.Any) -> None:
+        requests.append(kwargs["params"]["Key"])
+        # Let other threads join call before it's finished
+        time.sleep(0.2)
+
+    event_name = "before-parameter-build.s3.HeadObject"
+    s3_client.boto3_client.meta.events.register(event_name, _on_head)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(coalescing_s3_client.is_file_in_bucket, key)
+                for _ in range(4)
+            ]
+            assert all(future.result() for future in futures)
+    finally:
+        s3_client.boto3_client.meta.events.unregister(event_name, _on_head)
+    assert requests == [key]
+    assert coalescing_s3_client.download_bytes(key=key) == b"content"
@@ -1,3 +1,4 @@
+import collections.abc
 import re
 
 import pytest
@@ -15,3 +16,58 @@ def test_config_duplicate() -> None:
             name="files",
             key=saritasa_s3_tools.keys.WithPrefixUUIDFolder("files"),
         )
+
+
+def test_config_resolve() -> None:
+    """Check that key is resolved to config it was generated by."""
+    for name in ("files", "expires", "content-hash-files"):
+        config = saritasa_s3_tools.S3FileTypeConfig.configs[name]
+        assert (
+            saritasa_s3_tools.S3FileTypeConfig.resolve(config.key("a.txt"))
+            is config
+        )
+    assert saritasa_s3_tools.S3FileTypeConfig.resolve("files/a.txt") is None
+    assert saritasa_s3_tools.S3FileTypeConfig.resolve("unknown/a.txt") is None
+
+
+def test_config_resolve_after_registration(
+    s3_config_factory: collections.abc.Callable[
+        ...,
+        saritasa_s3_tools.S3FileTypeConfig,
+    ],
+) -> None:
+    """Check that index is updated once new config is registered."""
+    key = "resolve/nested/ab/c.txt"
+    assert saritasa_s3_tools.S3FileTypeConfig.resolve(key) is None
+    config = s3_config_factory(
+        name="resolve-nested",
+        key=saritasa_s3_tools.keys.WithPrefixShardUUIDFolder(
+            "resolve/nested",
+        ),
+    )
+    assert saritasa_s3_tools.S3FileTypeConfig.resolve(config.key("a.txt")) is (
+        config
+    )
+
+
+def test_config_descriptions(
+    s3_config_factory: collections.abc.Callable[
+        ...,
+        saritasa_s3_tools.S3FileTypeConfig,
+    ],
+) -> None:
+    """Check that descriptions are rebuilt only on registration of config."""
+    version = saritasa_s3_tools.S3FileTypeConfig.version
+    descriptions = saritasa_s3_tools.S3FileTypeConfig.get_descriptions()
+    assert saritasa_s3_tools.S3FileTypeConfig.get_descriptions() is (
+        descriptions
+    )
+    config = s3_config_factory(
+        name="descriptions",
+        key=saritasa_s3_tools.keys.WithPrefixUUIDFolder("descriptions"),
+    )
+    assert saritasa_s3_tools.S3FileTypeConfig.version == version + 1
+    assert saritasa_s3_tools.S3FileTypeConfig.get_descriptions() == (
+        *descriptions,
+        ("descriptions", config.get_short_description()),
+    )
@@ -3,8 +3,19 @@ import pytest_django
 from django.urls import reverse_lazy
 from rest_framework import test
 
+import saritasa_s3_tools
 from example.app import factories, models
 
+saritasa_s3_tools.S3FileTypeConfig(
+    name="django-db-auth-files",
+    key=saritasa_s3_tools.keys.WithPrefixUUIDFolder("django-db-auth-files"),
+    # Auth which queries database
+    auth=lambda user: models.User.objects.filter(
+        pk=getattr(user, "pk", None),
+        is_active=True,
+    ).exists(),
+)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def django_db_setup(django_db_setup) -> None:  # noqa: ANN001
@@ -0,0 +1,153 @@
+import pytest
+from django import test
+from django.urls import reverse_lazy
+from rest_framework.authtoken.models import Token
+
+import saritasa_s3_tools
+from example.app import models
+
+
+@pytest.mark.usefixtures("anyio_backend")
+@pytest.mark.parametrize("is_authenticated", [False, True])
+async def test_get_params(
+    default_user: models.User,
+    is_authenticated: bool,
+) -> None:
+    """Test params generation via async view."""
+    client = test.AsyncClient()
+    if is_authenticated:
+        await client.aforce_login(default_user)
+    response = await client.post(
+        path=reverse_lazy("s3-async:s3-get-params"),
+        data={
+            "config": "django-files",
+            "filename": "test.txt",
+            "content_type": "text/plain",
+            "content_length": 5000,
+        },
+        content_type="application/json",
+    )
+    if not is_authenticated:
+        assert response.status_code == 400, response.json()
+        assert response.json()["config"] == [
+            "Current user can't use this destination",
+        ]
+        return
+    assert response.status_code == 200, response.json()
+    params = response.json()["params"]
+    assert params["key"].startswith("django-files/")
+    assert params["x-amz-meta-user-id"] == str(default_user.pk)
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_get_params_db_auth(default_user: models.User) -> None:
+    """Test that config's auth can query database."""
+    client = test.AsyncClient()
+    await client.aforce_login(default_user)
+    response = await client.post(
+        path=reverse_lazy("s3-async:s3-get-params"),
+        data={
+            "config": "django-db-auth-files",
+            "filename": "test.txt",
+            "content_type": "text/plain",
+            "content_length": 5000,
+        },
+        content_type="application/json",
+    )
+    assert response.status_code == 200, response.json()
+    params = response.json()["params"]
+    assert params["key"].startswith("django-db-auth-files/")
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_get_params_token_auth(default_user: models.User) -> None:
+    """Test that DRF's authentication classes are applied."""
+    token = await Token.objects.acreate(user=default_user)
+    data = {
+        "config": "django-files",
+        "filename": "test.txt",
+        "content_type": "text/plain",
+        "content_length": 5000,
+    }
+    response = await test.AsyncClient().post(
+        path=reverse_lazy("s3-async:s3-get-params"),
+        data=data,
+        content_type="application/json",
+        headers={"Authorization": f"Token {token.key}"},
+    )
+    assert response.status_code == 200, response.json()
+    params = response.json()["params"]
+    assert params["x-amz-meta-user-id"] == str(default_user.pk)
+    response = await test.AsyncClient().post(
+        path=reverse_lazy("s3-async:s3-get-params"),
+        data=data,
+        content_type="application/json",
+        headers={"Authorization": "Token invalid"},
+    )
+    assert response.status_code == 403, response.json()
+    assert response.json()["detail"] == "Invalid token."
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_get_params_session_csrf(default_user: models.User) -> None:
+    """Test that CSRF is enforced for session authenticated users."""
+    client = test.AsyncClient(enforce_csrf_checks=True)
+    await client.aforce_login(default_user)
+    response = await client.post(
+        path=reverse_lazy("s3-async:s3-get-params"),
+        data={
+            "config": "django-files",
+            "filename": "test.txt",
+            "content_type": "text/plain",
+            "content_length": 5000,
+        },
+        content_type="application/json",
+    )
+    assert response.status_code == 403, response.json()
+    assert response.json()["detail"].startswith("CSRF Failed")
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_get_params_invalid_json() -> None:
+    """Test that invalid json is rejected."""
+    response = await test.AsyncClient().post(
+        path=reverse_lazy("s3-async:s3-get-params"),
+        data="{",
+        content_type="application/json",
+    )
+    assert response.status_code == 400, response.json()
+    assert response.json()["detail"].startswith("JSON parse error")
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_list_and_retrieve_configs() -> None:
+    """Test listing and retrieval of configs via async views."""
+    client = test.AsyncClient()
+    response = await client.get(reverse_lazy("s3-async:s3-list-configs"))
+    assert response.status_code == 200
+    assert [config["name"] for config in response.json()] == list(
+        saritasa_s3_tools.S3FileTypeConfig.configs,
+    )
+    response = await client.get(
+        reverse_lazy(
+            "s3-async:s3-retrieve-config",
+            kwargs={"name": "django-files"},
+        ),
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "django-files"
+    response = await client.get(
+        reverse_lazy(
+            "s3-async:s3-retrieve-config",
+            kwargs={"name": "django-files"},
+        ),
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 304
+    response = await client.get(
+        reverse_lazy(
+            "s3-async:s3-retrieve-config",
+            kwargs={"name": "unknown"},
+        ),
+    )
+    assert response.status_code == 404
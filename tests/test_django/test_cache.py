@@ -0,0 +1,106 @@
+import io
+import pathlib
+import typing
+import uuid
+
+from django.core.files.base import ContentFile
+
+import saritasa_s3_tools.django
+from example.app import factories, models
+from example.app.api import serializers
+
+
+def test_metadata_cache(settings: typing.Any) -> None:
+    """Test that metadata of files is shared via cache till file changes."""
+    settings.SARITASA_S3_TOOLS_CACHE = {"key_prefix": "test-metadata"}
+    s3_client = saritasa_s3_tools.django.get_s3_client()
+    assert s3_client.metadata_cache
+    config = saritasa_s3_tools.S3FileTypeConfig.configs["files"]
+    key = s3_client.upload_file(
+        filename="test.txt",
+        config=config,
+        file_obj=io.BytesIO(b"content"),
+    )
+    metadata = s3_client.get_file_metadata(key=key)
+    assert metadata["ContentLength"] == len(b"content")
+    assert s3_client.metadata_cache.get_many(
+        s3_client.default_bucket,
+        (key,),
+    ) == {key: saritasa_s3_tools.metadata_cache.compact_metadata(metadata)}
+    # Other clients get metadata from cache
+    s3_client.boto3_client.delete_object(
+        Bucket=s3_client.default_bucket,
+        Key=key,
+    )
+    assert saritasa_s3_tools.django.get_s3_client().get_files_metadata(
+        keys=(key, "unknown.txt"),
+    ) == {
+        key: saritasa_s3_tools.metadata_cache.compact_metadata(metadata),
+        "unknown.txt": None,
+    }
+    s3_client.delete_object(key=key)
+    assert not s3_client.is_file_in_bucket(key=key)
+
+
+def test_metadata_cache_sync_directory_invalidation(
+    settings: typing.Any,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test that metadata of files uploaded by sync is invalidated."""
+    settings.SARITASA_S3_TOOLS_CACHE = {"key_prefix": "test-sync-metadata"}
+    s3_client = saritasa_s3_tools.django.get_s3_client()
+    prefix = f"sync/{uuid.uuid4()}"
+    (tmp_path / "file.txt").write_text("file")
+    s3_client.sync_directory(local_path=tmp_path, prefix=prefix)
+    key = f"{prefix}/file.txt"
+    assert s3_client.get_file_metadata(key=key)["ContentLength"] == 4
+    (tmp_path / "file.txt").write_text("changed")
+    s3_client.sync_directory(local_path=tmp_path, prefix=prefix)
+    assert s3_client.get_file_metadata(key=key)["ContentLength"] == 7
+
+
+def test_metadata_cache_storage_invalidation(settings: typing.Any) -> None:
+    """Test that metadata is invalidated on writes via storage and files."""
+    settings.SARITASA_S3_TOOLS_CACHE = {"key_prefix": "test-storage-metadata"}
+    storage = saritasa_s3_tools.django.S3Storage()
+    s3_client = saritasa_s3_tools.django.get_s3_client(storage=storage)
+    name = storage.save(
+        f"django-files/{uuid.uuid4()}/test.txt",
+        ContentFile(b"content"),
+    )
+    key = saritasa_s3_tools.django.shortcuts.get_s3_key(storage, name)
+    assert s3_client.get_file_metadata(key=key)["ContentLength"] == 7
+    storage.delete(name)
+    assert not s3_client.is_file_in_bucket(key=key)
+
+    instance = factories.ModelWithFilesFactory.create()
+    key = saritasa_s3_tools.django.shortcuts.get_s3_key(
+        instance.file.storage,
+        instance.file.name,
+    )
+    s3_client = saritasa_s3_tools.django.get_s3_client(
+        storage=instance.file.storage,
+    )
+    assert s3_client.is_file_in_bucket(key=key)
+    instance.file.delete(save=False)
+    assert not s3_client.is_file_in_bucket(key=key)
+
+
+def test_url_cache(settings: typing.Any) -> None:
+    """Test that urls of files are shared via cache."""
+    settings.SARITASA_S3_TOOLS_CACHE = {"key_prefix": "test-urls"}
+    instance = factories.ModelWithFilesFactory.create()
+    data = serializers.ModelWithFilesSerializer(
+        instance=models.ModelWithFiles.objects.filter(pk=instance.pk),
+        many=True,
+    ).data
+    url_cache = saritasa_s3_tools.django.cache.get_url_cache()
+    assert url_cache
+    assert url_cache.get_many(
+        instance.file.storage,
+        (instance.file.name,),
+    ) == {instance.file.name: data[0]["file"]}
+    assert (
+        serializers.ModelWithFilesSerializer(instance=instance).data["file"]
+        == data[0]["file"]
+    )
@@ -0,0 +1,98 @@
+import io
+import uuid
+
+import pytest
+from django.core.management import CommandError, call_command
+
+import saritasa_s3_tools
+from example.app import factories, models
+from saritasa_s3_tools.django import cleanup
+
+
+@pytest.fixture
+def orphaned_key() -> str:
+    """Upload file of model field's config which no instance references."""
+    config = models.ModelWithFiles._meta.get_field("file").s3_config  # type: ignore
+    return saritasa_s3_tools.django.get_s3_client().upload_file(
+        filename="orphan.txt",
+        config=config,
+        file_obj=io.BytesIO(b"Test"),
+    )
+
+
+def test_delete_orphaned_s3_files(orphaned_key: str) -> None:
+    """Test that only unreferenced files are deleted."""
+    instance = factories.ModelWithFilesFactory.create()
+    s3_client = saritasa_s3_tools.django.get_s3_client()
+    stdout = io.StringIO()
+    call_command(
+        "delete_orphaned_s3_files",
+        "--config=django-files",
+        "--grace-period=0",
+        "--dry-run",
+        stdout=stdout,
+    )
+    assert stdout.getvalue().startswith("django-files: found")
+    assert s3_client.is_file_in_bucket(orphaned_key)
+    call_command(
+        "delete_orphaned_s3_files",
+        "--config=django-files",
+        "--grace-period=0",
+        stdout=io.StringIO(),
+    )
+    assert not s3_client.is_file_in_bucket(orphaned_key)
+    assert instance.file.storage.exists(instance.file.name)
+    assert instance.anon_files.storage.exists(instance.anon_files.name)
+
+
+def test_delete_orphaned_s3_files_grace_period(orphaned_key: str) -> None:
+    """Test that recently uploaded files are kept."""
+    call_command(
+        "delete_orphaned_s3_files",
+        "--config=django-files",
+        stdout=io.StringIO(),
+    )
+    assert saritasa_s3_tools.django.get_s3_client().is_file_in_bucket(
+        orphaned_key,
+    )
+
+
+def test_delete_orphaned_s3_files_unknown_config() -> None:
+    """Test that only configs used by model fields can be cleaned up."""
+    with pytest.raises(CommandError, match="not used by s3 file fields"):
+        call_command("delete_orphaned_s3_files", "--config=unknown")
+
+
+def test_delete_orphaned_s3_files_unordered_names(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that nothing is deleted if database orders names unlike s3."""
+    s3_client = saritasa_s3_tools.django.get_s3_client()
+    folder = f"django-files/{uuid.uuid4()}"
+    # S3 orders keys by bytes, so `B` goes before `a`
+    names = [f"{folder}/B.txt", f"{folder}/a.txt"]
+    for name in names:
+        s3_client.boto3_client.put_object(
+            Bucket=s3_client.default_bucket,
+            Key=name,
+            Body=b"Test",
+        )
+        models.ModelWithFiles.objects.filter(
+            pk=factories.ModelWithFilesFactory.create().pk,
+        ).update(file=name)
+    # Case insensitive collation orders `a` before `B`
+    monkeypatch.setitem(cleanup.binary_collations, "sqlite", "NOCASE")
+    monkeypatch.setattr(
+        saritasa_s3_tools.client,
+        "delete_objects_batch_size",
+        1,
+    )
+    with pytest.raises(CommandError, match="not ordered"):
+        call_command(
+            "delete_orphaned_s3_files",
+            "--config=django-files",
+            "--grace-period=0",
+            stdout=io.StringIO(),
+        )
+    for name in names:
+        assert s3_client.is_file_in_bucket(name)
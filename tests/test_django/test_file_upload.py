@@ -1,5 +1,6 @@
 import collections.abc
 import typing
+import uuid
 
 import pytest
 from django.conf import settings
@@ -10,6 +11,7 @@ from rest_framework.response import Response
 
 import saritasa_s3_tools
 from example.app import factories, models
+from example.app.api import serializers
 
 
 @pytest.mark.parametrize(
@@ -188,3 +190,31 @@ def test_file_validation_non_s3_file(
     )  # type: ignore
     assert response.status_code == status.HTTP_400_BAD_REQUEST, response.data
     assert response.data["file"][0] == "File does not exist."
+
+
+def test_file_validation_many() -> None:
+    """Test that existence of files of many items is checked in bulk."""
+    file = factories.ModelWithFilesFactory.create().file
+    missing_name = f"django-files/{uuid.uuid4()}/file.txt"
+    data = [
+        {"file": file.url},
+        {"file": missing_name},
+        {"file": file.url},
+    ]
+    serializer = serializers.ModelWithFilesSerializer(data=data, many=True)
+    assert list(serializer.get_files(data)) == [  # type: ignore
+        (file.storage, file.name),
+        (file.storage, missing_name),
+        (file.storage, file.name),
+    ]
+    assert not serializer.is_valid()
+    assert serializer.errors == {1: {"file": ["File does not exist."]}}
+
+
+def test_full_clean_many() -> None:
+    """Test that instances are validated with existence checked in bulk."""
+    instances = factories.ModelWithFilesFactory.create_batch(size=2)
+    instances[1].file.storage.delete(instances[1].file.name)
+    errors = saritasa_s3_tools.django.full_clean_many(instances)
+    assert list(errors) == [1]
+    assert errors[1].message_dict == {"file": ["File does not exist."]}
@@ -1,3 +1,5 @@
+import collections.abc
+
 from django.urls import reverse_lazy
 from rest_framework import status, test
 from rest_framework.response import Response
@@ -15,10 +17,12 @@ def test_list_configs(
     response: Response = api_client.get(
         path=reverse_lazy("s3-list-configs"),
     )
-    assert response.status_code == status.HTTP_200_OK, response.data
-    assert len(response.data) == len(
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert len(response.json()) == len(
         saritasa_s3_tools.configs.S3FileTypeConfig.configs.keys(),
     )
+    payloads = saritasa_s3_tools.django.payloads.get_configs_payloads()
+    assert response.content == payloads.configs_list.content
 
 
 def test_list_configs_using_browsable_api(
@@ -34,6 +38,7 @@ def test_list_configs_using_browsable_api(
         },
     )
     assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response.headers
 
 
 def test_retrieve_config(
@@ -53,8 +58,8 @@ def test_retrieve_config(
             },
         ),
     )
-    assert response.status_code == status.HTTP_200_OK, response.data
-    assert response.data["name"] == expected_name, response.data
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.json()["name"] == expected_name, response.content
 
 
 def test_retrieve_unknown_config(
@@ -72,3 +77,57 @@ def test_retrieve_unknown_config(
         ),
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND, response.data
+
+
+def test_list_configs_not_modified(
+    api_client: test.APIClient,
+    default_user: models.User,
+    s3_config_factory: collections.abc.Callable[
+        ...,
+        saritasa_s3_tools.S3FileTypeConfig,
+    ],
+):
+    """Test that configs are not sent again if client has them."""
+    api_client.force_authenticate(default_user)
+    response: Response = api_client.get(
+        path=reverse_lazy("s3-list-configs"),
+    )
+    assert response.status_code == status.HTTP_200_OK, response.content
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "no-cache"
+    response = api_client.get(
+        path=reverse_lazy("s3-list-configs"),
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    s3_config_factory(
+        name="list-configs-etag",
+        key=saritasa_s3_tools.keys.WithPrefixUUIDFolder("list-configs-etag"),
+    )
+    response = api_client.get(
+        path=reverse_lazy("s3-list-configs"),
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.headers["ETag"] != etag
+    assert response.json()[-1]["name"] == "list-configs-etag"
+
+
+def test_list_configs_etag_of_json_only(
+    api_client: test.APIClient,
+    default_user: models.User,
+):
+    """Test that ETag is set only for plain json representation."""
+    api_client.force_authenticate(default_user)
+    response: Response = api_client.get(
+        path=reverse_lazy("s3-list-configs"),
+    )
+    etag = response.headers["ETag"]
+    for accept in ("text/html", "application/json; indent=4"):
+        response = api_client.get(
+            path=reverse_lazy("s3-list-configs"),
+            headers={"Accept": accept, "If-None-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert "ETag" not in response.headers
@@ -1,9 +1,14 @@
+import collections.abc
+import typing
+
 import humanize
 import pytest
 import pytest_lazy_fixtures
+from django.urls import reverse_lazy
 from rest_framework import status, test
 from rest_framework.response import Response
 
+import saritasa_s3_tools
 from example.app import models
 
 
@@ -172,3 +177,56 @@ def test_all_file_sizes_allowed_validation(
         },
     )  # type: ignore
     assert response.status_code == status.HTTP_200_OK, response.data
+
+
+def test_get_params_batch(
+    api_client: test.APIClient,
+    default_user: models.User,
+    s3_config_factory: collections.abc.Callable[
+        ...,
+        saritasa_s3_tools.S3FileTypeConfig,
+    ],
+) -> None:
+    """Test that params for several files can be got in one request."""
+    auth_calls: list[typing.Any] = []
+
+    def auth(user: typing.Any) -> bool:
+        """Record call of auth and allow access."""
+        auth_calls.append(user)
+        return True
+
+    s3_config_factory(
+        name="django-batch-files",
+        key=saritasa_s3_tools.keys.WithPrefixUUIDFolder("django-batch-files"),
+        auth=auth,
+    )
+    api_client.force_authenticate(user=default_user)
+    files = [
+        {
+            "config": "django-batch-files",
+            "filename": f"test-{index}.txt",
+            "content_type": "text/plain",
+            "content_length": 5000,
+        }
+        for index in range(3)
+    ]
+    response: Response = api_client.post(
+        path=reverse_lazy("s3-get-params-batch"),
+        data=files,
+        format="json",
+    )  # type: ignore
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert len(auth_calls) == 1
+    assert [
+        params["params"]["key"].rsplit("/", 1)[-1] for params in response.data
+    ] == [file["filename"] for file in files]
+
+    response = api_client.post(
+        path=reverse_lazy("s3-get-params-batch"),
+        data=[*files, {**files[0], "config": "unknown"}],
+        format="json",
+    )  # type: ignore
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.data
+    assert response.data == {
+        3: {"config": ['"unknown" is not a valid choice.']},
+    }, response.data
@@ -0,0 +1,37 @@
+import pytest
+
+import saritasa_s3_tools
+from example.app import factories, models
+
+
+def test_s3_prefetch() -> None:
+    """Test that metadata of files is prefetched for queryset."""
+    instances = factories.ModelWithFilesFactory.create_batch(size=2)
+    instances[1].file.storage.delete(instances[1].file.name)
+    queryset = models.ModelWithFiles.objects.filter(
+        pk__in=[instance.pk for instance in instances],
+    ).order_by("pk")
+    for instance in queryset:
+        assert not instance.file.is_s3_prefetched
+    first, second = queryset.s3_prefetch("file", "image")
+    assert first.file.is_s3_prefetched
+    assert first.image.is_s3_prefetched
+    assert first.file.exists()
+    assert first.file.size == first.file.s3_metadata["ContentLength"] == 4
+    assert first.image.size == first.image.s3_metadata["ContentLength"]
+    assert second.file.is_s3_prefetched
+    assert not second.file.exists()
+    assert second.image.exists()
+
+
+def test_s3_prefetch_invalid_field() -> None:
+    """Test that only s3 file fields can be prefetched."""
+    factories.ModelWithFilesFactory.create()
+    with pytest.raises(
+        ValueError,
+        match="pk is not S3FileField or S3ImageField",
+    ):
+        saritasa_s3_tools.django.prefetch_s3_metadata(
+            instances=models.ModelWithFiles.objects.all(),
+            fields=("pk",),
+        )
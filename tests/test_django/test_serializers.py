@@ -1,11 +1,15 @@
+import collections.abc
+import dataclasses
 import http
+import typing
 
 import httpx2
 from rest_framework import status, test
 from rest_framework.response import Response
 
 import saritasa_s3_tools.django
-from example.app import models
+from example.app import factories, models
+from example.app.api import serializers
 
 
 def test_s3_upload_field_with_str_value(
@@ -39,3 +43,68 @@ def test_s3_upload_field_with_str_value(
     with httpx2.Client() as client:
         response = client.get(url=signed_file_url)
         assert response.status_code == http.HTTPStatus.OK
+
+
+def test_s3_file_type_config_field_choices(
+    s3_config_factory: collections.abc.Callable[
+        ...,
+        saritasa_s3_tools.S3FileTypeConfig,
+    ],
+) -> None:
+    """Check that choices of config field are updated with registry."""
+    field = saritasa_s3_tools.django.S3FileTypeConfigField()
+    choices = field.choices
+    assert choices is saritasa_s3_tools.django.S3FileTypeConfigField().choices
+    config = s3_config_factory(
+        name="field-choices",
+        key=saritasa_s3_tools.keys.WithPrefixUUIDFolder("field-choices"),
+    )
+    assert field.choices == {
+        **choices,
+        config.name: config.get_short_description(),
+    }
+    assert field.choice_strings_to_values[config.name] == config.name
+
+
+def test_serialize_upload_params(settings: typing.Any) -> None:
+    """Check that upload params are serialized like with serializer."""
+    params = saritasa_s3_tools.client.S3UploadParams(
+        url="https://s3.localhost/bucket",
+        params={
+            "key": "files/test.txt",
+            "success_action_status": 201,  # type: ignore
+            "x-amz-security-token": None,  # type: ignore
+            "unknown": "value",
+        },
+    )
+    assert saritasa_s3_tools.django.serializers.serialize_upload_params(
+        params,
+    ) == (
+        saritasa_s3_tools.django.S3UploadSerializer(
+            instance=dataclasses.asdict(params),
+        ).data
+    )
+    settings.SARITASA_S3_TOOLS_UPLOAD_PARAMS = ("key",)
+    assert saritasa_s3_tools.django.serializers.serialize_upload_params(
+        params,
+    ) == {
+        "url": params.url,
+        "params": {"key": "files/test.txt"},
+    }
+
+
+def test_s3_upload_url_list_serializer() -> None:
+    """Check that urls of files are presigned once for all items."""
+    instance = factories.ModelWithFilesFactory.create()
+    instance_copy = models.ModelWithFiles.objects.get(pk=instance.pk)
+    serializer = serializers.ModelWithFilesSerializer(
+        instance=[instance, instance_copy],
+        many=True,
+    )
+    data = serializer.data
+    assert data[0] == data[1]
+    urls = serializer.context[
+        saritasa_s3_tools.django.drf_fields.s3_upload_urls_context_key
+    ]
+    assert len(urls) == 5
+    assert data[0]["file"].split("?")[0] == instance.file.url.split("?")[0]
@@ -0,0 +1,68 @@
+import typing
+
+import pytest
+from django.core.exceptions import SuspiciousOperation
+from django.core.files.storage import default_storage, storages
+
+import saritasa_s3_tools.django
+
+
+def test_get_s3_client(settings: typing.Any) -> None:
+    """Test that s3 clients of storages are reused till settings change."""
+    s3_client = saritasa_s3_tools.django.get_s3_client()
+    assert saritasa_s3_tools.django.get_s3_client("default") is s3_client
+    assert saritasa_s3_tools.django.get_s3_client(default_storage) is s3_client
+    assert (
+        saritasa_s3_tools.django.get_s3_client(storages["default"])
+        is s3_client
+    )
+    assert s3_client.default_bucket == default_storage.bucket_name  # type: ignore
+    settings.SARITASA_S3_TOOLS_CACHE = {}
+    assert saritasa_s3_tools.django.get_s3_client() is not s3_client
+    assert saritasa_s3_tools.django.get_s3_client().metadata_cache
+
+
+def test_get_storage_alias(settings: typing.Any) -> None:
+    """Test that alias of storage is found."""
+    assert (
+        saritasa_s3_tools.django.get_storage_alias(storages["staticfiles"])
+        == "staticfiles"
+    )
+    assert (
+        saritasa_s3_tools.django.get_storage_alias(
+            storages.create_storage(
+                {"BACKEND": "storages.backends.s3.S3Storage"},
+            ),
+        )
+        is None
+    )
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "media": {"BACKEND": "storages.backends.s3.S3Storage"},
+    }
+    assert (
+        saritasa_s3_tools.django.get_storage_alias(storages["media"])
+        == "media"
+    )
+
+
+def test_get_s3_key() -> None:
+    """Test that key of file is built from location of storage."""
+    storage = storages.create_storage(
+        {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {"location": "media"},
+        },
+    )
+    assert (
+        saritasa_s3_tools.django.shortcuts.get_s3_key(
+            storage=storage,
+            name="files/test.txt",
+        )
+        == "media/files/test.txt"
+    )
+    with pytest.raises(SuspiciousOperation):
+        saritasa_s3_tools.django.shortcuts.get_s3_key(
+            storage=storage,
+            name="../test.txt",
+        )
@@ -0,0 +1,93 @@
+import datetime
+import hashlib
+import time
+
+import pytest
+
+import saritasa_s3_tools
+
+
+def test_shard_key() -> None:
+    """Test key generation and validation of sharded key."""
+    key_generator = saritasa_s3_tools.keys.WithPrefixShardUUIDFolder(
+        "shards",
+    )
+    key = key_generator("test.txt")
+    assert key_generator.validate(key), key
+    prefix, shard, folder, filename = key.split("/")
+    assert prefix == "shards"
+    assert shard == key_generator.get_shard(folder)
+    assert filename == "test.txt"
+    assert f"shards/{shard}/" in key_generator.get_shard_prefixes()
+    wrong_shard = "00" if shard != "00" else "01"
+    assert not key_generator.validate(
+        f"shards/{wrong_shard}/{folder}/{filename}",
+    )
+
+
+def test_shard_prefixes() -> None:
+    """Test that all shard prefixes are generated."""
+    key_generator = saritasa_s3_tools.keys.WithPrefixShardUUIDFolder(
+        "shards",
+        shard_length=1,
+    )
+    assert key_generator.get_shard_prefixes() == [
+        f"shards/{shard}/" for shard in "0123456789abcdef"
+    ]
+
+
+def test_content_hash_key() -> None:
+    """Test that keys of unknown content are not content addresses."""
+    key_generator = saritasa_s3_tools.keys.WithPrefixContentHashFileName(
+        "hashed",
+    )
+    content_hash = hashlib.sha256(b"test").hexdigest()
+    key = key_generator("test.txt", content_hash=content_hash)
+    assert key == f"hashed/{content_hash}.txt"
+    assert key_generator.validate(key)
+    assert key_generator.get_content_hash(key) == content_hash
+
+    unknown_content_key = key_generator("test.txt")
+    assert key_generator.validate(unknown_content_key), unknown_content_key
+    assert key_generator.get_content_hash(unknown_content_key) is None
+    with pytest.raises(ValueError, match="is not sha256 hex digest"):
+        key_generator("test.txt", content_hash="not-a-hash")
+
+
+def test_uuid7_keys() -> None:
+    """Test that time-ordered keys are sorted by time of generation."""
+    for key_generator in (
+        saritasa_s3_tools.keys.WithPrefixUUIDv7FileName("ordered"),
+        saritasa_s3_tools.keys.WithPrefixUUIDv7Folder("ordered"),
+    ):
+        since = datetime.datetime.now(tz=datetime.UTC)
+        keys = []
+        for _ in range(3):
+            keys.append(key_generator("test.txt"))
+            time.sleep(0.002)
+        assert keys == sorted(keys)
+        assert all(map(key_generator.validate, keys)), keys
+        assert key_generator.get_start_after(since) < keys[0]
+        assert (
+            key_generator.get_start_after(
+                since + datetime.timedelta(seconds=1),
+            )
+            > keys[-1]
+        )
+        assert not key_generator.validate(
+            saritasa_s3_tools.keys.WithPrefixUUIDFolder("ordered")("a.txt"),
+        )
+
+
+def test_validate_many() -> None:
+    """Test validation of several keys at once."""
+    key_generator = saritasa_s3_tools.keys.WithPrefixUUIDFileName("many.v1")
+    assert key_generator.validate_many(
+        [
+            key_generator("test.txt"),
+            "many.v1/test.txt",
+            saritasa_s3_tools.keys.WithPrefixUUIDFileName("manyxv1")(
+                "test.txt",
+            ),
+        ],
+    ) == [True, False, False]
@@ -0,0 +1,96 @@
+import concurrent.futures
+import threading
+
+import anyio
+import pytest
+
+import saritasa_s3_tools
+from saritasa_s3_tools.async_client import single_flight
+
+
+def test_single_flight() -> None:
+    """Test that concurrent calls with same key are merged."""
+    flight = saritasa_s3_tools.single_flight.SingleFlight[int]()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def _func() -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait()
+        return calls
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        first = executor.submit(flight.run, "key", _func)
+        started.wait()
+        others = [executor.submit(flight.run, "key", _func) for _ in range(4)]
+        release.set()
+        results = [first.result(), *(future.result() for future in others)]
+    assert calls == 1
+    assert results == [1] * 5
+    # Once call is finished, next call runs function again
+    assert flight.run("key", _func) == 2
+
+
+def test_single_flight_error() -> None:
+    """Test that error of call is raised for all callers."""
+    flight = saritasa_s3_tools.single_flight.SingleFlight[int]()
+
+    def _func() -> int:
+        raise ValueError("Failed")
+
+    with pytest.raises(ValueError, match="Failed"):
+        flight.run("key", _func)
+    assert flight.run("key", lambda: 1) == 1
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_async_single_flight() -> None:
+    """Test that concurrent tasks with same key are merged."""
+    flight = single_flight.AsyncSingleFlight[int]()
+    calls = 0
+    results: list[int] = []
+
+    async def _func() -> int:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.01)
+        return calls
+
+    async def _run() -> None:
+        results.append(await flight.run("key", _func))
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(5):
+            task_group.start_soon(_run)
+    assert calls == 1
+    assert results == [1] * 5
+
+
+@pytest.mark.usefixtures("anyio_backend")
+async def test_async_single_flight_cancelled() -> None:
+    """Test that waiters repeat call if first caller was cancelled."""
+    flight = single_flight.AsyncSingleFlight[int]()
+    calls = 0
+    results: list[int] = []
+
+    async def _func() -> int:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.05)
+        return calls
+
+    async def _run() -> None:
+        results.append(await flight.run("key", _func))
+
+    async def _run_cancelled() -> None:
+        with anyio.move_on_after(0.01):
+            await flight.run("key", _func)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(_run_cancelled)
+        task_group.start_soon(_run)
+    assert calls == 2
+    assert results == [2]
@@ -0,0 +1,126 @@
+import pathlib
+import uuid
+
+import boto3.s3.transfer
+
+import saritasa_s3_tools
+
+
+def test_sync_directory_and_prefix(
+    s3_client: saritasa_s3_tools.S3Client,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test sync between local directory and s3 prefix."""
+    prefix = f"sync/{uuid.uuid4()}"
+    source = tmp_path / "source"
+    (source / "nested").mkdir(parents=True)
+    (source / "file.txt").write_text("file")
+    (source / "nested" / "nested.txt").write_text("nested")
+    (source / "removed.txt").write_text("removed")
+
+    result = s3_client.sync_directory(local_path=source, prefix=prefix)
+    assert sorted(result.transferred) == [
+        f"{prefix}/file.txt",
+        f"{prefix}/nested/nested.txt",
+        f"{prefix}/removed.txt",
+    ]
+
+    (source / "file.txt").write_text("changed")
+    (source / "removed.txt").unlink()
+    result = s3_client.sync_directory(
+        local_path=source,
+        prefix=prefix,
+        delete=True,
+    )
+    assert result.transferred == [f"{prefix}/file.txt"]
+    assert result.skipped == [f"{prefix}/nested/nested.txt"]
+    assert result.deleted == [f"{prefix}/removed.txt"]
+
+    target = tmp_path / "target"
+    (target / "extra.txt").parent.mkdir()
+    (target / "extra.txt").write_text("extra")
+    result = s3_client.sync_prefix(
+        prefix=prefix,
+        local_path=target,
+        delete=True,
+    )
+    assert sorted(result.transferred) == ["file.txt", "nested/nested.txt"]
+    assert result.deleted == ["extra.txt"]
+    assert (target / "file.txt").read_text() == "changed"
+    assert (target / "nested" / "nested.txt").read_text() == "nested"
+
+    result = s3_client.sync_prefix(prefix=prefix, local_path=target)
+    assert not result.transferred
+    assert sorted(result.skipped) == ["file.txt", "nested/nested.txt"]
+
+
+def test_sync_multipart_etag(
+    s3_client: saritasa_s3_tools.S3Client,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test that multipart ETag is computed same way as s3 does."""
+    prefix = f"sync/{uuid.uuid4()}"
+    transfer_config = boto3.s3.transfer.TransferConfig(
+        multipart_threshold=5 * 1024 * 1024,
+        multipart_chunksize=5 * 1024 * 1024,
+    )
+    path = tmp_path / "large.bin"
+    path.write_bytes(b"1" * 11 * 1024 * 1024)
+    s3_client.sync_directory(
+        local_path=tmp_path,
+        prefix=prefix,
+        transfer_config=transfer_config,
+    )
+    etag = s3_client.get_file_metadata(key=f"{prefix}/large.bin")["ETag"]
+    assert etag.endswith('-3"')
+    assert (
+        saritasa_s3_tools.sync.compute_etag(
+            path=path,
+            transfer_config=transfer_config,
+        )
+        == etag
+    )
+
+
+def test_sync_listing_order(
+    s3_client: saritasa_s3_tools.S3Client,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test that local files are merged with listing in s3 order."""
+    prefix = f"sync/{uuid.uuid4()}"
+    source = tmp_path / "source"
+    for relative_path in ("ab", "a/b", "a.txt", "a-c"):
+        (source / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (source / relative_path).write_text(relative_path)
+    assert [
+        relative_path
+        for relative_path, _ in saritasa_s3_tools.sync.iter_local_files(
+            source,
+        )
+    ] == ["a-c", "a.txt", "a/b", "ab"]
+
+    s3_client.sync_directory(local_path=source, prefix=prefix)
+    result = s3_client.sync_directory(
+        local_path=source,
+        prefix=prefix,
+        delete=True,
+    )
+    assert not result.transferred
+    assert not result.deleted
+    assert len(result.skipped) == 4
+
+    target = tmp_path / "target"
+    result = s3_client.sync_prefix(
+        prefix=prefix,
+        local_path=target,
+        delete=True,
+    )
+    assert sorted(result.transferred) == ["a-c", "a.txt", "a/b", "ab"]
+    assert not result.deleted
+    result = s3_client.sync_prefix(
+        prefix=prefix,
+        local_path=target,
+        delete=True,
+    )
+    assert not result.transferred
+    assert not result.deleted